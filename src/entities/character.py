@@ -3,19 +3,30 @@ import math
 import pygame
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, List
+from typing import Any, Optional, List, Set, Tuple
 
 from src.entities.entity import Entity, Shape, RectangleShape, CircleShape
 from src.entities.modifier import Modifier
+from src.entities.stat import Stat, update_stats
 from src.game.animation import Animation
+from src.game.component_store import Component
 from src.game.entity_manager import EntityManager
+from src.game.render_queue import RenderLayer, RenderQueue
 
 
 class Character(Entity, ABC):
     """
     Базовый класс для живых персонажей.
-    Хранит базовые характеристики и списки модификаторов для каждой из них.
+    Хранит характеристики (Stat) с модификаторами; итог каждой
+    закэширован и пересчитывается только при изменении модификаторов.
     """
+    __slots__ = (
+        '_health', '_max_health', '_speed', '_attack', '_attack_range', '_defense', '_velocity',
+        '_vision_range', '_can_collect', '_is_alive', '_vision_angle', '_hearing_modifiers',
+        '_timed_stats', '_animation',
+    )
+
+    COMPONENTS: Component = Entity.COMPONENTS | Component.HEALTH
 
     def __init__(
         self,
@@ -42,24 +53,21 @@ class Character(Entity, ABC):
 
         # базовые значения
         self._health: float = health
-        self._max_health: float = max_health
-        self._speed: float = speed
-        self._attack: float = attack
+        self._max_health: Stat = Stat(max_health)
+        self._speed: Stat = Stat(speed)
+        self._attack: Stat = Stat(attack)
         self._attack_range: float = attack_range
-        self._defense: float = defense
+        self._defense: Stat = Stat(defense)
         self._velocity: pygame.Vector2 = pygame.Vector2(0.0, 0.0)
-        self._vision_range: float = vision_range
+        self._vision_range: Stat = Stat(vision_range)
         self._can_collect: bool = can_collect
         self._is_alive: bool = True
         self._vision_angle: float = vision_angle
 
-        # списки модификаторов
-        self._max_health_modifiers: List[Modifier] = []
-        self._speed_modifiers:      List[Modifier] = []
-        self._attack_modifiers:     List[Modifier] = []
-        self._defense_modifiers:    List[Modifier] = []
-        self._vision_modifiers:     List[Modifier] = []
-        self._hearing_modifiers:    List[Modifier] = []
+        # контейнеры создаются при первом модификаторе
+        self._hearing_modifiers: Optional[List[Modifier]] = None
+        # характеристики, у которых есть временные модификаторы
+        self._timed_stats: Optional[Set[Stat]] = None
         self._animation: Animation = animation
 
     @property
@@ -75,23 +83,23 @@ class Character(Entity, ABC):
 
     @property
     def max_health(self) -> float:
-        return self._max_health + sum(m.value for m in self._max_health_modifiers)
+        return self._max_health.value
 
     @property
     def speed(self) -> float:
-        return self._speed + sum(m.value for m in self._speed_modifiers)
+        return self._speed.value
 
     @property
     def attack(self) -> float:
-        return self._attack + sum(m.value for m in self._attack_modifiers)
+        return self._attack.value
 
     @property
     def defense(self) -> float:
-        return self._defense + sum(m.value for m in self._defense_modifiers)
+        return self._defense.value
 
     @property
     def vision_range(self) -> float:
-        return self._vision_range + sum(m.value for m in self._vision_modifiers)
+        return self._vision_range.value
 
     @property
     def can_collect(self) -> bool:
@@ -155,55 +163,90 @@ class Character(Entity, ABC):
     def take_damage(self, amount: float) -> None:
         """Уменьшает здоровье с учётом текущей защиты."""
         damage = max(0.0, amount - self.defense)
-        self._health = max(0.0, self._health - damage)
-        if self._health == 0.0:
-            self._is_alive = False
+        self._set_health(max(0.0, self._health - damage))
 
     def heal(self, amount: float) -> None:
         """Восстанавливает здоровье, но не больше текущего максимума."""
-        self._health = min(self.max_health, self._health + amount)
+        self._set_health(min(self.max_health, self._health + amount))
 
     # методы для управления модификаторами
     def add_max_health_modifier(self, mod: Modifier) -> None:
-        self._max_health_modifiers.append(mod)
-        self._health = min(self.max_health, self._health)
+        self._add_modifier(self._max_health, mod)
+        self._set_health(min(self.max_health, self._health))
 
     def remove_max_health_modifier(self, mod: Modifier) -> None:
-        self._max_health_modifiers.remove(mod)
-        self._health = min(self.max_health, self._health)
+        self._max_health.remove(mod)
+        self._set_health(min(self.max_health, self._health))
 
     def add_speed_modifier(self, mod: Modifier) -> None:
-        self._speed_modifiers.append(mod)
+        self._add_modifier(self._speed, mod)
     def remove_speed_modifier(self, mod: Modifier) -> None:
-        self._speed_modifiers.remove(mod)
+        self._speed.remove(mod)
 
     def add_attack_modifier(self, mod: Modifier) -> None:
-        self._attack_modifiers.append(mod)
+        self._add_modifier(self._attack, mod)
     def remove_attack_modifier(self, mod: Modifier) -> None:
-        self._attack_modifiers.remove(mod)
+        self._attack.remove(mod)
+
+    @property
+    def attack_modifiers(self) -> Tuple[Modifier, ...]:
+        return self._attack.modifiers
 
     def add_defense_modifier(self, mod: Modifier) -> None:
-        self._defense_modifiers.append(mod)
+        self._add_modifier(self._defense, mod)
     def remove_defense_modifier(self, mod: Modifier) -> None:
-        self._defense_modifiers.remove(mod)
+        self._defense.remove(mod)
+
+    @property
+    def defense_modifiers(self) -> Tuple[Modifier, ...]:
+        return self._defense.modifiers
 
     def add_vision_modifier(self, mod: Modifier) -> None:
-        self._vision_modifiers.append(mod)
+        self._add_modifier(self._vision_range, mod)
     def remove_vision_modifier(self, mod: Modifier) -> None:
-        self._vision_modifiers.remove(mod)
+        self._vision_range.remove(mod)
 
     def add_hearing_modifier(self, mod: Modifier) -> None:
+        if self._hearing_modifiers is None:
+            self._hearing_modifiers = []
         self._hearing_modifiers.append(mod)
     def remove_hearing_modifier(self, mod: Modifier) -> None:
+        if self._hearing_modifiers is None:
+            raise ValueError("Модификатор не найден")
         self._hearing_modifiers.remove(mod)
 
     def update(self, delta_time: float) -> None:
         """
         Обновляет позицию персонажа на основе вектора скорости.
         """
+        self.update_modifiers(delta_time)
         self._apply_movement(delta_time)
 
-    def render(self, surface: pygame.Surface) -> None:
+    def update_modifiers(self, delta_time: float) -> None:
+        """Снимает истёкшие временные модификаторы; без них ничего не делает."""
+        if self._timed_stats and update_stats(self._timed_stats, delta_time):
+            self._set_health(min(self.max_health, self._health))
+
+    def _set_health(self, value: float) -> None:
+        """Меняет здоровье; при смерти сообщает EntityManager."""
+        self._health = value
+        if value == 0.0 and self._is_alive:
+            self._is_alive = False
+            self._entity_manager.on_entity_died(self)
+
+    def _add_modifier(self, stat: Stat, mod: Modifier) -> None:
+        stat.add(mod)
+        if mod.duration is not None:
+            if self._timed_stats is None:
+                self._timed_stats = set()
+            self._timed_stats.add(stat)
+
+    @property
+    def render_layer(self) -> RenderLayer:
+        """Живые персонажи рисуются поверх пуль и предметов, мёртвые — под ними."""
+        return RenderLayer.ACTORS if self.is_alive else RenderLayer.CORPSES
+
+    def submit(self, queue: RenderQueue, offset: Tuple[float, float] = (0.0, 0.0)) -> None:
         """
         Рисует отладочный контур формы персонажа.
         """
@@ -2,10 +2,13 @@ from enum import Enum
 from typing import List, Optional, Tuple, Any, Dict
 import math
 
-from npc import NPC, Attitude, DecisionModule
-from item import Item
-from character import Character
+from src.entities.npc import NPC, Attitude, DecisionModule
+from src.entities.item import Item
+from src.entities.character import Character
 from src.entities.player import Player
+from src.game.component_store import Component
+from src.game.entity_manager import EntityManager
+from src.game.render_queue import RenderQueue
 
 
 class DroneBehavior(Enum):
@@ -14,6 +17,7 @@ class DroneBehavior(Enum):
     COLLECT = "collect"
     WAIT = "wait"
 
+
 class Drone(NPC):
     """
     Дрон — сопровождение NPC с инвентарём и переключаемым поведением.
@@ -24,9 +28,11 @@ class Drone(NPC):
         COLLECT  — собирать указанный предмет
         WAIT     — оставаться на месте
     """
+    __slots__ = ('_inventory', '_behavior')
 
     def __init__(
         self,
+        entity_manager: 'EntityManager',
         entity_id: int,
         x: float,
         y: float,
@@ -36,7 +42,6 @@ class Drone(NPC):
         attack: float,
         defense: float,
         vision_range: float,
-        hearing_range: float,
         name: str,
         attitude: Attitude,
         decision_module: DecisionModule,
@@ -47,6 +52,7 @@ class Drone(NPC):
         shape: Optional[Any] = None
     ) -> None:
         super().__init__(
+            entity_manager=entity_manager,
             entity_id=entity_id,
             x=x,
             y=y,
@@ -56,7 +62,6 @@ class Drone(NPC):
             attack=attack,
             defense=defense,
             vision_range=vision_range,
-            hearing_range=hearing_range,
             name=name,
             attitude=attitude,
             decision_module=decision_module,
@@ -144,16 +149,17 @@ class Drone(NPC):
         elif self._behavior == DroneBehavior.FOLLOW:
             # логика следования за владельцем
             pass
-        elif self._behavior == DroneBehavior.COLLECT:
+        # без предметов на уровне собирать нечего — восприятие не нужно
+        elif self._behavior == DroneBehavior.COLLECT and self._entity_manager.items:
             # находим первый доступный предмет
             perceptions: Dict[str, List[Any]] = self.perceive()
             items = [e for e in perceptions.get('visible', [])
-                     if isinstance(e, Item) and e.collectable and e.active]
+                     if e.components & Component.PICKUP and e.collectable and e.active]
             if items:
                 self.collect(items[0], delta_time)
         # WAIT — просто остаёмся на месте
 
-    def render(self, surface: Any) -> None:
+    def submit(self, queue: RenderQueue, offset: Tuple[float, float] = (0.0, 0.0)) -> None:
         """Отрисовать дрона на экране."""
-        super().render(surface)
+        super().submit(queue, offset)
         # опционально: отображение индикатора поведения
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Tuple, Any, Optional, TYPE_CHECKING
 
+from src.game.component_store import Archetype, Component
+from src.game.render_queue import RenderLayer, RenderQueue
 
 if TYPE_CHECKING:
     from src.game.entity_manager import EntityManager
@@ -11,6 +13,7 @@ class Shape(ABC):
     Абстрактный класс для формы объекта.
     Прописывает методы для получения ограничивающего прямоугольника и проверки пересечения.
     """
+    __slots__ = ()
 
     @abstractmethod
     def get_bounding_box(self) -> Tuple[float, float, float, float]:
@@ -32,6 +35,8 @@ class RectangleShape(Shape):
     Прямоугольная форма объекта.
     Поддерживает проверку пересечений с прямоугольником и кругом.
     """
+    __slots__ = ('_x', '_y', '_width', '_height')
+
     def __init__(self, x: float, y: float, width: float, height: float) -> None:
         self._x: float = x
         self._y: float = y
@@ -121,6 +126,8 @@ class CircleShape(Shape):
     Круглая форма объекта.
     Поддерживает проверку пересечения с кругом и прямоугольником.
     """
+    __slots__ = ('_center_x', '_center_y', '_radius')
+
     def __init__(self, center_x: float, center_y: float, radius: float) -> None:
         self._center_x: float = center_x
         self._center_y: float = center_y
@@ -176,6 +183,13 @@ class Entity(ABC):
     Хранит идентификатор, положение, угол поворота, состояние активности,
     возможность сбора, картинку и форму (shape).
     """
+    __slots__ = (
+        '_entity_manager', '_id', '_position', '_angle', '_active', '_collectable', '_picture',
+        '_is_solid', '_is_static', '_screen_rect', '_shape', '_archetype', '_row',
+    )
+
+    # компоненты ECS, которыми обладает сущность этого класса
+    COMPONENTS: Component = Component.POSITION
 
     def __init__(
         self,
@@ -187,7 +201,8 @@ class Entity(ABC):
         collectable: bool = False,
         picture: Optional[Any] = None,
         shape: Optional[Shape] = None,
-        is_solid: bool = False
+        is_solid: bool = False,
+        is_static: bool = False
     ) -> None:
         self._entity_manager: 'EntityManager' = entity_manager
         self._id: int = entity_id
@@ -197,16 +212,20 @@ class Entity(ABC):
         self._collectable: bool = collectable
         self._picture: Optional[Any] = picture
         self._is_solid: bool = is_solid
+        # статичные объекты (элементы карты) не двигаются сами по себе
+        self._is_static: bool = is_static
+        # область экрана, занятая при последней отрисовке (для dirty-rect)
+        self._screen_rect: Optional[Any] = None
+        # архетип и строка в хранилище компонентов (пока сущность не в менеджере — None)
+        self._archetype: Optional[Archetype] = None
+        self._row: int = -1
 
         if shape is None:
             self._shape: Shape = RectangleShape(x, y, 0.0, 0.0)
         else:
             self._shape = shape
             # Синхронизируем позицию формы
-            if isinstance(self._shape, RectangleShape):
-                self._shape.x, self._shape.y = self._position
-            elif isinstance(self._shape, CircleShape):
-                self._shape.center_x, self._shape.center_y = self._position
+            self.sync_shape(self._position)
 
     @property
     def id(self) -> int:
@@ -223,10 +242,20 @@ class Entity(ABC):
     @position.setter
     def position(self, value: Tuple[float, float]) -> None:
         self._position = value
+        self.sync_shape(value)
+        # сообщаем менеджеру, чтобы он обновил пространственную сетку
+        if self._entity_manager is not None:
+            self._entity_manager.on_entity_moved(self)
+
+    def sync_shape(self, position: Tuple[float, float]) -> None:
+        """
+        Переносит форму в точку ``position``, не меняя позицию сущности.
+        Используется и для пробных перемещений при проверке столкновений.
+        """
         if isinstance(self._shape, RectangleShape):
-            self._shape.x, self._shape.y = value
+            self._shape.x, self._shape.y = position
         elif isinstance(self._shape, CircleShape):
-            self._shape.center_x, self._shape.center_y = value
+            self._shape.center_x, self._shape.center_y = position
 
     @property
     def angle(self) -> float:
@@ -267,6 +296,36 @@ class Entity(ABC):
     @is_solid.setter
     def is_solid(self, value: bool) -> None:
         self._is_solid = value
+        if self._entity_manager is not None:
+            self._entity_manager.on_solidity_changed(self)
+
+    @property
+    def is_static(self) -> bool:
+        """Статичный объект карты: его изменения сбрасывают кэш видимости."""
+        return self._is_static
+
+    @property
+    def components(self) -> Component:
+        return self.COMPONENTS
+
+    @property
+    def archetype(self) -> Optional[Archetype]:
+        """Архетип хранилища компонентов, в котором лежат данные сущности."""
+        return self._archetype
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    def attach(self, archetype: Optional[Archetype], row: int) -> None:
+        """Вызывается хранилищем компонентов при добавлении, удалении и переносе строки."""
+        self._archetype = archetype
+        self._row = row
+
+    @property
+    def screen_rect(self) -> Optional[Any]:
+        """pygame.Rect, занятый сущностью при последней отрисовке, либо None."""
+        return self._screen_rect
 
     def collides_with(self, other: 'Entity') -> bool:
         """
@@ -281,6 +340,24 @@ class Entity(ABC):
     def update(self, delta_time: float) -> None:
         ...
 
+    @property
+    def render_layer(self) -> RenderLayer:
+        """Слой очереди отрисовки, в который попадает сущность."""
+        return RenderLayer.ITEMS
+
+    def render(self, surface: Any, offset: Tuple[float, float] = (0.0, 0.0)) -> None:
+        """
+        Рисует сущность сразу, в обход общей очереди кадра
+        (например, при запекании в фон).
+        """
+        queue: RenderQueue = RenderQueue()
+        self.submit(queue, offset)
+        queue.flush(surface)
+
     @abstractmethod
-    def render(self, surface: Any) -> None:
+    def submit(self, queue: RenderQueue, offset: Tuple[float, float] = (0.0, 0.0)) -> None:
+        """
+        Отправляет команды отрисовки в очередь кадра;
+        ``offset`` — мировые координаты левого верхнего угла экрана.
+        """
         ...
@@ -1,17 +1,22 @@
 from abc import ABC
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 import pygame
 
 from src.entities.character import Character
 from src.entities.entity import Entity, Shape, RectangleShape, CircleShape
 from src.game.entity_manager import EntityManager
+from src.game.component_store import Component
+from src.game.render_queue import RenderQueue
 
 
 class Item(Entity, ABC):
     """
     Базовый класс для предметов, которые можно подбирать.
     """
+    __slots__ = ('_name', '_description', '_stackable', '_quantity')
+
+    COMPONENTS: Component = Entity.COMPONENTS | Component.PICKUP
 
     def __init__(
         self,
@@ -82,7 +87,7 @@ class Item(Entity, ABC):
         """
         pass
 
-    def render(self, surface: Any) -> None:
+    def submit(self, queue: RenderQueue, offset: Tuple[float, float] = (0.0, 0.0)) -> None:
         """
         Отрисовка предмета на поверхности.
         """
@@ -98,5 +103,8 @@ class Item(Entity, ABC):
 
         if self.picture:
             # предполагаем, что picture — pygame.Surface
-            rect: pygame.Rect = self.picture.get_rect(center=self.position)
-            surface.blit(self.picture, rect)
+            rect: pygame.Rect = self.picture.get_rect(
+                center=(self.position[0] - offset[0], self.position[1] - offset[1])
+            )
+            queue.submit(self.render_layer, self.picture, rect)
+            self._screen_rect = rect
@@ -1,12 +1,16 @@
-from typing import Optional, Any
+from typing import Optional, Any, Tuple
 
 import pygame
 
 from src.entities.entity import Entity, Shape, RectangleShape, CircleShape
 from src.game.entity_manager import EntityManager
+from src.game import sprite_cache
+from src.game.render_queue import RenderLayer, RenderQueue
 
 
 class MapEntity(Entity):
+    __slots__ = ()
+
     def __init__(self,
                  entity_manager: 'EntityManager',
                  entity_id: int,
@@ -15,9 +19,14 @@ class MapEntity(Entity):
                  angle: float = 0.0,
                  picture: Optional[Any] = None,
                  shape: Optional[Shape] = None):
-        super().__init__(entity_manager, entity_id, x, y, angle, False, picture, shape, is_solid=True)
+        super().__init__(entity_manager, entity_id, x, y, angle, False, picture, shape,
+                         is_solid=True, is_static=True)
+
+    @property
+    def render_layer(self) -> RenderLayer:
+        return RenderLayer.GROUND
 
-    def render(self, surface: Any) -> None:
+    def submit(self, queue: RenderQueue, offset: Tuple[float, float] = (0.0, 0.0)) -> None:
         """
         Рисует отладочный контур
         """
@@ -38,9 +47,12 @@ class MapEntity(Entity):
 
         if sprite is not None:
             # В pygame положительные углы — против часовой стрелки, поэтому берём «-angle»
-            rotated_sprite: pygame.Surface = pygame.transform.rotate(sprite, -self.angle)
-            rect: pygame.Rect = rotated_sprite.get_rect(center=(self.position[0], self.position[1]))
-            surface.blit(rotated_sprite, rect.topleft)
+            rotated_sprite: pygame.Surface = sprite_cache.rotate(sprite, -self.angle)
+            rect: pygame.Rect = rotated_sprite.get_rect(
+                center=(self.position[0] - offset[0], self.position[1] - offset[1])
+            )
+            queue.submit(self.render_layer, rotated_sprite, rect)
+            self._screen_rect = rect
 
     def update(self, delta_time: float) -> None:
         pass
\ No newline at end of file
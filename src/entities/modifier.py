@@ -1,14 +1,37 @@
+from enum import Enum
+from typing import Optional
+
 from src.entities.entity import Entity
 
+
+class ModifierKind(Enum):
+    """Как модификатор влияет на характеристику."""
+    FLAT = "flat"          # прибавляется к базовому значению
+    PERCENT = "percent"    # +value % к сумме базового значения и FLAT-бонусов
+    MULTIPLY = "multiply"  # итог умножается на value
+
+
 class Modifier:
     """
     Описывает изменение характеристики:
     - value: величина бонуса/штрафа
     - source: сущность, вызвавшая модификатор
+    - kind: способ применения (по умолчанию — прибавка)
+    - duration: время действия в секундах; None — пока не снимут
     """
-    def __init__(self, value: float, source: Entity) -> None:
+    __slots__ = ('_value', '_source', '_kind', '_duration')
+
+    def __init__(
+        self,
+        value: float,
+        source: Entity,
+        kind: ModifierKind = ModifierKind.FLAT,
+        duration: Optional[float] = None
+    ) -> None:
         self._value: float = value
         self._source: Entity = source
+        self._kind: ModifierKind = kind
+        self._duration: Optional[float] = duration
 
     @property
     def value(self) -> float:
@@ -17,3 +40,11 @@ class Modifier:
     @property
     def source(self) -> Entity:
         return self._source
+
+    @property
+    def kind(self) -> ModifierKind:
+        return self._kind
+
+    @property
+    def duration(self) -> Optional[float]:
+        return self._duration
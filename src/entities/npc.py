@@ -9,6 +9,12 @@ from src.entities.character import Character
 from src.entities.entity import Entity, CircleShape, RectangleShape, Shape
 from src.entities.player import Player
 from src.game.entity_manager import EntityManager
+from src.game import sprite_cache
+from src.game.component_store import Component
+from src.game.health_bar_atlas import health_bars
+from src.game.render_queue import RenderLayer, RenderQueue
+from src.settings import HEALTH_BAR_HIDE_FULL
+from src.utils.geometry import segment_shape_entry
 
 
 class Attitude(Enum):
@@ -85,6 +91,16 @@ class NPC(Character):
     """
     Неписи (NPC) с именем, отношением, модулем ИИ и маршрутом патрулирования.
     """
+    __slots__ = (
+        '_name', '_attitude', '_decision_module', '_route', '_current_waypoint_index',
+        '_route_goal', '_game_state', '_picture_alive', '_picture_dead', '_attack_rate',
+        '_attack_timer', '_able_to_attack', '_decision_timer', '_decision_due', '_perceptions',
+        '_last_perceptions',
+    )
+
+    COMPONENTS: Component = Character.COMPONENTS | Component.AI
+
+    _WAYPOINT_RADIUS: float = 2.0          # промежуточная точка считается достигнутой
     def __init__(
         self,
         entity_manager: 'EntityManager',
@@ -128,6 +144,8 @@ class NPC(Character):
         self._decision_module: DecisionModule = decision_module
         self._route: List[Tuple[float, float]] = route or []
         self._current_waypoint_index: int = 0
+        # цель, под которую построен текущий маршрут (None — маршрут прямой)
+        self._route_goal: Optional[Tuple[float, float]] = None
         # Ссылка на текущее состояние мира для восприятия
         self._game_state: Optional[Any] = None
         self._picture_alive: Optional[Any] = picture_alive
@@ -135,7 +153,14 @@ class NPC(Character):
         self._attack_rate: float = attack_rate
         self._attack_timer: float = 0
         self._able_to_attack: bool = True
+        # кадров до следующего решения (ведёт AIScheduler)
         self._decision_timer: float = 0
+        # принимать ли решение в ближайшем update(); без планировщика — всегда
+        self._decision_due: bool = True
+        # результат пакетного восприятия на текущий кадр (PerceptionSystem)
+        self._perceptions: Optional[Dict[str, List['Entity']]] = None
+        # восприятие последнего решения — для кадров без решения
+        self._last_perceptions: Dict[str, List['Entity']] = {'visible': []}
 
     @property
     def name(self) -> str:
@@ -147,6 +172,16 @@ class NPC(Character):
         """Отношение NPC к игроку/миру."""
         return self._attitude
 
+    @attitude.setter
+    def attitude(self, attitude: Attitude) -> None:
+        was_hostile: bool = self.is_hostile
+        self._attitude = attitude
+        self._entity_manager.on_attitude_changed(self, was_hostile)
+
+    @property
+    def is_hostile(self) -> bool:
+        return self._attitude == Attitude.HOSTILE
+
     @property
     def decision_module(self) -> DecisionModule:
         """Модуль принятия решений."""
@@ -163,6 +198,38 @@ class NPC(Character):
         """
         self._game_state = game_state
 
+    @property
+    def decision_timer(self) -> float:
+        """Сколько кадров осталось до следующего решения ИИ."""
+        return self._decision_timer
+
+    @decision_timer.setter
+    def decision_timer(self, value: float) -> None:
+        self._decision_timer = value
+
+    def set_decision_due(self, due: bool) -> None:
+        """
+        Разрешает или пропускает принятие решения в ближайшем update().
+        Флаг действует один кадр, затем снова становится True.
+        """
+        self._decision_due = due
+
+    def set_perceptions(self, perceptions: Dict[str, List['Entity']]) -> None:
+        """
+        Передаёт NPC заранее посчитанное восприятие на текущий кадр.
+        Используется один раз: следующий update() без нового результата
+        снова вызовет perceive().
+        """
+        self._perceptions = perceptions
+
+    def _in_vision_cone(self, dx: float, dy: float, dist: float) -> bool:
+        """Лежит ли направление (dx, dy) внутри конуса обзора ``vision_angle``."""
+        half_cone: float = math.radians(self.vision_angle / 2.0)
+        if half_cone >= math.pi or dist == 0.0:
+            return True
+        along: float = dx * math.cos(self.angle) + dy * math.sin(self.angle)
+        return along >= math.cos(half_cone) * dist
+
     def _segment_intersects_shape(
             self,
             start: Tuple[float, float],
@@ -173,88 +240,54 @@ class NPC(Character):
         Возвращает ``True``, если отрезок (start-end) пересекает ``shape``.
         Поддерживаются ``RectangleShape`` и ``CircleShape``.
         """
-        sx, sy = start
-        ex, ey = end
-
-        if isinstance(shape, RectangleShape):
-            min_x, min_y, w, h = shape.get_bounding_box()
-            max_x: float = min_x + w
-            max_y: float = min_y + h
-
-            dx: float = ex - sx
-            dy: float = ey - sy
-            t_enter: float = 0.0
-            t_exit: float = 1.0
-
-            for p, q1, q2 in (
-                    (-dx, sx - min_x, sx - max_x),
-                    (dx, max_x - sx, min_x - sx),
-                    (-dy, sy - min_y, sy - max_y),
-                    (dy, max_y - sy, min_y - sy),
-            ):
-                if p == 0.0:
-                    if q1 < 0.0:
-                        return False  # параллельно и вне прямоугольника
-                    continue
-                t0: float = q1 / p
-                t1: float = q2 / p
-                t_enter = max(t_enter, min(t0, t1))
-                t_exit = min(t_exit, max(t0, t1))
-                if t_enter > t_exit:
-                    return False
-            return True
-
-        if isinstance(shape, CircleShape):
-            dx: float = ex - sx
-            dy: float = ey - sy
-            fx: float = sx - shape.center_x
-            fy: float = sy - shape.center_y
-
-            a: float = dx * dx + dy * dy
-            b: float = 2 * (fx * dx + fy * dy)
-            c: float = fx * fx + fy * fy - (shape.radius * shape.radius)
-            discriminant: float = b * b - 4 * a * c
-            if discriminant < 0.0:
-                return False
-            if a ==0.0:
-                return False
-            discriminant = math.sqrt(discriminant)
-            t1: float = (-b - discriminant) / (2 * a)
-            t2: float = (-b + discriminant) / (2 * a)
-            return (0.0 <= t1 <= 1.0) or (0.0 <= t2 <= 1.0)
-
-        return False
+        return segment_shape_entry(start, end, shape) is not None
 
     def perceive(self) -> Dict[str, List['Entity']]:
         """
         Составляет список видимых и слышимых объектов вокруг NPC,
         учитывая препятствия (is_solid) между NPC и целью.
+        Статичные препятствия проверяются через кэш видимости
+        EntityManager.line_of_sight, подвижные — напрямую.
         """
         visible: List['Entity'] = []
 
-        entities: List['Entity'] = self._entity_manager.all_entities
+        sx, sy = self.position
+        vision_range: float = self.vision_range
+        line_of_sight = self._entity_manager.line_of_sight
+
+        # кандидаты — только сущности из ячеек в радиусе обзора
+        entities: List['Entity'] = self._entity_manager.query_radius((sx, sy), vision_range)
         if not entities:
             return {'visible': visible}
 
-        sx, sy = self.position
-
         for entity in entities:
             if entity is self or not entity.active:
                 continue
 
             ex, ey = entity.position
             dist: float = math.hypot(ex - sx, ey - sy)
-            if dist > self.vision_range:
+            if dist > vision_range:
+                continue
+            if not self._in_vision_cone(ex - sx, ey - sy, dist):
+                continue
+
+            # --- статичные препятствия: кэш по квантованным ячейкам ---
+            # (сам статичный объект не должен заслонять себя, поэтому
+            #  для таких целей кэш не используется)
+            use_cache: bool = not entity.is_static
+            if use_cache and not line_of_sight.is_clear((sx, sy), (ex, ey)):
                 continue
 
-            # --- проверяем, нет ли твёрдых объектов на линии взгляда ---
+            # --- подвижные твёрдые объекты на линии взгляда ---
+            # препятствие может пересечь отрезок только в ячейках на его пути
             blocked: bool = False
-            for obstacle in entities:
+            for obstacle in self._entity_manager.query_segment((sx, sy), (ex, ey)):
                 if (
                     not obstacle.is_solid
                     or obstacle is self
                     or obstacle is entity
                     or not obstacle.active
+                    or (use_cache and obstacle.is_static)
                 ):
                     continue
                 if self._segment_intersects_shape(
@@ -280,30 +313,43 @@ class NPC(Character):
         1. Восприятие окружения
         2. Принятие решения модулем ИИ
         3. Действие (патрулирование или другое)
+
+        Если планировщик пропустил решение на этом кадре, шаги 1–2 не
+        выполняются: NPC продолжает движение к последней выбранной цели.
         """
         if not self.is_alive:
             return
+        self.update_modifiers(delta_time)
 
-        # Принятие решения
-        perceptions = self.perceive()
+        if self._decision_due:
+            # Принятие решения: берём пакетный результат кадра, если он есть
+            perceptions = self._perceptions if self._perceptions is not None else self.perceive()
+            self._last_perceptions = perceptions
 
-        # координата, куда должен идти зомби
-        target: Optional[Tuple[float, float]] = self._decision_module.decide(
-            self, perceptions
-        )
+            # координата, куда должен идти зомби
+            target: Optional[Tuple[float, float]] = self._decision_module.decide(
+                self, perceptions
+            )
 
-        if target:
-            self._route.clear()
-            self._route.append(target)
+            if target:
+                self._plan_route(target)
 
-            # разворот к цели
-            dx, dy = target[0] - self.position[0], target[1] - self.position[1]
-            if dx or dy:
-                self.angle = math.atan2(dy, dx)
+                # разворот к цели
+                dx, dy = target[0] - self.position[0], target[1] - self.position[1]
+                if dx or dy:
+                    self.angle = math.atan2(dy, dx)
+        else:
+            perceptions = self._last_perceptions
+        self._perceptions = None
+        self._decision_due = True
 
         # движение по маршруту
+        while len(self._route) > 1 and math.hypot(
+            self._route[0][0] - self.position[0], self._route[0][1] - self.position[1]
+        ) <= self._WAYPOINT_RADIUS:
+            self._route.pop(0)
         if self._route:
-            self.move_towards(self._route[0], delta_time)
+            self.move_towards(self._steering_point(self._route[0]), delta_time)
 
 
 
@@ -327,6 +373,57 @@ class NPC(Character):
                 return
 
 
+    def _plan_route(self, target: Tuple[float, float]) -> None:
+        """
+        Заполняет маршрут до ``target``.
+
+        Погоня за игроком идёт по общему полю направлений, остальные цели —
+        по пути A* из EntityManager.navigation. Путь перезапрашивается только
+        при смене ячейки цели; если путь пока не получен (бюджет кадра
+        исчерпан или цель недостижима), NPC идёт к цели напрямую.
+        """
+        navigation = self._entity_manager.navigation
+        flow_field = self._entity_manager.flow_field
+        chasing: bool = (
+            self._attitude == Attitude.HOSTILE and flow_field is not None and flow_field.leads_to(target)
+        )
+        if navigation is None or chasing:
+            self._route[:] = [target]
+            self._route_goal = None
+            return
+
+        if (
+            self._route
+            and self._route_goal is not None
+            and navigation.cell_of(self._route_goal) == navigation.cell_of(target)
+        ):
+            self._route[-1] = target  # та же ячейка цели — уточняем только конец
+            self._route_goal = target
+            return
+
+        path: Optional[List[Tuple[float, float]]] = navigation.request_path(self.position, target)
+        if path is None:
+            self._route[:] = [target]
+            self._route_goal = None
+        else:
+            self._route[:] = path
+            self._route_goal = target
+
+    def _steering_point(self, target: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Точка, к которой шагать на этом кадре ради ``target``.
+        Враждебный NPC, цель которого лежит в ячейке игрока, идёт по общему
+        полю направлений (обходя статичные препятствия); иначе — напрямую.
+        """
+        flow_field = self._entity_manager.flow_field
+        if self._attitude != Attitude.HOSTILE or flow_field is None or not flow_field.leads_to(target):
+            return target
+        direction: Optional[Tuple[float, float]] = flow_field.direction_at(self.position)
+        if direction is None:
+            return target  # уже в ячейке игрока или путь не найден
+        x, y = self.position
+        return x + direction[0] * flow_field.cell_size, y + direction[1] * flow_field.cell_size
+
     def move_towards(self, target: Tuple[float, float], delta_time: float) -> None:
         """
         Двигается к `target`, пытаясь «скользить» вдоль препятствий.
@@ -384,41 +481,34 @@ class NPC(Character):
             # все варианты заблокированы
             self._velocity.update(0.0, 0.0)
 
-    def render(self, surface: Any) -> None:
+    def submit(self, queue: RenderQueue, offset: Tuple[float, float] = (0.0, 0.0)) -> None:
         """
-        Отрисовать NPC на экране с учётом его текущего угла поворота.
+        Отправить в очередь кадра спрайт NPC с учётом его текущего угла
+        поворота и шкалу здоровья над ним.
         """
-        super().render(surface)  # hit-box / debug-отрисовка из Character
+        super().submit(queue, offset)  # hit-box / debug-отрисовка из Character
 
         picture = self._picture_alive if self.is_alive else self._picture_dead
 
-        # поворачиваем картинку на угол (в градусах, по часовой стрелке)
-        rotated = pygame.transform.rotate(picture, -math.degrees(self.angle))
-        rect = rotated.get_rect(center=self.position)
+        # поворачиваем картинку на угол (в градусах, по часовой стрелке);
+        # повёрнутые кадры общие для всех NPC с той же картинкой
+        rotated = sprite_cache.rotate(picture, -math.degrees(self.angle))
+        rect = rotated.get_rect(center=(self.position[0] - offset[0], self.position[1] - offset[1]))
 
 
         #for t in self._route:
         #    pygame.draw.circle(surface, (255, 0, 0), t, 5)
 
 
-        surface.blit(rotated, rect)
+        queue.submit(self.render_layer, rotated, rect)
+        self._screen_rect = rect
 
         # ---------- шкала здоровья ----------
-        if self.is_alive:
+        if self.is_alive and not (HEALTH_BAR_HIDE_FULL and self.health >= self.max_health):
             hp_pct: float = max(0.0, min(1.0, self.health / self.max_health))
-            bar_w: int = rect.width
-            bar_h: int = 6
-            bar_x: int = rect.left
-            bar_y: int = rect.top - bar_h - 2
-
-            # цвет: зелёный (100 %) → красный (0 %)
-            red: int = int(255 * (1.0 - hp_pct))
-            green: int = int(255 * hp_pct)
-
-            # рамка
-            pygame.draw.rect(surface, (0, 0, 0),
-                             pygame.Rect(bar_x - 1, bar_y - 1, bar_w + 2, bar_h + 2))
-
-            # заполнение
-            pygame.draw.rect(surface, (red, green, 0),
-                             pygame.Rect(bar_x, bar_y, int(bar_w * hp_pct), bar_h))
+            # ширина — по неповёрнутой картинке, чтобы шкала не «дышала»
+            # при поворотах и атлас хранил одну ширину на вид NPC
+            bar: pygame.Surface = health_bars.bar(picture.get_width(), hp_pct)
+            frame: pygame.Rect = bar.get_rect(midbottom=(rect.centerx, rect.top - 1))
+            queue.submit(RenderLayer.HUD, bar, frame)
+            self._screen_rect = rect.union(frame)
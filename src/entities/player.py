@@ -1,4 +1,4 @@
-from typing import List, Optional, Any, Callable
+from typing import List, Optional, Any, Callable, Tuple
 
 import pygame
 
@@ -6,16 +6,19 @@ from src.entities.modifier import Modifier
 from src.entities.character import Character
 from src.entities.item import Item
 from src.entities.entity import Shape
-from src.entities.projectile import Projectile
+from src.entities.bullet import Bullet
 from src.game.animation import Animation
 from src.entities.weapon import Weapon, FireMode
 from src.game.entity_manager import EntityManager
+from src.game import sprite_cache
+from src.game.render_queue import RenderQueue
 
 
 class Player(Character):
     """
     Игрок — живой персонаж с инвентарём, экипированным оружием и бронёй.
     """
+    __slots__ = ('_inventory', '_equipped_weapon', '_equipped_armor', 'on_shoot')
 
     def __init__(
         self,
@@ -46,7 +49,7 @@ class Player(Character):
         # Экипированное оружие и броня
         self._equipped_weapon: Optional[Weapon] = None
         self._equipped_armor:  Optional[Item]   = None
-        self.on_shoot: List[Callable[[Projectile], None]] = []
+        self.on_shoot: List[Callable[[Bullet], None]] = []
 
     @property
     def velocity(self) -> pygame.Vector2:
@@ -100,7 +103,7 @@ class Player(Character):
             old = self._equipped_weapon
             old.stop_reload()
             # Удаляем все модификаторы атаки, связанные со старым оружием
-            for mod in list(self._attack_modifiers):
+            for mod in self.attack_modifiers:
                 if mod.source is old:
                     self.remove_attack_modifier(mod)
         # Экипируем новое оружие
@@ -121,7 +124,7 @@ class Player(Character):
         # Снять старую броню и её модификаторы
         if self._equipped_armor:
             old = self._equipped_armor
-            for mod in list(self._defense_modifiers):
+            for mod in self.defense_modifiers:
                 if mod.source is old:
                     self.remove_defense_modifier(mod)
         # Экипировать новую броню
@@ -165,13 +168,13 @@ class Player(Character):
         if self._equipped_weapon is not None:
             self._equipped_weapon.update(delta_time)
 
-    def render(self, surface: pygame.Surface) -> None:
+    def submit(self, queue: RenderQueue, offset: Tuple[float, float] = (0.0, 0.0)) -> None:
         """
         Отрисовка игрока на экране с учётом текущего угла поворота ``angle``.
         Поворот выполняется вокруг центра спрайта.
         """
-        # Вызываем базовый render (например, для хитбокса или дополнительных эффектов)
-        super().render(surface)
+        # Вызываем базовый submit (например, для хитбокса или дополнительных эффектов)
+        super().submit(queue, offset)
         # Определяем, какой спрайт рисовать: кадр анимации или статичную картинку
         sprite: Optional[pygame.Surface] = (
             #self._animation.get_image() if self._animation is not None else self._picture
@@ -180,9 +183,12 @@ class Player(Character):
 
         if sprite is not None:
             # В pygame положительные углы — против часовой стрелки, поэтому берём «-angle»
-            rotated_sprite: pygame.Surface = pygame.transform.rotate(sprite, -self.angle)
-            rect: pygame.Rect = rotated_sprite.get_rect(center=self.position)
-            surface.blit(rotated_sprite, rect)
+            rotated_sprite: pygame.Surface = sprite_cache.rotate(sprite, -self.angle)
+            rect: pygame.Rect = rotated_sprite.get_rect(
+                center=(self.position[0] - offset[0], self.position[1] - offset[1])
+            )
+            queue.submit(self.render_layer, rotated_sprite, rect)
+            self._screen_rect = rect
 
 class PlayerController:
     def __init__(self, player: 'Player') -> None:
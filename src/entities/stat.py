@@ -0,0 +1,107 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.entities.modifier import Modifier, ModifierKind
+
+
+class Stat:
+    """
+    Характеристика с модификаторами и закэшированным итогом.
+
+    Итог = (база + Σ FLAT) × (1 + Σ PERCENT / 100) × Π MULTIPLY.
+    Он пересчитывается только при изменении базы или списка модификаторов,
+    поэтому чтение ``value`` в горячих циклах — обращение к готовому числу.
+    Модификаторы с ``duration`` снимаются сами по мере вызовов ``update``.
+    Списки модификаторов и таймеров создаются при первом добавлении:
+    у большинства персонажей характеристики без модификаторов.
+    """
+    __slots__ = ('_base', '_modifiers', '_timers', '_value')
+
+    def __init__(self, base: float) -> None:
+        self._base: float = base
+        self._modifiers: Optional[List[Modifier]] = None
+        # оставшееся время временных модификаторов
+        self._timers: Optional[Dict[Modifier, float]] = None
+        self._value: float = base
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @property
+    def base(self) -> float:
+        return self._base
+
+    @base.setter
+    def base(self, value: float) -> None:
+        self._base = value
+        self._recompute()
+
+    @property
+    def modifiers(self) -> Tuple[Modifier, ...]:
+        return tuple(self._modifiers) if self._modifiers else ()
+
+    @property
+    def has_timers(self) -> bool:
+        return bool(self._timers)
+
+    def add(self, mod: Modifier) -> None:
+        if self._modifiers is None:
+            self._modifiers = []
+        self._modifiers.append(mod)
+        if mod.duration is not None:
+            if self._timers is None:
+                self._timers = {}
+            self._timers[mod] = mod.duration
+        self._recompute()
+
+    def remove(self, mod: Modifier) -> None:
+        if self._modifiers is None:
+            raise ValueError("Модификатор не найден")
+        self._modifiers.remove(mod)
+        if self._timers:
+            self._timers.pop(mod, None)
+        self._recompute()
+
+    def update(self, delta_time: float) -> bool:
+        """Отсчитывает время временных модификаторов; True, если какие-то истекли."""
+        if not self._timers:
+            return False
+        expired: List[Modifier] = []
+        for mod in self._timers:
+            self._timers[mod] -= delta_time
+            if self._timers[mod] <= 0.0:
+                expired.append(mod)
+        for mod in expired:
+            self._modifiers.remove(mod)
+            del self._timers[mod]
+        if expired:
+            self._recompute()
+        return bool(expired)
+
+    # -------- protected helpers --------
+    def _recompute(self) -> None:
+        flat: float = self._base
+        percent: float = 0.0
+        factor: float = 1.0
+        for mod in self._modifiers or ():
+            if mod.kind is ModifierKind.FLAT:
+                flat += mod.value
+            elif mod.kind is ModifierKind.PERCENT:
+                percent += mod.value
+            else:
+                factor *= mod.value
+        self._value = flat * (1.0 + percent / 100.0) * factor
+
+
+def update_stats(timed: Set[Stat], delta_time: float) -> bool:
+    """
+    Продвигает таймеры характеристик из ``timed`` и убирает из множества
+    те, у которых временных модификаторов не осталось. True, если
+    какой-то модификатор истёк.
+    """
+    changed: bool = False
+    for stat in list(timed):
+        changed = stat.update(delta_time) or changed
+        if not stat.has_timers:
+            timed.discard(stat)
+    return changed
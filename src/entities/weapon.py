@@ -1,18 +1,20 @@
 from abc import abstractmethod
 from enum import Enum, auto
-from typing import Any, Optional, List, TYPE_CHECKING, Tuple
+from typing import Any, Optional, List, Set, TYPE_CHECKING, Tuple
 
 import pygame
 import pygame.mixer
 
 from src.entities.entity import Entity
 from src.entities.item import Item
+from src.entities.stat import Stat, update_stats
+from src.game.asset_manager import assets
 from src.game.entity_manager import EntityManager
 
 if TYPE_CHECKING:
     from src.entities.entity import Shape
     from src.entities.modifier import Modifier
-    from src.entities.projectile import Projectile
+    from src.entities.bullet import Bullet
 
 class FireMode(Enum):
     SINGLE: int = auto()   # одиночный
@@ -27,6 +29,12 @@ class Weapon(Item):
         firing_range, bullet_speed, attack_power, reload_time,
         shot_hearing_range, shot_vision_range
     """
+    __slots__ = (
+        '_firing_range', '_firing_rate', '_bullet_speed', '_attack_power', '_reload_time',
+        '_shot_hearing_range', '_shot_vision_range', '_fire_sound', '_available_fire_modes',
+        '_current_fire_mode', '_magazine_capacity', '_current_ammo', '_available_ammo',
+        '_timed_stats', '_is_reloading', '_reload_timer', '_owner',
+    )
 
     def __init__(
         self,
@@ -62,15 +70,15 @@ class Weapon(Item):
             quantity=1
         )
         # Базовые значения
-        self._firing_range: float        = firing_range
+        self._firing_range: Stat         = Stat(firing_range)
         self._firing_rate: int           = firing_rate
-        self._bullet_speed: float        = bullet_speed
-        self._attack_power: float        = attack_power
-        self._reload_time: float         = reload_time
-        self._shot_hearing_range: float  = shot_hearing_range
-        self._shot_vision_range: float   = shot_vision_range
+        self._bullet_speed: Stat         = Stat(bullet_speed)
+        self._attack_power: Stat         = Stat(attack_power)
+        self._reload_time: Stat          = Stat(reload_time)
+        self._shot_hearing_range: Stat   = Stat(shot_hearing_range)
+        self._shot_vision_range: Stat    = Stat(shot_vision_range)
         self._fire_sound: Optional[pygame.mixer.Sound] = (
-            pygame.mixer.Sound(fire_sound) if fire_sound else None
+            assets.sound(fire_sound) if fire_sound else None
         )
 
         # Доступные режимы стрельбы
@@ -86,13 +94,8 @@ class Weapon(Item):
         self._current_ammo: int = magazine_capacity
         self._available_ammo: int = 0
 
-        # Списки модификаторов
-        self._firing_range_mods:       List['Modifier'] = []
-        self._bullet_speed_mods:       List['Modifier'] = []
-        self._attack_power_mods:       List['Modifier'] = []
-        self._reload_time_mods:        List['Modifier'] = []
-        self._shot_hearing_range_mods: List['Modifier'] = []
-        self._shot_vision_range_mods:  List['Modifier'] = []
+        # характеристики, у которых есть временные модификаторы
+        self._timed_stats: Optional[Set[Stat]] = None
 
         # Внутренние флаги
         self._is_reloading: bool = False
@@ -105,63 +108,70 @@ class Weapon(Item):
 
     @property
     def firing_range(self) -> float:
-        return self._firing_range + sum(m.value for m in self._firing_range_mods)
+        return self._firing_range.value
 
     def add_firing_range_modifier(self, mod: 'Modifier') -> None:
-        self._firing_range_mods.append(mod)
+        self._add_modifier(self._firing_range, mod)
 
     def remove_firing_range_modifier(self, mod: 'Modifier') -> None:
-        self._firing_range_mods.remove(mod)
+        self._firing_range.remove(mod)
 
     @property
     def bullet_speed(self) -> float:
-        return self._bullet_speed + sum(m.value for m in self._bullet_speed_mods)
+        return self._bullet_speed.value
 
     def add_bullet_speed_modifier(self, mod: 'Modifier') -> None:
-        self._bullet_speed_mods.append(mod)
+        self._add_modifier(self._bullet_speed, mod)
 
     def remove_bullet_speed_modifier(self, mod: 'Modifier') -> None:
-        self._bullet_speed_mods.remove(mod)
+        self._bullet_speed.remove(mod)
 
     @property
     def attack_power(self) -> float:
-        return self._attack_power + sum(m.value for m in self._attack_power_mods)
+        return self._attack_power.value
 
     def add_attack_power_modifier(self, mod: 'Modifier') -> None:
-        self._attack_power_mods.append(mod)
+        self._add_modifier(self._attack_power, mod)
 
     def remove_attack_power_modifier(self, mod: 'Modifier') -> None:
-        self._attack_power_mods.remove(mod)
+        self._attack_power.remove(mod)
 
     @property
     def reload_time(self) -> float:
-        return self._reload_time + sum(m.value for m in self._reload_time_mods)
+        return self._reload_time.value
 
     def add_reload_time_modifier(self, mod: 'Modifier') -> None:
-        self._reload_time_mods.append(mod)
+        self._add_modifier(self._reload_time, mod)
 
     def remove_reload_time_modifier(self, mod: 'Modifier') -> None:
-        self._reload_time_mods.remove(mod)
+        self._reload_time.remove(mod)
 
     @property
     def shot_hearing_range(self) -> float:
-        return self._shot_hearing_range + sum(m.value for m in self._shot_hearing_range_mods)
+        return self._shot_hearing_range.value
 
     def add_shot_hearing_range_modifier(self, mod: 'Modifier') -> None:
-        self._shot_hearing_range_mods.append(mod)
+        self._add_modifier(self._shot_hearing_range, mod)
 
     def remove_shot_hearing_range_modifier(self, mod: 'Modifier') -> None:
-        self._shot_hearing_range_mods.remove(mod)
+        self._shot_hearing_range.remove(mod)
 
     @property
     def shot_vision_range(self) -> float:
-        return self._shot_vision_range + sum(m.value for m in self._shot_vision_range_mods)
+        return self._shot_vision_range.value
 
     def add_shot_vision_range_modifier(self, mod: 'Modifier') -> None:
-        self._shot_vision_range_mods.append(mod)
+        self._add_modifier(self._shot_vision_range, mod)
 
     def remove_shot_vision_range_modifier(self, mod: 'Modifier') -> None:
-        self._shot_vision_range_mods.remove(mod)
+        self._shot_vision_range.remove(mod)
+
+    def _add_modifier(self, stat: Stat, mod: 'Modifier') -> None:
+        stat.add(mod)
+        if mod.duration is not None:
+            if self._timed_stats is None:
+                self._timed_stats = set()
+            self._timed_stats.add(stat)
 
     @property
     def owner(self):
@@ -218,7 +228,9 @@ class Weapon(Item):
         self._available_ammo = 0
 
     def update(self, delta_time: float) -> None:
-        """Обрабатывает таймер перезарядки."""
+        """Обрабатывает таймер перезарядки и временные модификаторы."""
+        if self._timed_stats:
+            update_stats(self._timed_stats, delta_time)
         if self._is_reloading:
             self._reload_timer += delta_time
             if self._reload_timer >= self.reload_time:
@@ -243,7 +255,7 @@ class Weapon(Item):
         """Проверяет, можно ли сделать выстрел (не в перезарядке)."""
         return not self._is_reloading
 
-    def fire(self, player_position: Tuple[float, float], direction: pygame.Vector2) -> Optional['Projectile']:
+    def fire(self, player_position: Tuple[float, float], direction: pygame.Vector2) -> Optional['Bullet']:
         """
         Выполнить выстрел в заданном направлении.
 
@@ -251,7 +263,6 @@ class Weapon(Item):
         :param direction: Нормализованный вектор направления полёта.
         :return: Bullet либо None, если выстрел невозможен.
         """
-        from src.entities.bullet import Bullet
         # 1. Проверяем, что можем стрелять
         if not self.can_fire():
             return None
@@ -264,18 +275,13 @@ class Weapon(Item):
             return None
         direction = direction.normalize()
 
-        # 3. Создаём пулю
-        bullet = Bullet(
-            entity_manager=self._entity_manager,
-            entity_id=0,
-            x=player_position[0],
-            y=player_position[1],
+        # 3. Выпускаем пулю в общий движок снарядов
+        bullet = self._entity_manager.projectiles.spawn(
+            position=(player_position[0], player_position[1]),
             direction=(direction.x, direction.y),
             source=self,
         )
 
-        self._entity_manager.add_existing_entity(bullet)
-
         # 4. Обновляем счётчик патронов
         self._current_ammo -= 1
         if self._current_ammo == 0:
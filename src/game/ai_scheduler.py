@@ -0,0 +1,86 @@
+import math
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.entities.npc import NPC
+
+
+class AIScheduler:
+    """
+    Планировщик решений ИИ с разнесением по кадрам.
+
+    Частота решений NPC зависит от расстояния до точки интереса (игрока):
+    ближе ``near_distance`` — каждый кадр, дальше ``far_distance`` — раз
+    в ``far_interval`` кадров, между ними — линейно. Счётчик кадров
+    хранится в ``NPC.decision_timer``. За кадр принимается не более
+    ``budget`` решений; не уложившиеся NPC получают приоритет в
+    следующем кадре. Между решениями NPC продолжает двигаться к
+    последней выбранной цели.
+    """
+
+    def __init__(
+        self,
+        budget: int = 64,
+        near_distance: float = 400.0,
+        far_distance: float = 1500.0,
+        near_interval: int = 1,
+        far_interval: int = 8,
+    ) -> None:
+        if budget < 1:
+            raise ValueError("Бюджет решений должен быть не меньше 1")
+        self._budget: int = budget
+        self._near_distance: float = near_distance
+        self._far_distance: float = far_distance
+        self._near_interval: int = max(1, near_interval)
+        self._far_interval: int = max(self._near_interval, far_interval)
+        self._frame: int = 0
+
+    @property
+    def budget(self) -> int:
+        return self._budget
+
+    @budget.setter
+    def budget(self, value: int) -> None:
+        self._budget = max(1, value)
+
+    def interval_for(self, distance: float) -> int:
+        """Интервал между решениями (в кадрах) для NPC на расстоянии ``distance``."""
+        if distance <= self._near_distance:
+            return self._near_interval
+        if distance >= self._far_distance:
+            return self._far_interval
+        k: float = (distance - self._near_distance) / (self._far_distance - self._near_distance)
+        return round(self._near_interval + k * (self._far_interval - self._near_interval))
+
+    def schedule(self, npcs: List['NPC'], focus: Optional[Tuple[float, float]]) -> List['NPC']:
+        """
+        Отмечает, кто из ``npcs`` принимает решение на этом кадре,
+        и возвращает их список. Остальным решение пропускается.
+
+        :param npcs: живые NPC уровня
+        :param focus: позиция игрока; без неё все NPC считаются ближними
+        """
+        self._frame += 1
+        due: List['NPC'] = []
+        for npc in npcs:
+            npc.decision_timer -= 1
+            if npc.decision_timer <= 0:
+                due.append(npc)
+            else:
+                npc.set_decision_due(False)
+
+        if len(due) > self._budget:
+            # первыми — сильнее всего просроченные
+            due.sort(key=lambda n: n.decision_timer)
+            for npc in due[self._budget:]:
+                npc.set_decision_due(False)
+            due = due[:self._budget]
+
+        for npc in due:
+            distance: float = 0.0
+            if focus is not None:
+                distance = math.hypot(npc.position[0] - focus[0], npc.position[1] - focus[1])
+            interval: int = self.interval_for(distance)
+            # фаза по id разносит решения далёких NPC по разным кадрам
+            npc.decision_timer = interval - (self._frame + npc.id) % interval
+        return due
@@ -0,0 +1,226 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+from src.game.parallel_decoder import decode_images
+from src.game.sprite_disk_cache import SpriteDiskCache
+from src.settings import ASSET_SOURCE_CACHE_MB, SPRITE_DISK_CACHE_DIR
+
+
+ImageKey = Tuple[str, Optional[Tuple[int, int]], bool]
+DecodedKey = Tuple[str, Optional[Tuple[int, int]]]
+
+
+class AssetManager:
+    """
+    Общий кэш ресурсов: каждый файл декодируется один раз.
+
+    Картинки хранятся по ключу (путь, размер, альфа): исходный декодированный
+    кадр и каждая его масштабированная версия создаются по одному разу и
+    затем выдаются всем вызывающим как общие поверхности — изменять их
+    нельзя. Звуки кэшируются по пути. Статистика попаданий/промахов
+    доступна через ``stats``.
+
+    Масштабированные картинки дополнительно берутся из дискового кэша
+    ``disk_cache`` (сырые пиксели без декодирования PNG); при промахе
+    запись туда дописывается.
+
+    Загрузку можно разделить на две фазы: ``decode`` (чтение и декодирование,
+    без обращения к экрану — безопасно в фоновом потоке) и ``image`` на
+    главном потоке, который лишь приводит готовый кадр к формату экрана.
+
+    Исходники полного размера нужны только для масштабирования, поэтому
+    их суммарный объём ограничен ``max_source_bytes`` (LRU): повторные
+    размеры одной картинки не декодируют файл заново, а редко нужные
+    исходники не живут всю игру.
+    """
+
+    def __init__(self, disk_cache: Optional[SpriteDiskCache] = None,
+                 max_source_bytes: int = 16 * 1024 * 1024) -> None:
+        self._disk_cache: Optional[SpriteDiskCache] = disk_cache
+        self._images: Dict[ImageKey, pygame.Surface] = {}
+        self._sounds: Dict[str, pygame.mixer.Sound] = {}
+        # декодированные исходники (полный размер), LRU по объёму
+        self._sources: 'OrderedDict[str, pygame.Surface]' = OrderedDict()
+        self._source_bytes: int = 0
+        self._max_source_bytes: int = max_source_bytes
+        # декодированные заранее кадры, ждущие приведения к формату экрана
+        self._decoded: Dict[DecodedKey, pygame.Surface] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def stats(self) -> Dict[str, int]:
+        """Счётчики попаданий/промахов и число закэшированных ресурсов."""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'images': len(self._images),
+            'sounds': len(self._sounds),
+        }
+
+    def image(self, path: str, size: Optional[Tuple[int, int]] = None, alpha: bool = True) -> pygame.Surface:
+        """
+        Картинка из ``path``, приведённая к формату экрана
+        (``convert_alpha`` при ``alpha``, иначе ``convert``) и, если задан
+        ``size``, масштабированная до него.
+        """
+        path = os.fspath(path)
+        key: ImageKey = (path, tuple(size) if size is not None else None, alpha)
+        surface: Optional[pygame.Surface] = self._images.get(key)
+        if surface is not None:
+            self._hits += 1
+            return surface
+
+        self._misses += 1
+        with self._lock:
+            raw: Optional[pygame.Surface] = self._decoded.pop((path, key[1]), None)
+        if raw is None:
+            raw = self._decode(path, key[1])
+        surface = raw.convert_alpha() if alpha else raw.convert()
+        self._images[key] = surface
+        return surface
+
+    def decode(self, path: str, size: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Заранее читает и декодирует картинку (и масштабирует до ``size``).
+        Не требует дисплея, поэтому может выполняться в фоновом потоке;
+        ближайший ``image`` с теми же путём и размером возьмёт готовый кадр.
+        """
+        path = os.fspath(path)
+        key: DecodedKey = (path, tuple(size) if size is not None else None)
+        if self._is_ready(key):
+            return
+        raw: pygame.Surface = self._decode(path, key[1])
+        with self._lock:
+            self._decoded[key] = raw
+
+    def preload(
+            self,
+            pairs: List[Tuple[str, Optional[Tuple[int, int]]]],
+            processes: int = 1,
+            on_decoded: Optional[Callable[[DecodedKey], None]] = None,
+    ) -> None:
+        """
+        Пакетный ``decode``. Пары, которых нет ни в памяти, ни в дисковом
+        кэше, декодируются через ``decode_images``: при ``processes`` != 1 —
+        пулом процессов (0 — по числу ядер). ``on_decoded`` вызывается для
+        каждой готовой пары.
+        """
+        missing: List[DecodedKey] = []
+        for path, size in pairs:
+            key: DecodedKey = (os.fspath(path), tuple(size) if size is not None else None)
+            if not self._is_ready(key):
+                cached: Optional[pygame.Surface] = (
+                    self._disk_cache.load(*key) if self._disk_cache is not None and key[1] is not None else None
+                )
+                if cached is None:
+                    missing.append(key)
+                    continue
+                with self._lock:
+                    self._decoded[key] = cached
+            if on_decoded is not None:
+                on_decoded(key)
+
+        for key, raw in decode_images(missing, processes, on_decoded).items():
+            with self._lock:
+                self._decoded[key] = raw
+            if self._disk_cache is not None and key[1] is not None:
+                self._disk_cache.store(key[0], key[1], raw)
+
+    def discard_decoded(self, pairs: Iterable[Tuple[str, Optional[Tuple[int, int]]]]) -> int:
+        """
+        Забывает заранее декодированные кадры из ``pairs``, которые так и
+        не были запрошены через ``image`` (например, после загрузки уровня
+        по его манифесту). Возвращает число освобождённых кадров.
+        """
+        dropped: int = 0
+        with self._lock:
+            for path, size in pairs:
+                key: DecodedKey = (os.fspath(path), tuple(size) if size is not None else None)
+                if self._decoded.pop(key, None) is not None:
+                    dropped += 1
+        return dropped
+
+    def sound(self, path: str) -> pygame.mixer.Sound:
+        """Звук из ``path``; один объект Sound на файл."""
+        sound: Optional[pygame.mixer.Sound] = self._sounds.get(path)
+        if sound is not None:
+            self._hits += 1
+            return sound
+
+        self._misses += 1
+        sound = pygame.mixer.Sound(path)
+        self._sounds[path] = sound
+        return sound
+
+    def clear(self) -> None:
+        """Забывает все ресурсы (например, после смены видеорежима)."""
+        self._images.clear()
+        self._sounds.clear()
+        with self._lock:
+            self._sources.clear()
+            self._source_bytes = 0
+            self._decoded.clear()
+
+    # -------- protected helpers --------
+    def _is_ready(self, key: DecodedKey) -> bool:
+        """Кадр уже приведён к формату экрана или ждёт в очереди декодированных."""
+        path, size = key
+        if (path, size, True) in self._images or (path, size, False) in self._images:
+            return True
+        with self._lock:
+            return key in self._decoded
+
+    def _decode(self, path: str, size: Optional[Tuple[int, int]]) -> pygame.Surface:
+        """Кадр без привязки к экрану: из дискового кэша либо из исходного файла."""
+        if size is None:
+            return self._source(path)
+        scaled: Optional[pygame.Surface] = (
+            self._disk_cache.load(path, size) if self._disk_cache is not None else None
+        )
+        if scaled is None:
+            # масштабируем из общего декодированного исходника и дописываем дисковый кэш
+            scaled = pygame.transform.scale(self._source(path), size)
+            if self._disk_cache is not None:
+                self._disk_cache.store(path, size, scaled)
+        return scaled
+
+    def _source(self, path: str) -> pygame.Surface:
+        with self._lock:
+            source: Optional[pygame.Surface] = self._sources.get(path)
+            if source is not None:
+                self._sources.move_to_end(path)
+                return source
+        source = pygame.image.load(path)
+        with self._lock:
+            if path not in self._sources:
+                self._sources[path] = source
+                self._source_bytes += self._surface_bytes(source)
+            # вытесняются самые давние; исходник больше лимита не хранится вовсе
+            while self._source_bytes > self._max_source_bytes and self._sources:
+                _, evicted = self._sources.popitem(last=False)
+                self._source_bytes -= self._surface_bytes(evicted)
+        return source
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# общий экземпляр для всей игры
+assets: AssetManager = AssetManager(
+    SpriteDiskCache(SPRITE_DISK_CACHE_DIR) if SPRITE_DISK_CACHE_DIR else None,
+    ASSET_SOURCE_CACHE_MB * 1024 * 1024,
+)
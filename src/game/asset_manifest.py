@@ -0,0 +1,25 @@
+from typing import List
+
+from src.game.level import Level
+from src.game.parallel_decoder import ImagePair
+from src.settings import (BRIEFING_BG_IMAGE, CROSSHAIR_IMAGE, CROSSHAIR_SIZE, MENU_BG_IMAGE,
+                          SCREEN_HEIGHT, SCREEN_WIDTH)
+
+
+def ui_manifest() -> List[ImagePair]:
+    """Картинки (путь, размер) в тех размерах, в которых их запрашивают экраны меню и игры."""
+    return [
+        (MENU_BG_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT)),
+        (BRIEFING_BG_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT)),
+        (CROSSHAIR_IMAGE, (CROSSHAIR_SIZE, CROSSHAIR_SIZE)),
+    ]
+
+
+def startup_manifest(level_num: int = 1) -> List[ImagePair]:
+    """
+    Всё, что декодируется при запуске: экраны и первый уровень по его
+    ``Level.asset_manifest`` — ключи совпадают с запросами уровня, поэтому
+    предзагрузка не тратит память на неиспользуемые размеры.
+    """
+    # разные настройки могут указывать на один файл — пары не повторяются
+    return list(dict.fromkeys(ui_manifest() + Level.asset_manifest(level_num)))
@@ -0,0 +1,59 @@
+from typing import Tuple
+
+import pygame
+
+
+class Camera:
+    """
+    Камера уровня: окно размером с экран, которое следует за игроком
+    по миру произвольного размера.
+
+    Хранит смещение ``offset`` — мировые координаты левого верхнего угла
+    экрана — и переводит координаты между миром и экраном. Смещение
+    ограничено границами мира, поэтому за краем карты пустоты не видно.
+    """
+
+    def __init__(self, viewport_size: Tuple[int, int], world_size: Tuple[int, int]) -> None:
+        self._viewport: pygame.Rect = pygame.Rect((0, 0), viewport_size)
+        self._world_size: Tuple[int, int] = world_size
+
+    @property
+    def offset(self) -> Tuple[int, int]:
+        """Мировые координаты левого верхнего угла экрана."""
+        return self._viewport.topleft
+
+    @property
+    def view_rect(self) -> pygame.Rect:
+        """Видимая часть мира (копия, в мировых координатах)."""
+        return self._viewport.copy()
+
+    @property
+    def world_size(self) -> Tuple[int, int]:
+        return self._world_size
+
+    def follow(self, target: Tuple[float, float]) -> bool:
+        """
+        Центрирует камеру на точке мира ``target`` в пределах мира.
+        Возвращает True, если смещение изменилось.
+        """
+        old: Tuple[int, int] = self._viewport.topleft
+        world_w, world_h = self._world_size
+        x: int = int(target[0]) - self._viewport.width // 2
+        y: int = int(target[1]) - self._viewport.height // 2
+        self._viewport.left = max(0, min(x, world_w - self._viewport.width))
+        self._viewport.top = max(0, min(y, world_h - self._viewport.height))
+        return self._viewport.topleft != old
+
+    def world_to_screen(self, position: Tuple[float, float]) -> Tuple[float, float]:
+        return position[0] - self._viewport.left, position[1] - self._viewport.top
+
+    def screen_to_world(self, position: Tuple[float, float]) -> pygame.Vector2:
+        """Точка экрана (например, курсор мыши) в мировых координатах."""
+        return pygame.Vector2(position[0] + self._viewport.left, position[1] + self._viewport.top)
+
+    def is_visible(self, box: Tuple[float, float, float, float], margin: float = 0.0) -> bool:
+        """Пересекает ли прямоугольник мира (x, y, w, h) видимую область, расширенную на ``margin``."""
+        x, y, w, h = box
+        view: pygame.Rect = self._viewport
+        return (x < view.right + margin and x + w > view.left - margin
+                and y < view.bottom + margin and y + h > view.top - margin)
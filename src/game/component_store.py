@@ -0,0 +1,202 @@
+from enum import IntFlag
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.entities.entity import Entity
+
+
+class Component(IntFlag):
+    """Компоненты сущности; набор компонентов определяет её архетип."""
+    POSITION = 1
+    HEALTH = 2
+    AI = 4
+    PICKUP = 8
+
+
+# столбцы данных компонентов: имя, форма строки, тип
+# (AI и PICKUP — признаки без данных, они только разделяют архетипы)
+COLUMNS: Dict[Component, Tuple[str, Tuple[int, ...], type]] = {
+    Component.POSITION: ('position', (2,), np.float64),
+    Component.HEALTH: ('alive', (), np.bool_),
+}
+
+
+class Archetype:
+    """
+    Плотное хранилище сущностей с одинаковым набором компонентов.
+
+    Данные компонентов лежат в непрерывных столбцах numpy (позиции и флаг
+    «жив», см. ``COLUMNS``), строка ``i`` всех столбцов относится
+    к ``entities[i]``. Удаление переносит последнюю строку на место
+    удалённой, поэтому строки всегда идут подряд без дыр.
+    """
+
+    def __init__(self, mask: Component, capacity: int = 16) -> None:
+        self._mask: Component = mask
+        self._count: int = 0
+        self._capacity: int = capacity
+        self._entities: List['Entity'] = []
+        self._columns: Dict[str, np.ndarray] = {}
+        for component, (name, shape, dtype) in COLUMNS.items():
+            if mask & component:
+                self._columns[name] = np.zeros((capacity,) + shape, dtype=dtype)
+
+    @property
+    def mask(self) -> Component:
+        return self._mask
+
+    @property
+    def entities(self) -> List['Entity']:
+        """Сущности архетипа в порядке строк (не изменять)."""
+        return self._entities
+
+    def __len__(self) -> int:
+        return self._count
+
+    def column(self, name: str) -> np.ndarray:
+        """Занятая часть столбца ``name`` (вид на данные, без копирования)."""
+        return self._columns[name][:self._count]
+
+    def add(self, entity: 'Entity') -> int:
+        """Добавляет сущность в конец и возвращает её строку."""
+        if self._count == self._capacity:
+            self._grow(self._capacity * 2)
+        row: int = self._count
+        self._entities.append(entity)
+        self._count += 1
+        return row
+
+    def remove(self, row: int) -> Optional['Entity']:
+        """
+        Удаляет строку ``row``; последняя строка переезжает на её место.
+        Возвращает переехавшую сущность (ей нужно обновить номер строки) либо None.
+        """
+        last: int = self._count - 1
+        moved: Optional['Entity'] = None
+        if row != last:
+            for column in self._columns.values():
+                column[row] = column[last]
+            moved = self._entities[last]
+            self._entities[row] = moved
+        self._entities.pop()
+        self._count = last
+        return moved
+
+    def write(self, name: str, row: int, value: float) -> None:
+        self._columns[name][row] = value
+
+    def write_pair(self, name: str, row: int, x: float, y: float) -> None:
+        # поэлементная запись скаляров заметно быстрее присваивания строке кортежа
+        column: np.ndarray = self._columns[name]
+        column[row, 0] = x
+        column[row, 1] = y
+
+    # -------- protected helpers --------
+    def _grow(self, capacity: int) -> None:
+        for name, column in self._columns.items():
+            grown: np.ndarray = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:self._capacity] = column
+            self._columns[name] = grown
+        self._capacity = capacity
+
+
+class ComponentStore:
+    """
+    Хранилище компонентов ECS: сущности сгруппированы по архетипам
+    (наборам компонентов), данные каждого архетипа — в столбцах numpy.
+
+    Объекты Entity остаются фасадами: они знают свой архетип и строку,
+    а перемещение и смерть записываются в столбцы ``position`` и ``alive``.
+    Системы перебирают только архетипы с нужными компонентами
+    (``archetypes``), выбирают живых/мёртвых по столбцу целиком вместо
+    проверок ``isinstance`` по всем сущностям и читают позиции массивом
+    (``read``), а не по одной через фасады.
+    """
+
+    def __init__(self) -> None:
+        self._archetypes: Dict[Component, Archetype] = {}
+        # маска запроса -> подходящие архетипы; сбрасывается при появлении нового архетипа
+        self._queries: Dict[Component, List[Archetype]] = {}
+
+    def add(self, entity: 'Entity') -> None:
+        mask: Component = entity.components
+        archetype: Optional[Archetype] = self._archetypes.get(mask)
+        if archetype is None:
+            archetype = Archetype(mask)
+            self._archetypes[mask] = archetype
+            self._queries.clear()
+        entity.attach(archetype, archetype.add(entity))
+        self.write_position(entity)
+        self.write_alive(entity)
+
+    def remove(self, entity: 'Entity') -> None:
+        archetype: Optional[Archetype] = entity.archetype
+        if archetype is None:
+            return
+        row: int = entity.row
+        moved: Optional['Entity'] = archetype.remove(row)
+        if moved is not None:
+            moved.attach(archetype, row)
+        entity.attach(None, -1)
+
+    def archetypes(self, mask: Component) -> List[Archetype]:
+        """Архетипы, содержащие все компоненты ``mask``."""
+        found: Optional[List[Archetype]] = self._queries.get(mask)
+        if found is None:
+            found = [a for m, a in self._archetypes.items() if m & mask == mask]
+            self._queries[mask] = found
+        return found
+
+    def entities(self, mask: Component) -> List['Entity']:
+        """Сущности со всеми компонентами ``mask``."""
+        result: List['Entity'] = []
+        for archetype in self.archetypes(mask):
+            result.extend(archetype.entities)
+        return result
+
+    def alive(self, mask: Component, alive: bool = True) -> List['Entity']:
+        """Сущности со здоровьем и компонентами ``mask``: живые (или мёртвые при ``alive=False``)."""
+        result: List['Entity'] = []
+        for archetype in self.archetypes(mask | Component.HEALTH):
+            flags: np.ndarray = archetype.column('alive')
+            rows: np.ndarray = np.flatnonzero(flags if alive else ~flags)
+            entities: List['Entity'] = archetype.entities
+            result.extend(entities[row] for row in rows.tolist())
+        return result
+
+    def read(self, entities: List['Entity'], component: Component) -> np.ndarray:
+        """
+        Строки столбца компонента ``component`` для ``entities`` в их порядке.
+        Все сущности должны лежать в хранилище и обладать этим компонентом.
+        """
+        name, shape, dtype = COLUMNS[component]
+        archetypes: List[Archetype] = self.archetypes(component)
+        if not archetypes:
+            return np.zeros((0,) + shape, dtype=dtype)
+        offsets: Dict[Archetype, int] = {}
+        total: int = 0
+        for archetype in archetypes:
+            offsets[archetype] = total
+            total += len(archetype)
+        # один общий массив и одна выборка по индексам вместо чтения по сущностям
+        stacked: np.ndarray = np.concatenate([a.column(name) for a in archetypes])
+        index: np.ndarray = np.fromiter(
+            (offsets[e.archetype] + e.row for e in entities), dtype=np.intp, count=len(entities)
+        )
+        return stacked[index]
+
+    # -------- запись данных фасадов --------
+    def write_position(self, entity: 'Entity') -> None:
+        """Записывает позицию сущности (при добавлении и каждом перемещении)."""
+        archetype: Optional[Archetype] = entity.archetype
+        if archetype is not None:
+            x, y = entity.position
+            archetype.write_pair('position', entity.row, x, y)
+
+    def write_alive(self, entity: 'Entity') -> None:
+        """Записывает флаг ``is_alive`` персонажа (при добавлении и смерти)."""
+        archetype: Optional[Archetype] = entity.archetype
+        if archetype is not None and archetype.mask & Component.HEALTH:
+            archetype.write('alive', entity.row, entity.is_alive)
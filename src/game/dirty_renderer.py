@@ -0,0 +1,78 @@
+from typing import Iterable, List, Optional, Tuple
+
+import pygame
+
+
+class DirtyRectRenderer:
+    """
+    Отрисовка «грязными прямоугольниками» для игрового цикла.
+
+    Каждая нарисованная за кадр вещь сообщает свою экранную область через
+    ``mark``. В начале следующего кадра ``restore`` возвращает фон только
+    в областях прошлого кадра, а ``present`` выводит на экран объединение
+    прошлых и текущих областей через ``pygame.display.update(rects)``.
+    Если «грязной» оказывается больше ``max_dirty_fraction`` экрана
+    (или кадр помечен как полный), выполняется обычный ``flip``.
+    """
+
+    def __init__(self, screen_size: Tuple[int, int], max_dirty_fraction: float = 0.5) -> None:
+        self._screen: pygame.Rect = pygame.Rect((0, 0), screen_size)
+        self._max_area: float = max_dirty_fraction * self._screen.width * self._screen.height
+        self._previous: List[pygame.Rect] = []
+        self._current: List[pygame.Rect] = []
+        # первый кадр рисуется и выводится целиком
+        self._full: bool = True
+
+    def invalidate(self) -> None:
+        """Следующий кадр будет перерисован и выведен полностью."""
+        self._full = True
+
+    def restore(self, surface: pygame.Surface, background: Optional[pygame.Surface],
+                offset: Tuple[int, int] = (0, 0)) -> None:
+        """
+        Стирает всё нарисованное в прошлом кадре, возвращая фон.
+        ``offset`` — положение экрана на фоне (смещение камеры).
+        """
+        if self._full or self._area(self._previous) > self._max_area:
+            self._full = True
+            self._blit_background(surface, background, self._screen, offset)
+            return
+        for rect in self._previous:
+            self._blit_background(surface, background, rect, offset)
+
+    def mark(self, rect: Optional[pygame.Rect]) -> None:
+        """Отмечает область экрана, изменённую в этом кадре."""
+        if rect is None:
+            return
+        clipped: pygame.Rect = rect.clip(self._screen)
+        if clipped.width and clipped.height:
+            self._current.append(clipped)
+
+    def mark_all(self, rects: Iterable[pygame.Rect]) -> None:
+        for rect in rects:
+            self.mark(rect)
+
+    def present(self) -> None:
+        """Выводит кадр на экран и запоминает его области для следующего restore."""
+        dirty: List[pygame.Rect] = self._previous + self._current
+        if self._full or self._area(dirty) > self._max_area:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
+        self._previous = self._current
+        self._current = []
+        self._full = False
+
+    # -------- protected helpers --------
+    @staticmethod
+    def _area(rects: List[pygame.Rect]) -> int:
+        # перекрытия считаются дважды — оценка сверху, для выбора flip этого достаточно
+        return sum(r.width * r.height for r in rects)
+
+    @staticmethod
+    def _blit_background(surface: pygame.Surface, background: Optional[pygame.Surface],
+                         rect: pygame.Rect, offset: Tuple[int, int]) -> None:
+        if background is None:
+            surface.fill((0, 0, 0), rect)
+        else:
+            surface.blit(background, rect, rect.move(offset))
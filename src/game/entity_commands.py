@@ -0,0 +1,39 @@
+from enum import Enum
+from typing import List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.entities.entity import Entity
+
+
+class EntityCommand(Enum):
+    SPAWN = 0
+    DESPAWN = 1
+
+
+class EntityCommandBuffer:
+    """
+    Буфер структурных изменений за кадр.
+
+    Появление и удаление сущностей во время обновления не применяется
+    сразу, а записывается сюда в порядке вызовов. EntityManager выполняет
+    все команды в одной точке синхронизации в конце кадра, поэтому
+    системы могут обходить сущности без копирования списков.
+    """
+
+    def __init__(self) -> None:
+        self._commands: List[Tuple[EntityCommand, 'Entity']] = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def spawn(self, entity: 'Entity') -> None:
+        self._commands.append((EntityCommand.SPAWN, entity))
+
+    def despawn(self, entity: 'Entity') -> None:
+        self._commands.append((EntityCommand.DESPAWN, entity))
+
+    def drain(self) -> List[Tuple[EntityCommand, 'Entity']]:
+        """Возвращает накопленные команды и очищает буфер."""
+        commands: List[Tuple[EntityCommand, 'Entity']] = self._commands
+        self._commands = []
+        return commands
@@ -1,17 +1,95 @@
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterator, List, Tuple, Optional, ValuesView, TYPE_CHECKING
 from src.entities.entity import Entity
+from src.game.component_store import Component, ComponentStore
+from src.game.entity_commands import EntityCommand, EntityCommandBuffer
 from src.game.entity_factory import EntityFactory
+from src.game.line_of_sight import LineOfSightCache
+from src.game.projectile_system import ProjectileSystem
+from src.game.spatial_grid import SpatialHashGrid
+
+if TYPE_CHECKING:
+    from src.game.flow_field import FlowField
+    from src.game.navigation import NavigationGrid
+
+class EntityView:
+    """
+    Представление всех сущностей менеджера без копирования.
+
+    Помечено версией структуры на момент создания: если с тех пор
+    сущности добавлялись или удалялись, представление устарело и обход
+    выбрасывает RuntimeError. В пределах кадра структура меняется только
+    в точке синхронизации (``EntityManager.apply_commands``).
+    """
+    __slots__ = ('_manager', '_entities', '_version')
+
+    def __init__(self, manager: 'EntityManager', entities: Dict[int, Entity], version: int) -> None:
+        self._manager: 'EntityManager' = manager
+        self._entities: Dict[int, Entity] = entities
+        self._version: int = version
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def is_stale(self) -> bool:
+        return self._manager.version != self._version
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __iter__(self) -> Iterator[Entity]:
+        if self.is_stale:
+            raise RuntimeError("Набор сущностей изменился после создания представления")
+        return iter(self._entities.values())
+
 
 class EntityManager:
-    def __init__(self, factory: EntityFactory) -> None:
+    # id = (поколение << INDEX_BITS) | индекс слота
+    INDEX_BITS: int = 20
+    INDEX_MASK: int = (1 << INDEX_BITS) - 1
+
+    def __init__(self, factory: EntityFactory, cell_size: float = 128.0) -> None:
         """
         Менеджер игровых сущностей:
         - хранит созданные сущности
-        - выдаёт уникальный id для каждой новой сущности
+        - выдаёт уникальный id для каждой новой сущности; индексы удалённых
+          сущностей переиспользуются, а поколение в старших битах id делает
+          устаревшие id недействительными
+        - поддерживает пространственную сетку для поиска соседей
+        - владеет движком пуль (ProjectileSystem)
+        - хранит кэш видимости относительно статичных препятствий
+        - ведёт версию статичных препятствий для навигационных сеток
+        - раскладывает данные сущностей по архетипам ECS (ComponentStore)
+        - ведёт индексы предметов, NPC и твёрдых сущностей и счётчик
+          живых враждебных NPC
+        - откладывает появление и удаление сущностей во время кадра
+          (spawn/despawn) до точки синхронизации apply_commands
         """
         self._factory: EntityFactory = factory
         self._entities: Dict[int, Entity] = {}
         self._next_id: int = 1
+        self._generations: Dict[int, int] = {}
+        self._free_indices: List[int] = []
+        self._grid: SpatialHashGrid = SpatialHashGrid(cell_size)
+        self._components: ComponentStore = ComponentStore()
+        # индексы id -> сущность в порядке добавления; обновляются
+        # при добавлении, удалении, смерти и смене отношения или твёрдости
+        self._items: Dict[int, Entity] = {}
+        self._npcs: Dict[int, Entity] = {}
+        self._solids: Dict[int, Entity] = {}
+        self._hostile_alive: int = 0
+        # версия структуры: растёт при каждом добавлении и удалении
+        self._version: int = 0
+        self._view: EntityView = EntityView(self, self._entities, 0)
+        self._commands: EntityCommandBuffer = EntityCommandBuffer()
+        self._projectiles: ProjectileSystem = ProjectileSystem(self)
+        self._line_of_sight: LineOfSightCache = LineOfSightCache(self)
+        self._obstacle_version: int = 0
+        # поле направлений к игроку; подключается уровнем
+        self._flow_field: Optional['FlowField'] = None
+        # навигационная сетка для индивидуальных маршрутов; подключается уровнем
+        self._navigation: Optional['NavigationGrid'] = None
 
     def create_entity(self, key: str, *args: Any, **kwargs: Any) -> Entity:
         """
@@ -22,11 +100,15 @@ class EntityManager:
         :param kwargs: именованные аргументы для конструктора сущности
         :return: уникальный идентификатор созданной сущности
         """
-        entity_id: int = self._next_id
-        self._next_id += 1
+        entity_id: int = self._allocate_id()
         entity: Entity = self._factory.create(key, entity_id=entity_id, *args, **kwargs)
         # Присваиваем id самой сущности (если у неё есть атрибут entity_id)
         self._entities[entity_id] = entity
+        self._grid.insert(entity)
+        self._components.add(entity)
+        self._index(entity)
+        self._structure_changed()
+        self.on_obstacle_changed(entity)
         return entity
 
     def add_existing_entity(self, entity: Entity) -> None:
@@ -37,10 +119,14 @@ class EntityManager:
         """
         if entity is None:
             return None
-        entity_id: int = self._next_id
-        self._next_id += 1
+        entity_id: int = self._allocate_id()
         entity.id = entity_id
         self._entities[entity.id] = entity
+        self._grid.insert(entity)
+        self._components.add(entity)
+        self._index(entity)
+        self._structure_changed()
+        self.on_obstacle_changed(entity)
 
     def get_entity_by_id(self, entity_id: int) -> Entity:
         """
@@ -61,16 +147,223 @@ class EntityManager:
         :param entity_id: идентификатор сущности
         :raises KeyError: если сущность не найдена
         """
-        if entity_id in self._entities:
-            del self._entities[entity_id]
+        entity = self._entities.pop(entity_id, None)
+        if entity is not None:
+            self._grid.remove(entity)
+            self._components.remove(entity)
+            self._unindex(entity_id, entity)
+            self._structure_changed()
+            self._release_id(entity_id)
+            self.on_obstacle_changed(entity)
+
+    def contains_id(self, entity_id: int) -> bool:
+        """True, если id принадлежит живой сущности (устаревшие id — False)."""
+        return entity_id in self._entities
+
+    def spawn(self, entity: Entity) -> None:
+        """Добавляет сущность в точке синхронизации (конец кадра)."""
+        self._commands.spawn(entity)
+
+    def despawn(self, entity: Entity) -> None:
+        """Удаляет сущность в точке синхронизации (конец кадра)."""
+        self._commands.despawn(entity)
+
+    def apply_commands(self) -> None:
+        """
+        Точка синхронизации: выполняет отложенные spawn/despawn в порядке
+        вызовов. Повторное удаление и удаление ещё не добавленной сущности
+        игнорируются.
+        """
+        if not len(self._commands):
+            return
+        for command, entity in self._commands.drain():
+            if command is EntityCommand.SPAWN:
+                self.add_existing_entity(entity)
+            elif self._entities.get(entity.id) is entity:
+                self.remove_entity_by_id(entity.id)
+
+    def _structure_changed(self) -> None:
+        self._version += 1
+        self._view = EntityView(self, self._entities, self._version)
+
+    def _index(self, entity: Entity) -> None:
+        mask: Component = entity.components
+        if mask & Component.PICKUP:
+            self._items[entity.id] = entity
+        if mask & Component.AI:
+            self._npcs[entity.id] = entity
+            if self._is_hostile_alive(entity):
+                self._hostile_alive += 1
+        if entity.is_solid:
+            self._solids[entity.id] = entity
+
+    def _unindex(self, entity_id: int, entity: Entity) -> None:
+        self._items.pop(entity_id, None)
+        if self._npcs.pop(entity_id, None) is not None and self._is_hostile_alive(entity):
+            self._hostile_alive -= 1
+        self._solids.pop(entity_id, None)
+
+    @staticmethod
+    def _is_hostile_alive(entity: Entity) -> bool:
+        return entity.is_alive and entity.is_hostile
+
+    def _allocate_id(self) -> int:
+        """Выдаёт id: сначала из списка свободных индексов, затем новый."""
+        if self._free_indices:
+            index: int = self._free_indices.pop()
+        else:
+            index = self._next_id
+            self._next_id += 1
+            if index > self.INDEX_MASK:
+                raise OverflowError("Превышено максимальное число сущностей")
+        return (self._generations.get(index, 0) << self.INDEX_BITS) | index
+
+    def _release_id(self, entity_id: int) -> None:
+        """Возвращает индекс в список свободных и увеличивает его поколение."""
+        index: int = entity_id & self.INDEX_MASK
+        self._generations[index] = (entity_id >> self.INDEX_BITS) + 1
+        self._free_indices.append(index)
+
+    def on_entity_moved(self, entity: Entity) -> None:
+        """
+        Вызывается сущностью после изменения позиции.
+        Обновляет её ячейки в пространственной сетке и строку позиций.
+        """
+        self._grid.update(entity)
+        self._components.write_position(entity)
+        self.on_obstacle_changed(entity)
+
+    def on_entity_died(self, entity: Entity) -> None:
+        """
+        Вызывается персонажем в момент смерти (уже с is_alive == False).
+        Мёртвые не твёрдые и не считаются живыми врагами.
+        """
+        if self._entities.get(entity.id) is not entity:
+            return
+        if entity.id in self._npcs and entity.is_hostile:
+            self._hostile_alive -= 1
+        self._solids.pop(entity.id, None)
+        self._components.write_alive(entity)
+
+    def on_attitude_changed(self, entity: Entity, was_hostile: bool) -> None:
+        """Вызывается NPC после смены отношения; поправляет счётчик живых врагов."""
+        if self._npcs.get(entity.id) is not entity or not entity.is_alive:
+            return
+        self._hostile_alive += int(entity.is_hostile) - int(was_hostile)
+
+    def on_solidity_changed(self, entity: Entity) -> None:
+        """Вызывается сущностью после изменения is_solid."""
+        if self._entities.get(entity.id) is entity:
+            if entity.is_solid:
+                self._solids[entity.id] = entity
+            else:
+                self._solids.pop(entity.id, None)
+        self.on_obstacle_changed(entity)
+
+    def on_obstacle_changed(self, entity: Entity) -> None:
+        """
+        Сбрасывает кэш видимости и увеличивает версию препятствий, если
+        изменилось статичное препятствие. Подвижные сущности их не затрагивают.
+        """
+        if entity.is_static:
+            self._line_of_sight.invalidate()
+            self._obstacle_version += 1
 
+    @property
+    def all_entities(self) -> EntityView:
+        """
+        Все управляемые сущности: представление без копирования,
+        действительное до следующего изменения структуры.
+        """
+        return self._view
+
+    @property
+    def version(self) -> int:
+        """Счётчик изменений набора сущностей."""
+        return self._version
+
+    @property
+    def projectiles(self) -> ProjectileSystem:
+        """Движок всех летящих пуль уровня."""
+        return self._projectiles
 
     @property
-    def all_entities(self) -> List[Entity]:
+    def line_of_sight(self) -> LineOfSightCache:
+        """Кэш прямой видимости относительно статичных препятствий."""
+        return self._line_of_sight
+
+    @property
+    def obstacle_version(self) -> int:
+        """Счётчик изменений статичных препятствий (для перестройки сеток)."""
+        return self._obstacle_version
+
+    @property
+    def flow_field(self) -> Optional['FlowField']:
+        """Общее поле направлений к игроку либо None."""
+        return self._flow_field
+
+    @flow_field.setter
+    def flow_field(self, flow_field: Optional['FlowField']) -> None:
+        self._flow_field = flow_field
+
+    @property
+    def navigation(self) -> Optional['NavigationGrid']:
+        """Навигационная сетка с поиском пути A* либо None."""
+        return self._navigation
+
+    @navigation.setter
+    def navigation(self, navigation: Optional['NavigationGrid']) -> None:
+        self._navigation = navigation
+
+    @property
+    def components(self) -> ComponentStore:
+        """Хранилище компонентов: данные сущностей по архетипам."""
+        return self._components
+
+    @property
+    def items(self) -> ValuesView[Entity]:
+        """Предметы уровня (вид без копирования; не менять менеджер во время обхода)."""
+        return self._items.values()
+
+    @property
+    def npcs(self) -> ValuesView[Entity]:
+        """NPC уровня, живые и мёртвые (вид без копирования)."""
+        return self._npcs.values()
+
+    @property
+    def solids(self) -> ValuesView[Entity]:
+        """Твёрдые сущности: объекты карты и живые персонажи (вид без копирования)."""
+        return self._solids.values()
+
+    @property
+    def hostile_count(self) -> int:
+        """Число живых враждебных NPC; обновляется инкрементально."""
+        return self._hostile_alive
+
+    def query(self, mask: Component) -> List[Entity]:
+        """Сущности, обладающие всеми компонентами ``mask``."""
+        return self._components.entities(mask)
+
+    @property
+    def grid(self) -> SpatialHashGrid:
+        """Пространственная сетка, используемая для широкой фазы."""
+        return self._grid
+
+    def query_area(self, x: float, y: float, width: float, height: float) -> List[Entity]:
         """
-        Возвращает список всех управляющихся сущностей.
+        Возвращает сущности из ячеек, перекрывающих прямоугольник (x, y, width, height).
+        Результат — кандидаты: точную проверку формы выполняет вызывающий код.
         """
-        return list(self._entities.values())
+        return self._grid.query_rect(x, y, width, height)
+
+    def query_radius(self, center: Tuple[float, float], radius: float) -> List[Entity]:
+        """Возвращает кандидатов из ячеек, перекрывающих круг с центром ``center``."""
+        cx, cy = center
+        return self._grid.query_rect(cx - radius, cy - radius, 2 * radius, 2 * radius)
+
+    def query_segment(self, start: Tuple[float, float], end: Tuple[float, float]) -> List[Entity]:
+        """Возвращает кандидатов из ячеек, через которые проходит отрезок start-end."""
+        return self._grid.query_segment(start, end)
 
     def can_move(self,
                  entity: 'Entity',
@@ -78,15 +371,16 @@ class EntityManager:
         """
         Возвращает True, если entity может переместиться в new_pos,
         не столкнувшись с твёрдыми объектами.
+        Проверяются только сущности из ячеек, перекрытых формой в new_pos.
         """
-        original: Tuple[float, float] = entity.position
-        entity.position = new_pos
+        # двигаем только форму, чтобы пробный шаг не трогал сетку
+        entity.sync_shape(new_pos)
         try:
-            for other in self.all_entities:
+            for other in self._grid.query_rect(*entity.shape.get_bounding_box()):
                 if other is entity or not other.is_solid:
                     continue
                 if entity.collides_with(other):
                     return False
             return True
         finally:
-            entity.position = original
\ No newline at end of file
+            entity.sync_shape(entity.position)
@@ -0,0 +1,174 @@
+import heapq
+import math
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from src.game.navigation import NEIGHBOURS, blocked_cells
+
+if TYPE_CHECKING:
+    from src.game.entity_manager import EntityManager
+
+
+Cell = Tuple[int, int]
+
+
+class FlowField:
+    """
+    Общее поле направлений к игроку для орды (Dijkstra по сетке).
+
+    Сетка покрывает мир ячейками ``cell_size``; ячейки, занятые статичными
+    твёрдыми объектами (с запасом ``clearance``), непроходимы. Поле
+    расстояний пересчитывается только когда цель переходит в другую
+    ячейку или меняются статичные препятствия, после чего любой NPC
+    получает направление движения за O(1) через ``direction_at``.
+    """
+
+    def __init__(
+        self,
+        entity_manager: 'EntityManager',
+        width: float,
+        height: float,
+        cell_size: float = 40.0,
+        clearance: float = 20.0,
+    ) -> None:
+        self._entity_manager: 'EntityManager' = entity_manager
+        self._cell_size: float = cell_size
+        self._clearance: float = clearance
+        self._cols: int = max(1, math.ceil(width / cell_size))
+        self._rows: int = max(1, math.ceil(height / cell_size))
+        self._blocked: np.ndarray = np.zeros((self._rows, self._cols), dtype=bool)
+        self._links: List[List[Tuple[int, float]]] = [[] for _ in range(self._rows * self._cols)]
+        self._distance: np.ndarray = np.full((self._rows, self._cols), np.inf)
+        self._dir_x: np.ndarray = np.zeros((self._rows, self._cols))
+        self._dir_y: np.ndarray = np.zeros((self._rows, self._cols))
+        self._goal_cell: Optional[Cell] = None
+        self._obstacle_version: int = -1
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    @property
+    def goal_cell(self) -> Optional[Cell]:
+        return self._goal_cell
+
+    def cell_of(self, position: Tuple[float, float]) -> Optional[Cell]:
+        """Ячейка (col, row) для точки мира либо None за пределами сетки."""
+        col: int = math.floor(position[0] / self._cell_size)
+        row: int = math.floor(position[1] / self._cell_size)
+        if 0 <= col < self._cols and 0 <= row < self._rows:
+            return col, row
+        return None
+
+    def leads_to(self, position: Tuple[float, float]) -> bool:
+        """True, если ``position`` лежит в ячейке текущей цели поля."""
+        return self._goal_cell is not None and self.cell_of(position) == self._goal_cell
+
+    def update(self, goal: Tuple[float, float]) -> None:
+        """
+        Обновляет поле под цель ``goal``. Пересчёт выполняется, только если
+        цель сменила ячейку или изменились статичные препятствия.
+        """
+        version: int = self._entity_manager.obstacle_version
+        obstacles_changed: bool = version != self._obstacle_version
+        if obstacles_changed:
+            self._rasterize_obstacles()
+            self._link_cells()
+            self._obstacle_version = version
+
+        goal_cell: Optional[Cell] = self.cell_of(goal)
+        if goal_cell == self._goal_cell and not obstacles_changed:
+            return
+        self._goal_cell = goal_cell
+        self._build(goal_cell)
+
+    def direction_at(self, position: Tuple[float, float]) -> Optional[Tuple[float, float]]:
+        """
+        Нормализованное направление к цели из ячейки ``position``.
+        None — точка вне сетки, в ячейке цели или цель недостижима.
+        """
+        cell: Optional[Cell] = self.cell_of(position)
+        if cell is None:
+            return None
+        col, row = cell
+        dx: float = float(self._dir_x[row, col])
+        dy: float = float(self._dir_y[row, col])
+        if dx == 0.0 and dy == 0.0:
+            return None
+        return dx, dy
+
+    # -------- protected helpers --------
+    def _rasterize_obstacles(self) -> None:
+        """Отмечает ячейки, занятые статичными препятствиями."""
+        self._blocked = blocked_cells(
+            self._entity_manager.solids, self._cols, self._rows, self._cell_size, self._clearance
+        )
+
+    def _link_cells(self) -> None:
+        """
+        Для каждой ячейки (плоский индекс ``row * cols + col``) строит список
+        проходимых соседей с ценой шага. Пересчитывается только вместе с
+        препятствиями, поэтому _build обходит готовые списки.
+        """
+        rows, cols = self._rows, self._cols
+        # за пределами сетки — как непроходимые ячейки
+        blocked: np.ndarray = np.pad(self._blocked, 1, constant_values=True)
+        links: List[List[Tuple[int, float]]] = [[] for _ in range(rows * cols)]
+        for d_col, d_row, cost in NEIGHBOURS:
+            allowed: np.ndarray = ~blocked[1 + d_row:1 + d_row + rows, 1 + d_col:1 + d_col + cols]
+            # по диагонали не срезаем углы препятствий
+            if d_col and d_row:
+                allowed &= ~blocked[1:1 + rows, 1 + d_col:1 + d_col + cols]
+                allowed &= ~blocked[1 + d_row:1 + d_row + rows, 1:1 + cols]
+            offset: int = d_row * cols + d_col
+            for i in np.flatnonzero(allowed).tolist():
+                links[i].append((i + offset, cost))
+        self._links = links
+
+    def _build(self, goal_cell: Optional[Cell]) -> None:
+        """Dijkstra от ячейки цели и выбор направления в каждой ячейке."""
+        self._dir_x[:, :] = 0.0
+        self._dir_y[:, :] = 0.0
+        if goal_cell is None:
+            self._distance = np.full((self._rows, self._cols), np.inf)
+            return
+
+        # обход на обычных списках Python: индексация скаляров NumPy
+        # в горячем цикле в разы дороже
+        links: List[List[Tuple[int, float]]] = self._links
+        goal_col, goal_row = goal_cell
+        goal: int = goal_row * self._cols + goal_col
+        distance: List[float] = [math.inf] * (self._rows * self._cols)
+        distance[goal] = 0.0
+        heap: List[Tuple[float, int]] = [(0.0, goal)]
+        while heap:
+            d, i = heapq.heappop(heap)
+            if d > distance[i]:
+                continue
+            for j, cost in links[i]:
+                nd: float = d + cost
+                if nd < distance[j]:
+                    distance[j] = nd
+                    heapq.heappush(heap, (nd, j))
+
+        self._distance = np.array(distance).reshape(self._rows, self._cols)
+        self._compute_directions(self._distance)
+
+    def _compute_directions(self, distance: np.ndarray) -> None:
+        """Для каждой ячейки выбирает соседа с минимальным расстоянием до цели."""
+        rows, cols = distance.shape
+        padded: np.ndarray = np.pad(distance, 1, constant_values=np.inf)
+        blocked: np.ndarray = np.pad(self._blocked, 1, constant_values=True)
+        best: np.ndarray = distance.copy()
+        for d_col, d_row, _ in NEIGHBOURS:
+            neighbour: np.ndarray = padded[1 + d_row:1 + d_row + rows, 1 + d_col:1 + d_col + cols]
+            if d_col and d_row:
+                side_a: np.ndarray = blocked[1:1 + rows, 1 + d_col:1 + d_col + cols]
+                side_b: np.ndarray = blocked[1 + d_row:1 + d_row + rows, 1:1 + cols]
+                neighbour = np.where(side_a | side_b, np.inf, neighbour)
+            better: np.ndarray = neighbour < best
+            best = np.where(better, neighbour, best)
+            norm: float = math.hypot(d_col, d_row)
+            self._dir_x[better] = d_col / norm
+            self._dir_y[better] = d_row / norm
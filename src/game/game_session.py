@@ -1,8 +1,9 @@
 from src.game.entity_factory import EntityFactory
 from src.game.level import Level
+from src.game.level_loader import LevelLoader
 from src.game.level_manager import LevelManager
 
-from src.settings import LEVEL_PATHS
+from src.settings import LEVEL_PATHS, LOADING_SLICE_MS, ASSET_DECODE_PROCESSES
 
 class GameSession:
     """
@@ -28,6 +29,22 @@ class GameSession:
         # чистим/инициализируем сущности (игрока, врагов, мусор и пр.)
         return self._current_level
 
+    def begin_level(self, level_num: int) -> LevelLoader:
+        """
+        Запускает фоновую загрузку уровня; уровень становится текущим,
+        когда загрузчик завершит работу (см. LevelLoader.update).
+        """
+        return LevelLoader(
+            self.level_manager.stream_level(level_num, self._entity_factory),
+            Level.asset_manifest(level_num),
+            on_loaded=self._set_current_level,
+            slice_ms=LOADING_SLICE_MS,
+            processes=ASSET_DECODE_PROCESSES,
+        )
+
+    def _set_current_level(self, level: 'Level') -> None:
+        self._current_level = level
+
     def save(self):
         # сохраняем текущую сессию
         pass
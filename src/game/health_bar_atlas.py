@@ -0,0 +1,69 @@
+import math
+from typing import Dict, List, Tuple
+
+import pygame
+
+from src.settings import HEALTH_BAR_BUCKETS
+
+
+class HealthBarAtlas:
+    """
+    Атлас заранее нарисованных шкал здоровья.
+
+    Доля здоровья квантуется на ``buckets`` ступеней; для каждой ширины
+    шкалы все ступени рисуются один раз (рамка, заливка от красного к
+    зелёному) при первом запросе этой ширины. Отрисовка шкалы — поиск в
+    атласе и один blit вместо двух ``pygame.draw.rect`` и расчёта цвета.
+    """
+
+    def __init__(self, buckets: int = 32, height: int = 6) -> None:
+        if buckets <= 0:
+            raise ValueError("Число ступеней шкалы должно быть положительным")
+        self._buckets: int = buckets
+        self._height: int = height
+        # ширина шкалы -> поверхности ступеней 0..buckets (с рамкой)
+        self._bars: Dict[int, List[pygame.Surface]] = {}
+
+    @property
+    def buckets(self) -> int:
+        return self._buckets
+
+    @property
+    def height(self) -> int:
+        """Высота шкалы без рамки."""
+        return self._height
+
+    def bucket(self, fraction: float) -> int:
+        """
+        Ступень для доли здоровья: округление вверх, чтобы раненый, но живой
+        персонаж не выглядел мёртвым, а полная шкала была только при полном здоровье.
+        """
+        if fraction >= 1.0:
+            return self._buckets
+        return min(self._buckets - 1, max(0, math.ceil(fraction * self._buckets)))
+
+    def bar(self, width: int, fraction: float) -> pygame.Surface:
+        """Шкала шириной ``width`` (плюс рамка в 1 px) для доли здоровья ``fraction``."""
+        bars: List[pygame.Surface] = self._bars.get(width)
+        if bars is None:
+            bars = [self._draw(width, step) for step in range(self._buckets + 1)]
+            self._bars[width] = bars
+        return bars[self.bucket(fraction)]
+
+    def clear(self) -> None:
+        self._bars.clear()
+
+    # -------- protected helpers --------
+    def _draw(self, width: int, step: int) -> pygame.Surface:
+        pct: float = step / self._buckets
+        # рамка: чёрный прямоугольник на 1 px шире шкалы с каждой стороны
+        surface: pygame.Surface = pygame.Surface((width + 2, self._height + 2))
+        surface.fill((0, 0, 0))
+        # цвет: зелёный (100 %) → красный (0 %)
+        color: Tuple[int, int, int] = (int(255 * (1.0 - pct)), int(255 * pct), 0)
+        surface.fill(color, pygame.Rect(1, 1, int(width * pct), self._height))
+        return surface.convert() if pygame.display.get_surface() is not None else surface
+
+
+# общий атлас для всех NPC
+health_bars: HealthBarAtlas = HealthBarAtlas(HEALTH_BAR_BUCKETS)
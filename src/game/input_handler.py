@@ -30,6 +30,8 @@ class PlayStateInputHandler:
         Преобразует события Pygame в команды для PlayerController.
         """
         controller = state.game_session.current_level.player_controller
+        # курсор — в координатах экрана, прицел — в координатах мира
+        camera = state.game_session.current_level.camera
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_a:
                 controller.start_move_left()
@@ -52,7 +54,7 @@ class PlayStateInputHandler:
                 controller.stop_move_vertical()
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # левая кнопка
-                controller.mouse_button_down(pygame.Vector2(event.pos))
+                controller.mouse_button_down(camera.screen_to_world(event.pos))
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:  # левая кнопка
                 controller.mouse_button_up()
@@ -62,7 +64,7 @@ class PlayStateInputHandler:
             elif event.y < 0:
                 controller.cycle_weapon(-1)
         elif event.type == pygame.MOUSEMOTION:
-            controller.update_aim(pygame.Vector2(event.pos))
+            controller.update_aim(camera.screen_to_world(event.pos))
 
 class PauseStateInputHandler:
     @staticmethod
@@ -1,16 +1,23 @@
-from typing import List, Tuple, Optional, Any
+from typing import List, Tuple, Optional, Any, Generator, Dict
 
 import pygame
 
-from src.entities.character import Character
 from src.entities.entity import Entity, CircleShape, RectangleShape
-from src.entities.item import Item
 from src.entities.map_entity import MapEntity
 from src.entities.npc import NPC, Attitude, ZombieDecisionModule
 from src.entities.player import PlayerController, Player
 from src.entities.weapon import Weapon, FireMode
 from src.game.entity_factory import EntityFactory
-from src.game.entity_manager import EntityManager
+from src.game.ai_scheduler import AIScheduler
+from src.game.asset_manager import assets
+from src.game.camera import Camera
+from src.game.component_store import Component
+from src.game.dirty_renderer import DirtyRectRenderer
+from src.game.entity_manager import EntityManager, EntityView
+from src.game.flow_field import FlowField
+from src.game.navigation import NavigationGrid
+from src.game.perception import PerceptionSystem
+from src.game.render_queue import RenderLayer, RenderQueue
 from src.settings import (PLAYER_IMAGE, PLAYER_WIDTH, PLAYER_HEIGHT,
                           AK_IMAGE, AK_WIDTH, AK_HEIGHT, AK_SOUND,
                           MINIGUN_IMAGE, MINIGUN_WIDTH, MINIGUN_HEIGHT, MINIGUN_SOUND,
@@ -19,7 +26,11 @@ from src.settings import (PLAYER_IMAGE, PLAYER_WIDTH, PLAYER_HEIGHT,
                           ZOMBIE_2_ALIVE_IMAGE, ZOMBIE_2_DEAD_IMAGE, ZOMBIE_2_WIDTH, ZOMBIE_2_HEIGHT,
                           ZOMBIE_DOG_1_ALIVE_IMAGE, ZOMBIE_DOG_1_DEAD_IMAGE, ZOMBIE_DOG_1_WIDTH, ZOMBIE_DOG_1_HEIGHT,
                           ROBOT_1_ALIVE_IMAGE, ROBOT_1_DEAD_IMAGE, ROBOT_1_WIDTH, ROBOT_1_HEIGHT,
-                          SCREEN_HEIGHT)
+                          SCREEN_HEIGHT,
+                          AI_DECISION_BUDGET, AI_NEAR_DISTANCE, AI_FAR_DISTANCE, AI_FAR_INTERVAL,
+                          FLOW_FIELD_CELL_SIZE, NAV_CELL_SIZE, NAV_PATH_CACHE_SIZE, NAV_PATH_BUDGET,
+                          CORPSE_BAKE_DELAY, CORPSE_MAX_LIVE,
+                          WORLD_WIDTH, WORLD_HEIGHT, CAMERA_CULL_MARGIN)
 from src.utils.level_file_manager import LevelFileManager
 
 
@@ -51,11 +62,35 @@ class Level:
         self._level_complete_message: str = level_complete_message
         # Фоновые настройки: изображение, анимация
         self._background: Optional[Any] = background
+        # фон общий с кэшем ресурсов; перед запеканием трупов делаем свою копию
+        self._owns_background: bool = False
+        # сколько секунд мертвы ещё не запечённые NPC
+        self._corpse_ages: Dict[NPC, float] = {}
         # Фоновая музыка для уровня
         self._music: Optional[str] = music
         self._entity_manager: EntityManager = EntityManager(entity_factory)
+        self._perception: PerceptionSystem = PerceptionSystem(self._entity_manager)
+        self._ai_scheduler: AIScheduler = AIScheduler(
+            budget=AI_DECISION_BUDGET,
+            near_distance=AI_NEAR_DISTANCE,
+            far_distance=AI_FAR_DISTANCE,
+            far_interval=AI_FAR_INTERVAL,
+        )
+        # мир не меньше экрана; камера показывает его часть вокруг игрока
+        world_width, world_height = self.world_size()
+        self._camera: Camera = Camera((SCREEN_WIDTH, SCREEN_HEIGHT), (world_width, world_height))
+        # одно поле погони на всю орду вместо наведения каждого NPC
+        self._entity_manager.flow_field = FlowField(
+            self._entity_manager, world_width, world_height, cell_size=FLOW_FIELD_CELL_SIZE
+        )
+        self._entity_manager.navigation = NavigationGrid(
+            self._entity_manager, world_width, world_height, cell_size=NAV_CELL_SIZE,
+            cache_size=NAV_PATH_CACHE_SIZE, budget=NAV_PATH_BUDGET
+        )
         self._player_controller: Optional[PlayerController] = player_controller
         self._is_completed: bool = False
+        # очередь отрисовки кадра, переиспользуется между кадрами
+        self._render_queue: RenderQueue = RenderQueue()
 
     @property
     def is_completed(self) -> bool:
@@ -94,7 +129,7 @@ class Level:
         return self._name
 
     @property
-    def entities(self) -> List[Entity]:
+    def entities(self) -> EntityView:
         return self._entity_manager.all_entities
 
     @property
@@ -105,19 +140,28 @@ class Level:
     def music(self) -> Optional[str]:
         return self._music
 
+    @property
+    def camera(self) -> Camera:
+        return self._camera
+
+    @staticmethod
+    def world_size() -> Tuple[int, int]:
+        """Размер мира уровня в пикселях (не меньше экрана)."""
+        return max(WORLD_WIDTH, SCREEN_WIDTH), max(WORLD_HEIGHT, SCREEN_HEIGHT)
+
     def add_entity(self, entity: Entity) -> None:
-        """Добавить игровую сущность на уровень."""
-        self.entity_manager.add_existing_entity(entity)
+        """Добавить игровую сущность на уровень (в конце ближайшего update)."""
+        self.entity_manager.spawn(entity)
 
     def remove_entity(self, entity: Entity) -> None:
-        """Удалить игровую сущность с уровня."""
-        self.entity_manager.remove_entity_by_id(entity.id)
+        """Удалить игровую сущность с уровня (в конце ближайшего update)."""
+        self.entity_manager.despawn(entity)
 
     def get_entities_in_area(self, area: Tuple[int, int, int, int]) -> List[Entity]:
         """Вернуть список сущностей в заданной прямоугольной зоне (x, y, w, h)."""
         x, y, w, h = area
         result: List[Entity] = []
-        for e in self.entities:
+        for e in self._entity_manager.query_area(x, y, w, h):
             ex, ey = e.position
             if x <= ex <= x + w and y <= ey <= y + h:
                 result.append(e)
@@ -125,14 +169,63 @@ class Level:
 
     def update(self, delta_time: float) -> None:
         """Обновить все сущности и триггеры на уровне."""
-        is_completed = True
-        for e in list(self.entities):
+        components = self._entity_manager.components
+        # решения ИИ разносятся по кадрам; восприятие считается одним
+        # пакетом только для NPC, которые думают на этом кадре;
+        # живые NPC берутся из столбца alive архетипов с ИИ
+        npcs: List[NPC] = [e for e in components.alive(Component.AI) if e.active]
+        focus: Optional[Tuple[float, float]] = (
+            self._player_controller.player.position if self._player_controller else None
+        )
+        # новый кадр — новый бюджет поисков пути
+        self._entity_manager.navigation.update()
+        if focus is not None:
+            # перестраивается, только когда игрок сменил ячейку поля
+            self._entity_manager.flow_field.update(focus)
+        self._perception.update(self._ai_scheduler.schedule(npcs, focus))
+        # представление без копирования: структура меняется только
+        # в apply_commands в конце кадра
+        for e in self._entity_manager.all_entities:
             e.update(delta_time)
-            if isinstance(e, NPC):
-                if (e.attitude==Attitude.HOSTILE) and e.is_alive:
-                    is_completed = False
-        self._is_completed = is_completed
+        # все пули продвигаются одним векторным шагом
+        self._entity_manager.projectiles.update(delta_time)
+        # счётчик живых врагов ведёт EntityManager — без обхода NPC
+        self._is_completed = self._entity_manager.hostile_count == 0
         self._check_item_pickup()
+        self._retire_corpses(components.alive(Component.AI, alive=False), delta_time)
+        # единственная точка структурных изменений за кадр
+        self._entity_manager.apply_commands()
+        if self._player_controller is not None:
+            self._camera.follow(self._player_controller.player.position)
+
+    def _retire_corpses(self, corpses: List[NPC], delta_time: float) -> None:
+        """
+        Запекает трупы NPC в слой фона и убирает их из EntityManager:
+        через CORPSE_BAKE_DELAY секунд после смерти, а если трупов больше
+        CORPSE_MAX_LIVE — сразу, начиная с самых старых. Так число сущностей
+        не растёт вместе с числом убитых.
+        """
+        ages: Dict[NPC, float] = self._corpse_ages
+        for npc in corpses:
+            ages[npc] = ages.get(npc, 0.0) + delta_time
+        overflow: int = len(corpses) - CORPSE_MAX_LIVE
+        corpses.sort(key=ages.__getitem__, reverse=True)
+        for i, npc in enumerate(corpses):
+            if i >= overflow and ages[npc] < CORPSE_BAKE_DELAY:
+                break
+            self._bake_corpse(npc)
+
+    def _bake_corpse(self, npc: NPC) -> None:
+        """Рисует труп в собственную копию фона и удаляет сущность с уровня."""
+        if not self._owns_background:
+            if self._background is None:
+                self._background = pygame.Surface(self._camera.world_size).convert()
+            else:
+                self._background = self._background.copy()
+            self._owns_background = True
+        npc.render(self._background)
+        self._corpse_ages.pop(npc, None)
+        self.remove_entity(npc)
 
     def _check_item_pickup(self) -> None:
         """Проверить, подобрал ли игрок предметы, и обработать сбор."""
@@ -140,47 +233,116 @@ class Level:
             return
 
         player: Entity = self._player_controller.player
-        for item in [e for e in self.entities if isinstance(e, Item)]:
-            if player.collides_with(item):
-                if not item.collectable or not item.active:
-                    continue
-                if hasattr(self._player_controller.player, "add_to_inventory"):
-                    self._player_controller.player.add_to_inventory(item)
-                self.remove_entity(item)
-
-    def render(self, surface: Any) -> None:
-        """Отрисовать тайл-карту, фон и все сущности."""
-        # Рисуем фон
-        if self._background:
-            surface.blit(self._background, (0, 0))
-        # Рисуем сущности
-        for e in self.entities:
-            if isinstance(e, Character):
-                if e.is_alive:
-                    continue
-            e.render(surface)
-        for e in self.entities:
-            if isinstance(e, Character):
-                if not e.is_alive:
-                    continue
-            e.render(surface)
+        # перебираются только предметы из индекса EntityManager; удаление
+        # отложено до apply_commands, поэтому индекс можно обходить напрямую
+        for item in self._entity_manager.items:
+            if not (item.collectable and item.active and player.collides_with(item)):
+                continue
+            if hasattr(player, "add_to_inventory"):
+                player.add_to_inventory(item)
+            self.remove_entity(item)
+
+    def render(self, surface: Any, dirty: Optional[DirtyRectRenderer] = None) -> None:
+        """
+        Отрисовать фон и сущности, попадающие в поле зрения камеры.
+        С ``dirty`` фон восстанавливается только там, где что-то было
+        нарисовано в прошлом кадре, а области сущностей отмечаются в нём.
+        """
+        view: pygame.Rect = self._camera.view_rect
+        offset: Tuple[int, int] = view.topleft
+        # Рисуем видимую часть фона
+        if dirty is not None:
+            dirty.restore(surface, self._background, offset)
+        elif self._background:
+            surface.blit(self._background, (0, 0), view)
+        # сущности раскладываются по слоям за один проход и выводятся пакетами
+        queue: RenderQueue = self._render_queue
+        for e in self._visible_entities(view):
+            e.submit(queue, offset)
+        projectiles = self._entity_manager.projectiles
+        queue.submit_draw(RenderLayer.PROJECTILES,
+                          lambda target: projectiles.render(target, offset, tuple(view)))
+        drawn: List[pygame.Rect] = queue.flush(surface)
+        if dirty is not None:
+            dirty.mark_all(drawn)
+
+    def _visible_entities(self, view: pygame.Rect) -> List[Entity]:
+        """
+        Сущности, чьи габариты пересекают поле зрения. Кандидаты берутся из
+        пространственной сетки, поэтому стоимость зависит от числа видимых,
+        а не всех сущностей. Запас CAMERA_CULL_MARGIN покрывает спрайты и
+        шкалы здоровья, выступающие за форму.
+        """
+        margin: int = CAMERA_CULL_MARGIN
+        candidates: List[Entity] = self._entity_manager.query_area(
+            view.x - margin, view.y - margin, view.width + 2 * margin, view.height + 2 * margin
+        )
+        visible: List[Entity] = [
+            e for e in candidates if self._camera.is_visible(e.shape.get_bounding_box(), margin)
+        ]
+        # порядок из сетки зависит от ячеек — сортируем, чтобы перекрытия не мерцали
+        visible.sort(key=lambda e: e.id)
+        return visible
 
     def get_picture(self, path: str, width: int, height: int) -> pygame.image:
-        picture = pygame.image.load(path).convert_alpha()
-        picture = pygame.transform.scale(picture, (width, height))
-        return picture
+        # общая поверхность из кэша: файл декодируется один раз за игру
+        return assets.image(path, (width, height))
+
+    @staticmethod
+    def describe(level_num: int) -> Tuple[str, str, str]:
+        """
+        (название, текст брифинга, текст завершения) уровня —
+        доступны до его загрузки, например для экрана брифинга.
+        """
+        return "Test level", "Убей всех врагов", "Уровень пройден"
+
+    @classmethod
+    def asset_manifest(cls, level_num: int) -> List[Tuple[str, Tuple[int, int]]]:
+        """
+        Картинки (путь, размер), которые использует ``load_steps``.
+        По этому списку фоновый поток декодирует их заранее.
+        """
+        return [
+            (str(LevelFileManager.get_level_bg_path(1)), cls.world_size()),
+            (PLAYER_IMAGE, (PLAYER_WIDTH, PLAYER_HEIGHT)),
+            (AK_IMAGE, (AK_WIDTH, AK_HEIGHT)),
+            (MINIGUN_IMAGE, (int(MINIGUN_WIDTH*1.2), int(MINIGUN_HEIGHT*1.2))),
+            (DEAD_TANK_IMAGE, (int(DEAD_TANK_WIDTH*1.2), int(DEAD_TANK_HEIGHT*1.2))),
+            (ZOMBIE_1_ALIVE_IMAGE, (ZOMBIE_1_WIDTH, ZOMBIE_1_HEIGHT)),
+            (ZOMBIE_1_DEAD_IMAGE, (ZOMBIE_1_WIDTH, ZOMBIE_1_HEIGHT)),
+            (ZOMBIE_DOG_1_ALIVE_IMAGE, (ZOMBIE_DOG_1_WIDTH, ZOMBIE_DOG_1_HEIGHT)),
+            (ZOMBIE_DOG_1_DEAD_IMAGE, (ZOMBIE_DOG_1_WIDTH, ZOMBIE_DOG_1_HEIGHT)),
+            (ROBOT_1_ALIVE_IMAGE, (ROBOT_1_WIDTH, ROBOT_1_HEIGHT)),
+            (ROBOT_1_DEAD_IMAGE, (ROBOT_1_WIDTH, ROBOT_1_HEIGHT)),
+        ]
 
     @classmethod
     def load_from_file(cls, path: str, level_num: int, entity_factory: EntityFactory) -> 'Level':
         """Загрузить уровень из JSON/YAML-файла."""
+        steps = cls.load_steps(path, level_num, entity_factory)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+
+    @classmethod
+    def load_steps(cls, path: str, level_num: int, entity_factory: EntityFactory
+                   ) -> Generator[float, None, 'Level']:
+        """
+        Пошаговая загрузка уровня: после каждого небольшого шага отдаёт
+        долю выполненной работы (0..1), готовый Level — значение StopIteration.
+        Позволяет строить уровень по кусочку за кадр (см. LevelLoader).
+        """
         # Реализация загрузчика (Parser + фабрики сущностей)
+        # шаги: уровень, оружие, 25 зомби, 5 собак, 5 роботов, игрок
+        steps_total: int = 2 + 5 * 5 + 5 + 5 + 1
+        steps_done: int = 0
         level_id="level_"+str(level_num)
-        level_name="Test level"
-        briefing_message="Убей всех врагов"
-        level_complete_message="Уровень пройден"
+        level_name, briefing_message, level_complete_message = cls.describe(level_num)
         level_bg_path = LevelFileManager.get_level_bg_path(1)
-        level_bg=pygame.image.load(level_bg_path).convert()
-        level_bg = pygame.transform.scale(level_bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        # фон растягивается на весь мир, экран показывает его часть
+        level_bg = assets.image(level_bg_path, cls.world_size(), alpha=False)
         level = Level(level_id=level_id,
                       level_num=level_num,
                       name=level_name,
@@ -188,6 +350,8 @@ class Level:
                       level_complete_message=level_complete_message,
                       entity_factory=entity_factory,
                       background=level_bg)
+        steps_done += 1
+        yield steps_done / steps_total
         player_image = level.get_picture(PLAYER_IMAGE, PLAYER_WIDTH, PLAYER_HEIGHT)
         player = Player(level.entity_manager,
                         0,
@@ -244,6 +408,8 @@ class Level:
                          RectangleShape(600, 500, MINIGUN_WIDTH, MINIGUN_HEIGHT),
                          fire_sound=MINIGUN_SOUND)
         level.entity_manager.add_existing_entity(minigun)
+        steps_done += 1
+        yield steps_done / steps_total
 
         tank_picture = level.get_picture(DEAD_TANK_IMAGE, int(DEAD_TANK_WIDTH*1.2), int(DEAD_TANK_HEIGHT*1.2))
         tank = MapEntity(level.entity_manager,
@@ -277,6 +443,8 @@ class Level:
                      picture_dead=zombie_dead_picture,
                      shape=CircleShape(200, 800, 25))
                 level.entity_manager.add_existing_entity(zombie)
+                steps_done += 1
+                yield steps_done / steps_total
 
         zombie_dog_alive_picture = level.get_picture(ZOMBIE_DOG_1_ALIVE_IMAGE, ZOMBIE_DOG_1_WIDTH, ZOMBIE_DOG_1_HEIGHT)
         zombie_dog_dead_picture = level.get_picture(ZOMBIE_DOG_1_DEAD_IMAGE, ZOMBIE_DOG_1_WIDTH, ZOMBIE_DOG_1_HEIGHT)
@@ -299,10 +467,13 @@ class Level:
                      picture_dead=zombie_dog_dead_picture,
                      shape=RectangleShape(200, 800, 30, 45))
             level.entity_manager.add_existing_entity(zombie_dog)
+            steps_done += 1
+            yield steps_done / steps_total
 
+        # одна картинка на всех роботов — общие записи в кэше поворотов
+        robot_alive_picture = level.get_picture(ROBOT_1_ALIVE_IMAGE, ROBOT_1_WIDTH, ROBOT_1_HEIGHT)
+        robot_dead_picture = level.get_picture(ROBOT_1_DEAD_IMAGE, ROBOT_1_WIDTH, ROBOT_1_HEIGHT)
         for i in range(5):
-            robot_alive_picture = level.get_picture(ROBOT_1_ALIVE_IMAGE, ROBOT_1_WIDTH, ROBOT_1_HEIGHT)
-            robot_dead_picture = level.get_picture(ROBOT_1_DEAD_IMAGE, ROBOT_1_WIDTH, ROBOT_1_HEIGHT)
             robot = NPC(level.entity_manager,
                      0,
                      900+i*100,
@@ -320,11 +491,18 @@ class Level:
                         picture_dead=robot_dead_picture,
                         shape=CircleShape(200, 800, 30))
             level.entity_manager.add_existing_entity(robot)
+            steps_done += 1
+            yield steps_done / steps_total
 
         level.entity_manager.add_existing_entity(player)
         player_controller = PlayerController(player)
         level._player_controller = player_controller
 
+        # навигационная сетка строится по статичным препятствиям уровня
+        level.entity_manager.navigation.rebuild()
+        # кадры манифеста, которые уровень так и не запросил, больше не понадобятся
+        assets.discard_decoded(cls.asset_manifest(level_num))
+        yield 1.0
         return level
 
     def save_to_file(self, path: str) -> None:
@@ -0,0 +1,103 @@
+import threading
+import time
+from typing import Callable, Generator, List, Optional, Tuple, TYPE_CHECKING
+
+from src.game.asset_manager import assets
+
+if TYPE_CHECKING:
+    from src.game.level import Level
+
+
+class LevelLoader:
+    """
+    Фоновая загрузка уровня, пока на экране брифинг.
+
+    Фаза 1 — рабочий поток читает и декодирует картинки из ``manifest``
+    (``AssetManager.preload``, без обращения к дисплею; при ``processes``
+    != 1 — пулом процессов).
+    Фаза 2 — главный поток в ``update`` продвигает пошаговую сборку уровня
+    (``Level.load_steps``) не дольше ``slice_ms`` за кадр: здесь
+    выполняются ``convert_alpha`` и создание сущностей.
+    Когда сборка завершена, вызывается ``on_loaded(level)``.
+    """
+
+    # доля прогресса, отведённая фазе декодирования
+    _DECODE_SHARE: float = 0.7
+
+    def __init__(
+        self,
+        steps: Generator[float, None, 'Level'],
+        manifest: List[Tuple[str, Optional[Tuple[int, int]]]],
+        on_loaded: Optional[Callable[['Level'], None]] = None,
+        slice_ms: float = 4.0,
+        processes: int = 1,
+    ) -> None:
+        self._steps: Generator[float, None, 'Level'] = steps
+        self._manifest: List[Tuple[str, Optional[Tuple[int, int]]]] = manifest
+        self._on_loaded: Optional[Callable[['Level'], None]] = on_loaded
+        self._slice: float = slice_ms / 1000.0
+        self._processes: int = processes
+        self._decoded: int = 0
+        self._build_progress: float = 0.0
+        self._level: Optional['Level'] = None
+        self._error: Optional[BaseException] = None
+        self._worker: threading.Thread = threading.Thread(
+            target=self._decode_all, name="level-loader", daemon=True
+        )
+        self._worker.start()
+
+    @property
+    def progress(self) -> float:
+        """Общий прогресс загрузки, 0..1."""
+        if self._level is not None:
+            return 1.0
+        decode: float = self._decoded / len(self._manifest) if self._manifest else 1.0
+        return self._DECODE_SHARE * decode + (1.0 - self._DECODE_SHARE) * self._build_progress
+
+    @property
+    def is_done(self) -> bool:
+        return self._level is not None
+
+    @property
+    def level(self) -> Optional['Level']:
+        """Готовый уровень или None, пока загрузка не завершена."""
+        return self._level
+
+    def update(self) -> None:
+        """
+        Вызывается каждый кадр на главном потоке. Пока идёт декодирование,
+        ничего не делает; затем выполняет шаги сборки уровня в пределах
+        временного окна. Ошибка рабочего потока пробрасывается здесь.
+        """
+        if self._error is not None:
+            raise self._error
+        if self._level is not None or self._worker.is_alive():
+            return
+
+        deadline: float = time.perf_counter() + self._slice
+        while time.perf_counter() < deadline:
+            try:
+                self._build_progress = next(self._steps)
+            except StopIteration as done:
+                self._level = done.value
+                if self._on_loaded is not None:
+                    self._on_loaded(self._level)
+                return
+
+    def finish(self) -> 'Level':
+        """Синхронно дожидается окончания загрузки и возвращает уровень."""
+        while self._level is None:
+            self._worker.join()
+            self._slice = float('inf')
+            self.update()
+        return self._level
+
+    # -------- protected helpers --------
+    def _decode_all(self) -> None:
+        try:
+            assets.preload(self._manifest, self._processes, on_decoded=self._count_decoded)
+        except BaseException as error:
+            self._error = error
+
+    def _count_decoded(self, _key: Tuple[str, Optional[Tuple[int, int]]]) -> None:
+        self._decoded += 1
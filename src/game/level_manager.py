@@ -1,4 +1,4 @@
-from typing import List, TYPE_CHECKING, Optional
+from typing import List, TYPE_CHECKING, Optional, Generator
 
 from src.game.entity_factory import EntityFactory
 
@@ -36,6 +36,18 @@ class LevelManager:
         self._current_level = Level.load_from_file(path, level_number, entity_factory)
         return self._current_level
 
+    def stream_level(self, level_number: int, entity_factory: 'EntityFactory'
+                     ) -> Generator[float, None, 'Level']:
+        """Пошаговая версия load_level (см. Level.load_steps)."""
+        from src.game.level import Level
+        if level_number < 1 or level_number > len(self._level_paths):
+            raise ValueError(f"Level number {level_number} out of range")
+        path: str = self._level_paths[level_number - 1]
+        level: 'Level' = yield from Level.load_steps(path, level_number, entity_factory)
+        self._current_index = level_number - 1
+        self._current_level = level
+        return level
+
     def has_next_level(self) -> bool:
         return self._current_index + 1 < len(self._level_paths)
 
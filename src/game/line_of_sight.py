@@ -0,0 +1,99 @@
+import math
+from typing import Dict, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from src.utils.geometry import segment_shape_entry
+
+if TYPE_CHECKING:
+    from src.game.entity_manager import EntityManager
+
+
+Cell = Tuple[int, int]
+
+
+class LineOfSightCache:
+    """
+    Кэш прямой видимости относительно статичных препятствий (MapEntity и т.п.).
+
+    Ключ — пара квантованных ячеек (наблюдатель, цель); результат считается
+    по отрезку между центрами этих ячеек. Кэш сбрасывается только когда
+    статичное твёрдое препятствие добавлено, удалено или сдвинуто, поэтому
+    повторные проверки между почти неподвижными точками почти бесплатны.
+    Подвижные препятствия (персонажи) кэш не учитывает.
+    """
+
+    def __init__(self, entity_manager: 'EntityManager', cell_size: float = 16.0,
+                 max_entries: int = 65536) -> None:
+        self._entity_manager: 'EntityManager' = entity_manager
+        self._cell_size: float = cell_size
+        self._max_entries: int = max_entries
+        self._cache: Dict[Tuple[Cell, Cell], bool] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def invalidate(self) -> None:
+        """Сбрасывает кэш (вызывается при изменении статичных препятствий)."""
+        self._cache.clear()
+
+    def is_clear(self, start: Tuple[float, float], end: Tuple[float, float]) -> bool:
+        """True, если между ячейками start и end нет статичных твёрдых препятствий."""
+        return self._lookup(self._cell_of(start), self._cell_of(end))
+
+    def clear_mask(self, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        """
+        Пакетный вариант ``is_clear`` для массивов отрезков формы (N, 2).
+
+        Отрезки квантуются разом, и кэш опрашивается один раз на каждую
+        уникальную пару ячеек.
+        """
+        if len(start) == 0:
+            return np.ones(0, dtype=bool)
+        cells: np.ndarray = np.floor(np.hstack([start, end]) / self._cell_size).astype(np.int64)
+        unique, inverse = np.unique(cells, axis=0, return_inverse=True)
+        clear: np.ndarray = np.array(
+            [self._lookup((a, b), (c, d)) for a, b, c, d in unique.tolist()], dtype=bool
+        )
+        return clear[inverse.ravel()]
+
+    # -------- protected helpers --------
+    def _lookup(self, start_cell: Cell, end_cell: Cell) -> bool:
+        key: Tuple[Cell, Cell] = (start_cell, end_cell)
+        clear = self._cache.get(key)
+        if clear is not None:
+            self._hits += 1
+            return clear
+
+        self._misses += 1
+        clear = self._trace(self._center_of(start_cell), self._center_of(end_cell))
+        if len(self._cache) >= self._max_entries:
+            self._cache.clear()
+        self._cache[key] = clear
+        # видимость симметрична
+        self._cache[(end_cell, start_cell)] = clear
+        return clear
+
+    def _trace(self, start: Tuple[float, float], end: Tuple[float, float]) -> bool:
+        for obstacle in self._entity_manager.query_segment(start, end):
+            if not (obstacle.is_static and obstacle.is_solid and obstacle.active):
+                continue
+            if segment_shape_entry(start, end, obstacle.shape) is not None:
+                return False
+        return True
+
+    def _cell_of(self, point: Tuple[float, float]) -> Cell:
+        return math.floor(point[0] / self._cell_size), math.floor(point[1] / self._cell_size)
+
+    def _center_of(self, cell: Cell) -> Tuple[float, float]:
+        return (cell[0] + 0.5) * self._cell_size, (cell[1] + 0.5) * self._cell_size
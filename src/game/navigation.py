@@ -0,0 +1,217 @@
+import heapq
+import math
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.entities.entity import Entity
+    from src.game.entity_manager import EntityManager
+
+
+Cell = Tuple[int, int]
+Point = Tuple[float, float]
+
+# (d_col, d_row, стоимость перехода)
+NEIGHBOURS: Tuple[Tuple[int, int, float], ...] = (
+    (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+    (1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)), (-1, 1, math.sqrt(2)), (-1, -1, math.sqrt(2)),
+)
+
+
+def blocked_cells(
+        entities: Iterable['Entity'],
+        cols: int,
+        rows: int,
+        cell_size: float,
+        clearance: float,
+) -> np.ndarray:
+    """
+    Матрица (rows, cols) непроходимых ячеек: центр ячейки лежит в
+    габарите статичного твёрдого объекта, расширенном на ``clearance``.
+    """
+    blocked: np.ndarray = np.zeros((rows, cols), dtype=bool)
+    centers_x: np.ndarray = (np.arange(cols) + 0.5) * cell_size
+    centers_y: np.ndarray = (np.arange(rows) + 0.5) * cell_size
+    for entity in entities:
+        if not (entity.is_static and entity.is_solid and entity.active):
+            continue
+        x, y, w, h = entity.shape.get_bounding_box()
+        in_cols: np.ndarray = (centers_x >= x - clearance) & (centers_x <= x + w + clearance)
+        in_rows: np.ndarray = (centers_y >= y - clearance) & (centers_y <= y + h + clearance)
+        blocked |= in_rows[:, None] & in_cols[None, :]
+    return blocked
+
+
+class NavigationGrid:
+    """
+    Навигационная сетка уровня и поиск пути A* для отдельных NPC.
+
+    Непроходимые ячейки строятся по статичным твёрдым объектам при загрузке
+    уровня и перестраиваются при изменении ``EntityManager.obstacle_version``.
+    Найденные пути хранятся в LRU-кэше по ключу (ячейка старта, ячейка цели),
+    а число новых поисков за кадр ограничено ``budget``: не уложившийся
+    запрос возвращает None и повторяется на следующих кадрах.
+    """
+
+    def __init__(
+        self,
+        entity_manager: 'EntityManager',
+        width: float,
+        height: float,
+        cell_size: float = 40.0,
+        clearance: float = 20.0,
+        cache_size: int = 256,
+        budget: int = 8,
+    ) -> None:
+        self._entity_manager: 'EntityManager' = entity_manager
+        self._cell_size: float = cell_size
+        self._clearance: float = clearance
+        self._cols: int = max(1, math.ceil(width / cell_size))
+        self._rows: int = max(1, math.ceil(height / cell_size))
+        self._blocked: np.ndarray = np.zeros((self._rows, self._cols), dtype=bool)
+        self._obstacle_version: int = -1
+        self._cache: 'OrderedDict[Tuple[Cell, Cell], Optional[List[Cell]]]' = OrderedDict()
+        self._cache_size: int = max(1, cache_size)
+        self._budget: int = max(1, budget)
+        self._searches_left: int = self._budget
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def rebuild(self) -> None:
+        """Перестраивает непроходимые ячейки и сбрасывает кэш путей."""
+        self._blocked = blocked_cells(
+            self._entity_manager.solids, self._cols, self._rows, self._cell_size, self._clearance
+        )
+        self._obstacle_version = self._entity_manager.obstacle_version
+        self._cache.clear()
+
+    def update(self) -> None:
+        """Начало кадра: восстанавливает бюджет поисков, при необходимости перестраивает сетку."""
+        self._searches_left = self._budget
+        if self._entity_manager.obstacle_version != self._obstacle_version:
+            self.rebuild()
+
+    def cell_of(self, position: Point) -> Cell:
+        """Ячейка (col, row) точки, прижатая к границам сетки."""
+        col: int = min(max(math.floor(position[0] / self._cell_size), 0), self._cols - 1)
+        row: int = min(max(math.floor(position[1] / self._cell_size), 0), self._rows - 1)
+        return col, row
+
+    def request_path(self, start: Point, goal: Point) -> Optional[List[Point]]:
+        """
+        Маршрут из ``start`` в ``goal`` списком точек (последняя — сама ``goal``).
+
+        Возвращает None, если цель недостижима или бюджет поисков на этом
+        кадре исчерпан.
+        """
+        start_cell: Cell = self.cell_of(start)
+        goal_cell: Cell = self.cell_of(goal)
+        key: Tuple[Cell, Cell] = (start_cell, goal_cell)
+        if key in self._cache:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            cells: Optional[List[Cell]] = self._cache[key]
+        else:
+            if self._searches_left <= 0:
+                return None
+            self._searches_left -= 1
+            self._misses += 1
+            cells = self._search(start_cell, goal_cell)
+            self._cache[key] = cells
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        if cells is None:
+            return None
+        return self._to_waypoints(start, cells, goal)
+
+    # -------- protected helpers --------
+    def _search(self, start: Cell, goal: Cell) -> Optional[List[Cell]]:
+        """A* по 8-связной сетке без срезания углов препятствий."""
+        blocked: np.ndarray = self._blocked
+        if blocked[goal[1], goal[0]]:
+            return None
+        if start == goal:
+            return [goal]
+
+        def heuristic(cell: Cell) -> float:
+            dx: int = abs(cell[0] - goal[0])
+            dy: int = abs(cell[1] - goal[1])
+            return max(dx, dy) + (math.sqrt(2) - 1) * min(dx, dy)
+
+        cost: Dict[Cell, float] = {start: 0.0}
+        came_from: Dict[Cell, Cell] = {}
+        heap: List[Tuple[float, float, Cell]] = [(heuristic(start), 0.0, start)]
+        while heap:
+            _, g, cell = heapq.heappop(heap)
+            if cell == goal:
+                path: List[Cell] = [cell]
+                while cell in came_from:
+                    cell = came_from[cell]
+                    path.append(cell)
+                path.reverse()
+                return path
+            if g > cost[cell]:
+                continue
+            col, row = cell
+            for d_col, d_row, step in NEIGHBOURS:
+                n_col, n_row = col + d_col, row + d_row
+                if not (0 <= n_col < self._cols and 0 <= n_row < self._rows) or blocked[n_row, n_col]:
+                    continue
+                if d_col and d_row and (blocked[row, n_col] or blocked[n_row, col]):
+                    continue
+                ng: float = g + step
+                neighbour: Cell = (n_col, n_row)
+                if ng < cost.get(neighbour, math.inf):
+                    cost[neighbour] = ng
+                    came_from[neighbour] = cell
+                    heapq.heappush(heap, (ng + heuristic(neighbour), ng, neighbour))
+        return None
+
+    def _to_waypoints(self, start: Point, cells: List[Cell], goal: Point) -> List[Point]:
+        """
+        Переводит цепочку ячеек в точки: центры ячеек с выпрямлением
+        (пропускаются точки, до которых следующая видна напрямую).
+        """
+        points: List[Point] = [self._center_of(c) for c in cells[1:-1]] + [goal]
+        waypoints: List[Point] = []
+        current: Point = start
+        i: int = 0
+        while i < len(points):
+            # самая дальняя точка, видимая из текущей
+            j: int = len(points) - 1
+            while j > i and not self._line_walkable(current, points[j]):
+                j -= 1
+            waypoints.append(points[j])
+            current = points[j]
+            i = j + 1
+        return waypoints
+
+    def _line_walkable(self, start: Point, end: Point) -> bool:
+        """Проходит ли отрезок только по свободным ячейкам (шаг — четверть ячейки)."""
+        length: float = math.hypot(end[0] - start[0], end[1] - start[1])
+        steps: int = max(1, math.ceil(length / (self._cell_size * 0.25)))
+        for k in range(steps + 1):
+            t: float = k / steps
+            col, row = self.cell_of((start[0] + (end[0] - start[0]) * t,
+                                     start[1] + (end[1] - start[1]) * t))
+            if self._blocked[row, col] and k > 0:
+                return False
+        return True
+
+    def _center_of(self, cell: Cell) -> Point:
+        return (cell[0] + 0.5) * self._cell_size, (cell[1] + 0.5) * self._cell_size
@@ -0,0 +1,87 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+
+Size = Tuple[int, int]
+ImagePair = Tuple[str, Optional[Size]]
+
+
+def decode_raw(path: str, size: Optional[Size]) -> Tuple[bytes, Size]:
+    """
+    Декодирует картинку и масштабирует до ``size``; возвращает сырые
+    пиксели RGBA и размеры. Выполняется в процессе-воркере, поэтому
+    не обращается к дисплею и возвращает только сериализуемые данные.
+    """
+    surface: pygame.Surface = pygame.image.load(path)
+    if size is not None:
+        surface = pygame.transform.scale(surface, size)
+    return pygame.image.tobytes(surface, 'RGBA'), surface.get_size()
+
+
+def decode_images(
+        pairs: List[ImagePair],
+        processes: int = 0,
+        on_decoded: Optional[Callable[[ImagePair], None]] = None,
+) -> Dict[ImagePair, pygame.Surface]:
+    """
+    Декодирует картинки (путь, размер) и возвращает поверхности без привязки
+    к экрану (``pygame.image.frombuffer``).
+
+    :param processes: число процессов; 0 — по числу ядер, 1 — последовательно
+                      в текущем процессе
+    :param on_decoded: вызывается для каждой готовой пары (для прогресса)
+    """
+    workers: int = processes or os.cpu_count() or 1
+    results: Dict[ImagePair, pygame.Surface] = {}
+
+    def accept(pair: ImagePair, raw: Tuple[bytes, Size]) -> None:
+        data, dimensions = raw
+        results[pair] = pygame.image.frombuffer(data, dimensions, 'RGBA')
+        if on_decoded is not None:
+            on_decoded(pair)
+
+    if workers <= 1 or len(pairs) <= 1:
+        for pair in pairs:
+            accept(pair, decode_raw(*pair))
+        return results
+
+    # spawn: дочерние процессы не наследуют состояние SDL и потоки родителя
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=min(workers, len(pairs)), mp_context=context) as pool:
+        futures = {pool.submit(decode_raw, path, size): (path, size) for path, size in pairs}
+        for future in as_completed(futures):
+            accept(futures[future], future.result())
+    return results
+
+
+def timing_report(pairs: List[ImagePair], processes: int = 0) -> str:
+    """Сравнивает время последовательного и параллельного декодирования ``pairs``."""
+    started: float = time.perf_counter()
+    decode_images(pairs, processes=1)
+    serial: float = time.perf_counter() - started
+
+    workers: int = processes or os.cpu_count() or 1
+    started = time.perf_counter()
+    decode_images(pairs, processes=workers)
+    parallel: float = time.perf_counter() - started
+
+    megabytes: float = sum(os.path.getsize(path) for path, _ in pairs) / (1024 * 1024)
+    return (
+        f"Картинок: {len(pairs)} ({megabytes:.1f} МБ PNG)\n"
+        f"Последовательно:  {serial:.3f} с\n"
+        f"Параллельно ({workers} проц.): {parallel:.3f} с\n"
+        f"Ускорение: {serial / parallel if parallel > 0 else float('inf'):.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    # замер: python -m src.game.parallel_decoder
+    from src.game.asset_manifest import startup_manifest
+    from src.settings import ASSET_DECODE_PROCESSES
+
+    print(timing_report(startup_manifest(), ASSET_DECODE_PROCESSES))
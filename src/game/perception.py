@@ -0,0 +1,146 @@
+import math
+from typing import List, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from src.entities.npc import NPC
+from src.game.component_store import Component
+from src.utils.geometry import segments_shapes_entry
+
+if TYPE_CHECKING:
+    from src.entities.entity import Entity
+    from src.game.entity_manager import EntityManager
+
+
+class PerceptionSystem:
+    """
+    Пакетный этап восприятия, выполняемый один раз за кадр для всех NPC.
+
+    Собирает живых NPC и все активные цели, затем массивами NumPy по всем
+    парам (наблюдатель, цель) отсекает по дальности и конусу ``vision_angle``
+    и проверяет отрезки взгляда: статичные препятствия — через общий
+    ``LineOfSightCache``, как ``NPC.perceive``, подвижные — пакетно
+    против формы каждого препятствия. Каждый NPC
+    получает готовый результат ``{'visible': [...]}`` через
+    ``NPC.set_perceptions`` и не вызывает ``perceive()`` сам.
+    """
+
+    # ограничение размера матрицы (пары × препятствия) за один проход
+    _MAX_BLOCK: int = 1 << 18
+
+    def __init__(self, entity_manager: 'EntityManager') -> None:
+        self._entity_manager: 'EntityManager' = entity_manager
+
+    def update(self, observers: Optional[List[NPC]] = None) -> None:
+        """
+        Считает видимость и раздаёт результаты NPC.
+
+        :param observers: NPC, принимающие решение на этом кадре;
+                          по умолчанию — все живые NPC
+        """
+        if observers is None:
+            observers = [e for e in self._entity_manager.npcs if e.is_alive and e.active]
+        if not observers:
+            return
+        targets: List['Entity'] = [e for e in self._entity_manager.all_entities if e.active]
+        obstacles: List['Entity'] = [e for e in self._entity_manager.solids if e.active]
+
+        for npc, visible in zip(observers, self.compute(observers, targets, obstacles)):
+            npc.set_perceptions({'visible': visible})
+
+    def compute(
+            self,
+            observers: List[NPC],
+            targets: List['Entity'],
+            obstacles: List['Entity'],
+    ) -> List[List['Entity']]:
+        """
+        Возвращает для каждого наблюдателя список видимых целей
+        (в порядке ``targets``).
+        """
+        visible: List[List['Entity']] = [[] for _ in observers]
+        if not targets:
+            return visible
+
+        # позиции — одной выборкой из столбцов хранилища компонентов
+        components = self._entity_manager.components
+        obs_pos: np.ndarray = components.read(observers, Component.POSITION)
+        obs_range: np.ndarray = np.array([o.vision_range for o in observers], dtype=np.float64)
+        obs_angle: np.ndarray = np.array([o.angle for o in observers], dtype=np.float64)
+        half_cone: np.ndarray = np.radians([o.vision_angle / 2.0 for o in observers])
+        obs_key: np.ndarray = np.array([id(o) for o in observers], dtype=np.int64)
+        tgt_pos: np.ndarray = components.read(targets, Component.POSITION)
+        tgt_key: np.ndarray = np.array([id(t) for t in targets], dtype=np.int64)
+
+        # --- дальность ---
+        diff: np.ndarray = tgt_pos[None, :, :] - obs_pos[:, None, :]
+        dist_sq: np.ndarray = np.einsum("ijk,ijk->ij", diff, diff)
+        mask: np.ndarray = dist_sq <= (obs_range * obs_range)[:, None]
+        mask &= obs_key[:, None] != tgt_key[None, :]
+
+        # --- конус обзора (угол NPC — в радианах) ---
+        facing: np.ndarray = np.stack([np.cos(obs_angle), np.sin(obs_angle)], axis=1)
+        along: np.ndarray = np.einsum("ijk,ik->ij", diff, facing)
+        in_cone: np.ndarray = along >= np.cos(half_cone)[:, None] * np.sqrt(dist_sq)
+        in_cone |= (half_cone >= math.pi)[:, None]
+        in_cone |= dist_sq == 0.0
+        mask &= in_cone
+
+        pair_obs, pair_tgt = np.nonzero(mask)
+        if len(pair_obs) == 0:
+            return visible
+
+        start: np.ndarray = obs_pos[pair_obs]
+        end: np.ndarray = tgt_pos[pair_tgt]
+        blocked: np.ndarray = np.zeros(len(pair_obs), dtype=bool)
+
+        # --- статичные препятствия: общий кэш прямой видимости ---
+        # (как и в NPC.perceive, статичная цель не должна заслонять себя,
+        #  поэтому для таких целей кэш не используется)
+        dynamic: List['Entity'] = [o for o in obstacles if not o.is_static]
+        static_obstacles: List['Entity'] = [o for o in obstacles if o.is_static]
+        tgt_static: np.ndarray = np.array([t.is_static for t in targets], dtype=bool)
+        cached: np.ndarray = ~tgt_static[pair_tgt]
+        if static_obstacles:
+            line_of_sight = self._entity_manager.line_of_sight
+            blocked[cached] = ~line_of_sight.clear_mask(start[cached], end[cached])
+
+        # --- оставшиеся твёрдые препятствия на линии взгляда ---
+        rest: np.ndarray = np.flatnonzero(cached & ~blocked)
+        self._block_pairs(blocked, rest, start, end, obs_key[pair_obs], tgt_key[pair_tgt], dynamic)
+        rest = np.flatnonzero(~cached)
+        self._block_pairs(blocked, rest, start, end, obs_key[pair_obs], tgt_key[pair_tgt],
+                          dynamic + static_obstacles)
+
+        seen: np.ndarray = ~blocked
+        for i, j in zip(pair_obs[seen].tolist(), pair_tgt[seen].tolist()):
+            visible[i].append(targets[j])
+        return visible
+
+    # -------- protected helpers --------
+    def _block_pairs(
+            self,
+            blocked: np.ndarray,
+            pairs: np.ndarray,
+            start: np.ndarray,
+            end: np.ndarray,
+            obs_key: np.ndarray,
+            tgt_key: np.ndarray,
+            obstacles: List['Entity'],
+    ) -> None:
+        """Отмечает в ``blocked`` пары из ``pairs``, чей отрезок пересекает препятствие."""
+        if not obstacles or len(pairs) == 0:
+            return
+        shapes = [o.shape for o in obstacles]
+        blocker_key: np.ndarray = np.array([id(o) for o in obstacles], dtype=np.int64)
+        step: int = max(1, self._MAX_BLOCK // len(obstacles))
+        for lo in range(0, len(pairs), step):
+            chunk: np.ndarray = pairs[lo:lo + step]
+            a: np.ndarray = start[chunk]
+            t: np.ndarray = segments_shapes_entry(a, end[chunk] - a, shapes)
+            # наблюдатель и сама цель не заслоняют взгляд
+            own: np.ndarray = (
+                (blocker_key[None, :] == obs_key[chunk][:, None])
+                | (blocker_key[None, :] == tgt_key[chunk][:, None])
+            )
+            blocked[chunk] = (np.isfinite(t) & ~own).any(axis=1)
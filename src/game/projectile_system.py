@@ -0,0 +1,300 @@
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+import pygame
+
+from src.entities.bullet import Bullet
+from src.utils.geometry import segment_pairs_entry
+
+if TYPE_CHECKING:
+    from src.entities.entity import Entity
+    from src.entities.weapon import Weapon
+    from src.game.entity_manager import EntityManager
+
+
+class ProjectileSystem:
+    """
+    Движок пуль в виде структуры массивов (NumPy).
+
+    Позиция, направление, скорость, оставшаяся дальность, урон и владелец
+    всех летящих пуль хранятся в массивах по слотам. За кадр пули
+    продвигаются и отсекаются одной векторной операцией. Попадания ищутся
+    по группам пуль, начинающих отрезок в одной ячейке сетки: каждая
+    группа получает кандидатов из своего небольшого габарита, а все пары
+    «пуля — кандидат» проверяются одним векторным вызовом.
+
+    ``Bullet`` — лёгкое представление одного слота для кода,
+    которому нужен объект (например, результат ``Weapon.fire``).
+    Представления создаются заранее, по одному на слот, и образуют пул:
+    выстрел берёт свободный слот вместе с его готовым Bullet, а
+    деактивация возвращает их обратно. Поэтому ссылку на Bullet нельзя
+    хранить после деактивации — объект достанется следующей пуле.
+    """
+
+    TRACER_LENGTH: int = 70
+    BULLET_RADIUS: int = 1
+    BULLET_COLOR: Tuple[int, int, int] = (255, 255, 255)
+
+    def __init__(self, entity_manager: 'EntityManager', capacity: int = 256) -> None:
+        self._entity_manager: 'EntityManager' = entity_manager
+        self._capacity: int = 0
+        self._alive: np.ndarray = np.zeros(0, dtype=bool)
+        self._position: np.ndarray = np.zeros((0, 2), dtype=np.float64)
+        self._direction: np.ndarray = np.zeros((0, 2), dtype=np.float64)
+        self._speed: np.ndarray = np.zeros(0, dtype=np.float64)
+        self._range_left: np.ndarray = np.zeros(0, dtype=np.float64)
+        self._damage: np.ndarray = np.zeros(0, dtype=np.float64)
+        # id() владельца — для векторного исключения «своих» попаданий
+        self._owner_key: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._owner: List[Optional['Entity']] = []
+        self._source: List[Optional['Weapon']] = []
+        # пул заранее созданных представлений, по одному на слот
+        self._views: List[Bullet] = []
+        self._free: List[int] = []
+        self._count: int = 0
+        self._grow(max(1, capacity))
+
+    def __len__(self) -> int:
+        """Количество летящих пуль."""
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    # -----------------
+    #  Slot access (для Bullet)
+    # -----------------
+
+    def is_alive(self, slot: int) -> bool:
+        return bool(self._alive[slot])
+
+    def position_of(self, slot: int) -> Tuple[float, float]:
+        x, y = self._position[slot]
+        return float(x), float(y)
+
+    def direction_of(self, slot: int) -> Tuple[float, float]:
+        dx, dy = self._direction[slot]
+        return float(dx), float(dy)
+
+    def speed_of(self, slot: int) -> float:
+        return float(self._speed[slot])
+
+    def range_left_of(self, slot: int) -> float:
+        return float(self._range_left[slot])
+
+    def damage_of(self, slot: int) -> float:
+        return float(self._damage[slot])
+
+    def owner_of(self, slot: int) -> Optional['Entity']:
+        return self._owner[slot]
+
+    def source_of(self, slot: int) -> Optional['Weapon']:
+        return self._source[slot]
+
+    # -----------------
+    #  Public methods
+    # -----------------
+
+    def spawn(
+        self,
+        position: Tuple[float, float],
+        direction: Tuple[float, float],
+        source: 'Weapon',
+        damage: Optional[float] = None,
+    ) -> 'Bullet':
+        """
+        Выпускает пулю из ``position`` в нормализованном направлении ``direction``.
+        Скорость, дальность и (по умолчанию) урон берутся из оружия-источника.
+        Возвращает Bullet из пула; новые объекты создаются, только если пул исчерпан.
+        """
+        if not self._free:
+            self._grow(self._capacity * 2)
+        slot: int = self._free.pop()
+        owner: Optional['Entity'] = getattr(source, "owner", None)
+
+        self._alive[slot] = True
+        self._position[slot] = position
+        self._direction[slot] = direction
+        self._speed[slot] = source.bullet_speed
+        self._range_left[slot] = source.firing_range
+        self._damage[slot] = source.attack_power if damage is None else damage
+        self._owner_key[slot] = id(owner) if owner is not None else 0
+        self._owner[slot] = owner
+        self._source[slot] = source
+        self._count += 1
+        return self._views[slot]
+
+    def despawn(self, slot: int) -> None:
+        """Возвращает слот и его Bullet в пул (повторный вызов безопасен)."""
+        if not self._alive[slot]:
+            return
+        self._alive[slot] = False
+        self._owner[slot] = None
+        self._source[slot] = None
+        self._free.append(slot)
+        self._count -= 1
+
+    def clear(self) -> None:
+        for slot in np.flatnonzero(self._alive).tolist():
+            self.despawn(slot)
+
+    def update(self, delta_time: float) -> None:
+        """
+        Продвигает все пули за кадр: ищет попадания на отрезках движения,
+        наносит урон и отсекает пули, исчерпавшие дальность.
+        """
+        if self._count == 0:
+            return
+
+        slots: np.ndarray = np.flatnonzero(self._alive)
+        start: np.ndarray = self._position[slots]
+        travel: np.ndarray = np.minimum(self._speed[slots] * delta_time, self._range_left[slots])
+        delta: np.ndarray = self._direction[slots] * travel[:, None]
+
+        hit_t: np.ndarray = self._resolve_hits(slots, start, delta)
+
+        # пули без попадания пролетают весь отрезок
+        t: np.ndarray = np.where(np.isfinite(hit_t), hit_t, 1.0)
+        self._position[slots] = start + delta * t[:, None]
+        self._range_left[slots] -= travel * t
+
+        finished: np.ndarray = np.isfinite(hit_t) | (self._range_left[slots] <= 0.0)
+        for slot in slots[finished].tolist():
+            self.despawn(slot)
+
+    def render(
+            self,
+            surface: Any,
+            offset: Tuple[float, float] = (0.0, 0.0),
+            view: Optional[Tuple[float, float, float, float]] = None,
+    ) -> List[pygame.Rect]:
+        """
+        Рисует трассеры и наконечники летящих пуль; возвращает их области экрана.
+        ``offset`` — мировые координаты левого верхнего угла экрана; если задан
+        ``view`` (x, y, w, h в мире), пули вне него не рисуются.
+        """
+        rects: List[pygame.Rect] = []
+        if self._count == 0:
+            return rects
+        slots: np.ndarray = np.flatnonzero(self._alive)
+        heads: np.ndarray = self._position[slots]
+        if view is not None:
+            x, y, w, h = view
+            pad: float = self.TRACER_LENGTH + self.BULLET_RADIUS
+            inside: np.ndarray = ((heads[:, 0] > x - pad) & (heads[:, 0] < x + w + pad)
+                                  & (heads[:, 1] > y - pad) & (heads[:, 1] < y + h + pad))
+            slots = slots[inside]
+            heads = heads[inside]
+        heads = heads - np.asarray(offset, dtype=float)
+        tails: np.ndarray = heads - self._direction[slots] * self.TRACER_LENGTH
+        color = self.BULLET_COLOR
+        radius: int = self.BULLET_RADIUS
+        draw_line = pygame.draw.line
+        draw_circle = pygame.draw.circle
+        for head, tail in zip(heads.astype(int).tolist(), tails.astype(int).tolist()):
+            line: pygame.Rect = draw_line(surface, color, tail, head, width=1)
+            rects.append(line.union(draw_circle(surface, color, head, radius)))
+        return rects
+
+    # -------- protected helpers --------
+    def _grow(self, capacity: int) -> None:
+        old: int = self._capacity
+        extra: int = capacity - old
+        self._alive = np.concatenate([self._alive, np.zeros(extra, dtype=bool)])
+        self._position = np.concatenate([self._position, np.zeros((extra, 2))])
+        self._direction = np.concatenate([self._direction, np.zeros((extra, 2))])
+        self._speed = np.concatenate([self._speed, np.zeros(extra)])
+        self._range_left = np.concatenate([self._range_left, np.zeros(extra)])
+        self._damage = np.concatenate([self._damage, np.zeros(extra)])
+        self._owner_key = np.concatenate([self._owner_key, np.zeros(extra, dtype=np.int64)])
+        self._owner.extend([None] * extra)
+        self._source.extend([None] * extra)
+        self._views.extend(Bullet(self, slot) for slot in range(old, capacity))
+        # новые слоты выдаются по возрастанию
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self._capacity = capacity
+
+    def _gather_pairs(self, slots: np.ndarray, start: np.ndarray,
+                      delta: np.ndarray) -> Tuple[np.ndarray, np.ndarray, List['Entity']]:
+        """
+        Широкая фаза по группам пуль: пули, чей отрезок начинается в одной
+        ячейке сетки, запрашивают твёрдые активные сущности в общем
+        небольшом габарите. Общий габарит всех пуль не используется — при
+        стрельбе веером он накрывает почти всю карту.
+
+        Возвращает строки пуль и номера целей для всех пар-кандидатов
+        (кроме владельца оружия) и список целей.
+        """
+        end: np.ndarray = start + delta
+        lo: np.ndarray = np.minimum(start, end)
+        hi: np.ndarray = np.maximum(start, end)
+        cells: np.ndarray = np.floor(lo / self._entity_manager.grid.cell_size).astype(np.int64)
+        keys: np.ndarray = (cells[:, 0] << 32) + cells[:, 1]
+        order: np.ndarray = np.argsort(keys, kind="stable")
+        sorted_keys: np.ndarray = keys[order]
+        firsts: np.ndarray = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        # габариты групп одним проходом
+        box_lo: List[List[float]] = np.minimum.reduceat(lo[order], firsts, axis=0).tolist()
+        box_hi: List[List[float]] = np.maximum.reduceat(hi[order], firsts, axis=0).tolist()
+        sizes: List[int] = np.diff(np.r_[firsts, len(order)]).tolist()
+
+        targets: List['Entity'] = []
+        column_of: Dict['Entity', int] = {}
+        # число кандидатов каждой пули (в порядке order) и номера целей всех пар
+        per_row: List[int] = []
+        pair_cols: List[int] = []
+        query_area = self._entity_manager.query_area
+        for (min_x, min_y), (max_x, max_y), size in zip(box_lo, box_hi, sizes):
+            columns: List[int] = []
+            for target in query_area(min_x, min_y, max_x - min_x, max_y - min_y):
+                if not (target.active and target.is_solid):
+                    continue
+                column: Optional[int] = column_of.get(target)
+                if column is None:
+                    column = column_of[target] = len(targets)
+                    targets.append(target)
+                columns.append(column)
+            per_row.extend([len(columns)] * size)
+            pair_cols.extend(columns * size)
+
+        rows_all: np.ndarray = np.repeat(order, per_row)
+        cols_all: np.ndarray = np.array(pair_cols, dtype=np.intp)
+        if not targets:
+            return rows_all, cols_all, targets
+        # владелец оружия не может попасть сам в себя
+        target_keys: np.ndarray = np.array([id(e) for e in targets], dtype=np.int64)
+        own: np.ndarray = self._owner_key[slots[rows_all]] == target_keys[cols_all]
+        return rows_all[~own], cols_all[~own], targets
+
+    def _resolve_hits(self, slots: np.ndarray, start: np.ndarray, delta: np.ndarray) -> np.ndarray:
+        """
+        Возвращает для каждой пули параметр t ∈ [0, 1] первого попадания
+        (``inf`` — промах) и наносит урон поражённым целям.
+        """
+        hit_t: np.ndarray = np.full(len(slots), np.inf)
+        pair_rows, pair_cols, targets = self._gather_pairs(slots, start, delta)
+        if not len(pair_rows):
+            return hit_t
+
+        pair_t: np.ndarray = segment_pairs_entry(
+            start[pair_rows], delta[pair_rows], [e.shape for e in targets], pair_cols
+        )
+
+        # только пары с пересечением: по пулям, внутри пули — вдоль траектории
+        hits: np.ndarray = np.flatnonzero(np.isfinite(pair_t))
+        hits = hits[np.lexsort((pair_t[hits], pair_rows[hits]))]
+        rows: List[int] = pair_rows[hits].tolist()
+        columns: List[int] = pair_cols[hits].tolist()
+        for row, column, t in zip(rows, columns, pair_t[hits].tolist()):
+            if np.isfinite(hit_t[row]):
+                continue
+            target: 'Entity' = targets[column]
+            # цель могла погибнуть от предыдущей пули этого кадра —
+            # тогда берётся следующая по траектории
+            if not (target.active and target.is_solid):
+                continue
+            if hasattr(target, "take_damage") and callable(getattr(target, "take_damage")):
+                target.take_damage(float(self._damage[slots[row]]))  # type: ignore[attr-defined]
+            hit_t[row] = t
+        return hit_t
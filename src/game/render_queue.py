@@ -0,0 +1,67 @@
+from enum import IntEnum
+from typing import Callable, Iterable, List, Tuple
+
+import pygame
+
+
+class RenderLayer(IntEnum):
+    """Слои отрисовки снизу вверх."""
+    GROUND = 0       # статичные объекты карты
+    CORPSES = 1      # мёртвые персонажи
+    ITEMS = 2        # предметы и оружие на земле
+    PROJECTILES = 3  # пули — под живыми персонажами
+    ACTORS = 4       # живые персонажи
+    HUD = 5          # шкалы здоровья и прочие надписи над миром
+
+
+DrawCommand = Callable[[pygame.Surface], Iterable[pygame.Rect]]
+
+
+class RenderQueue:
+    """
+    Очередь отрисовки кадра по слоям.
+
+    Сущности не рисуют сами, а отправляют команды ``submit`` (поверхность
+    и её экранный прямоугольник) в свой слой. ``flush`` выводит слои по
+    порядку, каждый — одним вызовом ``Surface.fblits`` (``blits`` в
+    старых pygame) вместо отдельного ``blit`` на сущность. Примитивы,
+    которые нельзя выразить картинкой (линии трассеров), отправляются
+    через ``submit_draw`` и выполняются после картинок своего слоя.
+    """
+
+    def __init__(self) -> None:
+        self._blits: List[List[Tuple[pygame.Surface, pygame.Rect]]] = [[] for _ in RenderLayer]
+        self._draws: List[List[DrawCommand]] = [[] for _ in RenderLayer]
+
+    def submit(self, layer: RenderLayer, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """Вывести ``surface`` в левый верхний угол ``rect`` на слое ``layer``."""
+        self._blits[layer].append((surface, rect))
+
+    def submit_draw(self, layer: RenderLayer, draw: DrawCommand) -> None:
+        """Отложенная отрисовка примитивов: ``draw(surface)`` возвращает изменённые области."""
+        self._draws[layer].append(draw)
+
+    def flush(self, target: pygame.Surface) -> List[pygame.Rect]:
+        """Рисует все слои на ``target``, очищает очередь и возвращает изменённые области."""
+        rects: List[pygame.Rect] = []
+        for layer in RenderLayer:
+            blits = self._blits[layer]
+            if blits:
+                self._blit_all(target, blits)
+                rects.extend(rect for _, rect in blits)
+                blits.clear()
+            draws = self._draws[layer]
+            if draws:
+                for draw in draws:
+                    rects.extend(draw(target))
+                draws.clear()
+        return rects
+
+    # -------- protected helpers --------
+    @staticmethod
+    def _blit_all(target: pygame.Surface, blits: List[Tuple[pygame.Surface, pygame.Rect]]) -> None:
+        fblits = getattr(target, 'fblits', None)
+        if fblits is not None:
+            fblits(blits)
+        else:
+            target.blits(blits, doreturn=False)
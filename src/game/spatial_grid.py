@@ -0,0 +1,171 @@
+import math
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.entities.entity import Entity
+
+
+CellRange = Tuple[int, int, int, int]
+
+
+class SpatialHashGrid:
+    """
+    Равномерная хеш-сетка для широкой фазы поиска соседей.
+
+    Каждая сущность регистрируется во всех ячейках, которые перекрывает
+    ограничивающий прямоугольник её формы. Запросы по области проверяют
+    только сущности из перекрытых ячеек, а не весь мир.
+    """
+
+    def __init__(self, cell_size: float = 128.0) -> None:
+        if cell_size <= 0:
+            raise ValueError("Размер ячейки должен быть положительным")
+        self._cell_size: float = cell_size
+        # ячейка -> сущности в ней (dict сохраняет порядок вставки)
+        self._cells: Dict[Tuple[int, int], Dict['Entity', None]] = {}
+        # сущность -> диапазон занимаемых ячеек (min_cx, min_cy, max_cx, max_cy)
+        self._entity_cells: Dict['Entity', CellRange] = {}
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    def __contains__(self, entity: 'Entity') -> bool:
+        return entity in self._entity_cells
+
+    def __len__(self) -> int:
+        return len(self._entity_cells)
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Возвращает координаты ячейки, содержащей точку (x, y)."""
+        return math.floor(x / self._cell_size), math.floor(y / self._cell_size)
+
+    def insert(self, entity: 'Entity') -> None:
+        """Регистрирует сущность в сетке (повторная вставка обновляет ячейки)."""
+        if entity in self._entity_cells:
+            self.update(entity)
+            return
+        cell_range: CellRange = self._cell_range(*entity.shape.get_bounding_box())
+        self._entity_cells[entity] = cell_range
+        self._add_to_cells(entity, cell_range)
+
+    def remove(self, entity: 'Entity') -> None:
+        """Удаляет сущность из сетки; отсутствующие сущности игнорируются."""
+        cell_range = self._entity_cells.pop(entity, None)
+        if cell_range is not None:
+            self._remove_from_cells(entity, cell_range)
+
+    def update(self, entity: 'Entity') -> None:
+        """
+        Пересчитывает ячейки сущности после перемещения.
+        Если набор ячеек не изменился, сетка не трогается.
+        """
+        old_range = self._entity_cells.get(entity)
+        if old_range is None:
+            return
+        new_range: CellRange = self._cell_range(*entity.shape.get_bounding_box())
+        if new_range == old_range:
+            return
+        self._remove_from_cells(entity, old_range)
+        self._entity_cells[entity] = new_range
+        self._add_to_cells(entity, new_range)
+
+    def query_rect(self, x: float, y: float, width: float, height: float) -> List['Entity']:
+        """
+        Возвращает сущности, чьи ячейки перекрывают прямоугольник (x, y, width, height).
+        Это широкая фаза: точную проверку формы выполняет вызывающий код.
+        """
+        min_cx, min_cy, max_cx, max_cy = self._cell_range(x, y, width, height)
+        cells = self._cells
+        if min_cx == max_cx and min_cy == max_cy:
+            bucket = cells.get((min_cx, min_cy))
+            return list(bucket) if bucket else []
+
+        found: Dict['Entity', None] = {}
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return list(found)
+
+    def query_segment(self, start: Tuple[float, float], end: Tuple[float, float]) -> List['Entity']:
+        """
+        Возвращает сущности из ячеек, через которые проходит отрезок start-end.
+
+        Ячейки обходятся алгоритмом DDA (Amanatides–Woo) в порядке движения
+        от start к end, поэтому длинный диагональный отрезок затрагивает
+        O(длина / cell_size) ячеек, а не весь свой габаритный прямоугольник.
+        """
+        size: float = self._cell_size
+        x0, y0 = start
+        x1, y1 = end
+        cx, cy = self.cell_of(x0, y0)
+        end_cx, end_cy = self.cell_of(x1, y1)
+        dx: float = x1 - x0
+        dy: float = y1 - y0
+
+        step_x: int = 1 if dx > 0 else -1
+        step_y: int = 1 if dy > 0 else -1
+        if dx != 0.0:
+            boundary_x: float = (cx + 1) * size if dx > 0 else cx * size
+            t_max_x: float = (boundary_x - x0) / dx
+            t_delta_x: float = size / abs(dx)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if dy != 0.0:
+            boundary_y: float = (cy + 1) * size if dy > 0 else cy * size
+            t_max_y: float = (boundary_y - y0) / dy
+            t_delta_y: float = size / abs(dy)
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        cells = self._cells
+        found: Dict['Entity', None] = {}
+        for _ in range(abs(end_cx - cx) + abs(end_cy - cy) + 1):
+            bucket = cells.get((cx, cy))
+            if bucket:
+                found.update(bucket)
+            if t_max_x < t_max_y:
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                cy += step_y
+                t_max_y += t_delta_y
+        return list(found)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._entity_cells.clear()
+
+    # -------- protected helpers --------
+    def _cell_range(self, x: float, y: float, width: float, height: float) -> CellRange:
+        size: float = self._cell_size
+        return (
+            math.floor(x / size),
+            math.floor(y / size),
+            math.floor((x + width) / size),
+            math.floor((y + height) / size),
+        )
+
+    def _add_to_cells(self, entity: 'Entity', cell_range: CellRange) -> None:
+        min_cx, min_cy, max_cx, max_cy = cell_range
+        cells = self._cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    bucket = cells[(cx, cy)] = {}
+                bucket[entity] = None
+
+    def _remove_from_cells(self, entity: 'Entity', cell_range: CellRange) -> None:
+        min_cx, min_cy, max_cx, max_cy = cell_range
+        cells = self._cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                bucket.pop(entity, None)
+                if not bucket:
+                    del cells[(cx, cy)]
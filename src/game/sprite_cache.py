@@ -0,0 +1,82 @@
+from collections import OrderedDict
+from typing import Tuple
+
+import pygame
+
+from src.settings import SPRITE_ROTATION_STEP, SPRITE_CACHE_MAX_MB
+
+
+class RotationCache:
+    """
+    Кэш повёрнутых спрайтов.
+
+    Угол квантуется с шагом ``step`` градусов, ключ — (исходная поверхность,
+    номер шага), поэтому сущности с общей картинкой (например, все зомби
+    одного вида) используют одни и те же записи. Суммарный объём повёрнутых
+    поверхностей ограничен ``max_bytes``; при переполнении вытесняются
+    давно не использованные записи (LRU).
+    """
+
+    def __init__(self, step: float = 2.0, max_bytes: int = 64 * 1024 * 1024) -> None:
+        if step <= 0:
+            raise ValueError("Шаг квантования угла должен быть положительным")
+        self._step: float = step
+        self._steps: int = max(1, round(360.0 / step))
+        self._max_bytes: int = max_bytes
+        # запись хранит и исходную поверхность, чтобы её id не переиспользовался
+        self._entries: 'OrderedDict[Tuple[int, int], Tuple[pygame.Surface, pygame.Surface, int]]' = OrderedDict()
+        self._bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def memory(self) -> int:
+        """Объём закэшированных поверхностей в байтах."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def rotate(self, surface: pygame.Surface, angle: float) -> pygame.Surface:
+        """
+        Аналог ``pygame.transform.rotate(surface, angle)`` (угол в градусах,
+        против часовой стрелки) с квантованием угла и кэшированием.
+        """
+        index: int = round(angle / self._step) % self._steps
+        key: Tuple[int, int] = (id(surface), index)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        self._misses += 1
+        rotated: pygame.Surface = pygame.transform.rotate(surface, index * self._step)
+        size: int = rotated.get_width() * rotated.get_height() * rotated.get_bytesize()
+        self._entries[key] = (surface, rotated, size)
+        self._bytes += size
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+        return rotated
+
+
+# общий кэш для всех сущностей
+rotation_cache: RotationCache = RotationCache(SPRITE_ROTATION_STEP, SPRITE_CACHE_MAX_MB * 1024 * 1024)
+
+
+def rotate(surface: pygame.Surface, angle: float) -> pygame.Surface:
+    """Поворот спрайта через общий кэш ``rotation_cache``."""
+    return rotation_cache.rotate(surface, angle)
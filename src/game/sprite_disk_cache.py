@@ -0,0 +1,96 @@
+import hashlib
+import os
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+import src.settings as settings
+
+
+Size = Tuple[int, int]
+
+
+class SpriteDiskCache:
+    """
+    Дисковый кэш заранее масштабированных спрайтов.
+
+    Для пары (картинка, размер) хранится файл с сырыми пикселями RGBA,
+    который загружается через ``pygame.image.frombuffer`` без декодирования
+    PNG. Имя файла содержит хэш содержимого исходной картинки, поэтому
+    после её изменения запись просто не находится и пересобирается.
+    Кэш заполняется сборкой (``build``) или при первом промахе (``store``).
+    """
+
+    _FORMAT: str = 'RGBA'
+
+    def __init__(self, cache_dir: str) -> None:
+        self._cache_dir: str = cache_dir
+        self._hashes: Dict[str, str] = {}
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def load(self, path: str, size: Size) -> Optional[pygame.Surface]:
+        """Масштабированный спрайт из кэша либо None, если записи нет."""
+        entry: Optional[str] = self._entry_path(path, size)
+        if entry is None or not os.path.exists(entry):
+            return None
+        with open(entry, 'rb') as f:
+            data: bytes = f.read()
+        if len(data) != size[0] * size[1] * 4:
+            return None  # повреждённая запись — пересоберётся при store
+        return pygame.image.frombuffer(data, size, self._FORMAT)
+
+    def store(self, path: str, size: Size, surface: pygame.Surface) -> None:
+        """Сохраняет масштабированный спрайт (запись атомарна: tmp + replace)."""
+        entry: Optional[str] = self._entry_path(path, size)
+        if entry is None:
+            return
+        os.makedirs(self._cache_dir, exist_ok=True)
+        tmp: str = entry + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(pygame.image.tobytes(surface, self._FORMAT))
+        os.replace(tmp, entry)
+
+    def build(self, pairs: List[Tuple[str, Size]]) -> int:
+        """
+        Собирает отсутствующие записи для пар (картинка, размер).
+        Возвращает число собранных записей.
+        """
+        built: int = 0
+        for path, size in pairs:
+            if self.load(path, size) is not None:
+                continue
+            picture: pygame.Surface = pygame.image.load(path)
+            self.store(path, size, pygame.transform.scale(picture, size))
+            built += 1
+        return built
+
+    # -------- protected helpers --------
+    def _entry_path(self, path: str, size: Size) -> Optional[str]:
+        digest: Optional[str] = self._content_hash(path)
+        if digest is None:
+            return None
+        stem: str = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self._cache_dir, f"{stem}_{size[0]}x{size[1]}_{digest}.rgba")
+
+    def _content_hash(self, path: str) -> Optional[str]:
+        digest: Optional[str] = self._hashes.get(path)
+        if digest is None:
+            try:
+                with open(path, 'rb') as f:
+                    digest = hashlib.sha1(f.read()).hexdigest()[:16]
+            except OSError:
+                return None
+            self._hashes[path] = digest
+        return digest
+
+
+if __name__ == "__main__":
+    # сборка кэша заранее: python -m src.game.sprite_disk_cache
+    from src.game.asset_manifest import startup_manifest
+
+    cache = SpriteDiskCache(settings.SPRITE_DISK_CACHE_DIR)
+    pairs = startup_manifest()
+    print(f"Собрано {cache.build(pairs)} из {len(pairs)} спрайтов в {cache.cache_dir}")
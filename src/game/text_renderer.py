@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from src.settings import TEXT_CACHE_SIZE
+
+
+FontKey = Tuple[Optional[str], int, bool]
+Color = Tuple[int, ...]
+
+
+class TextRenderer:
+    """
+    Сервис отрисовки текста.
+
+    Шрифты кэшируются по ключу (гарнитура, размер, системный ли), готовые
+    поверхности строк — в LRU-кэше по ключу (текст, шрифт, цвет, сглаживание).
+    Неизменившаяся строка HUD или пункт меню берутся из кэша, а не
+    рендерятся заново каждый кадр. Поверхности общие — изменять их нельзя.
+    """
+
+    def __init__(self, max_surfaces: int = 512) -> None:
+        self._fonts: Dict[FontKey, pygame.font.Font] = {}
+        self._surfaces: 'OrderedDict[Tuple[str, FontKey, Color, bool], pygame.Surface]' = OrderedDict()
+        self._max_surfaces: int = max(1, max_surfaces)
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def font(self, face: Optional[str], size: int, system: bool = False) -> pygame.font.Font:
+        """
+        Шрифт ``face`` размера ``size``: ``pygame.font.SysFont`` при
+        ``system``, иначе ``pygame.font.Font`` (``None`` — шрифт по умолчанию).
+        """
+        key: FontKey = (face, size, system)
+        font: Optional[pygame.font.Font] = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(face, size) if system else pygame.font.Font(face, size)
+            self._fonts[key] = font
+        return font
+
+    def render(
+            self,
+            text: str,
+            color: Color,
+            size: int,
+            face: Optional[str] = None,
+            system: bool = False,
+            antialias: bool = True,
+    ) -> pygame.Surface:
+        """Поверхность со строкой ``text``; повторный вызов с тем же ключом — из кэша."""
+        font_key: FontKey = (face, size, system)
+        key = (text, font_key, tuple(color), antialias)
+        surface: Optional[pygame.Surface] = self._surfaces.get(key)
+        if surface is not None:
+            self._hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self._misses += 1
+        surface = self.font(face, size, system).render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self._max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+
+# общий экземпляр для HUD и меню
+text_renderer: TextRenderer = TextRenderer(TEXT_CACHE_SIZE)
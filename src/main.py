@@ -2,10 +2,12 @@
 
 import sys
 import pygame
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, ASSET_DECODE_PROCESSES
 from game.state_manager import StateManager
 from src.game.entity_factory import EntityFactory
+from src.game.asset_manager import assets
 from src.game.game_session import GameSession
+from src.game.asset_manifest import startup_manifest
 from states.state_registry import register_states
 from entities.register_entities import register_entities
 
@@ -16,6 +18,10 @@ def main():
     pygame.display.set_caption(TITLE)
     clock = pygame.time.Clock()
 
+    # экраны и первый уровень декодируются сразу, параллельно на всех ядрах,
+    # в тех же размерах, в которых их потом запрашивают
+    assets.preload(startup_manifest(), ASSET_DECODE_PROCESSES)
+
     entity_factory = EntityFactory()
     register_entities(entity_factory)
     game_session = GameSession(entity_factory)
@@ -46,8 +52,10 @@ def main():
             if state_manager.quit:
                 running = False
             state_manager.current_state.render(screen)
-
-        pygame.display.flip()
+            # состояние само решает, как вывести кадр (flip или dirty-rect)
+            state_manager.current_state.present()
+        else:
+            pygame.display.flip()
 
 
     # Clean up
@@ -45,6 +45,30 @@ if TYPE_CHECKING:
     ZOMBIE_DOG_1_HEIGHT: int
     LEVEL_PATHS: List[str]
     TITLE: str
+    AI_DECISION_BUDGET: int
+    AI_NEAR_DISTANCE: int
+    AI_FAR_DISTANCE: int
+    AI_FAR_INTERVAL: int
+    FLOW_FIELD_CELL_SIZE: int
+    NAV_CELL_SIZE: int
+    NAV_PATH_CACHE_SIZE: int
+    NAV_PATH_BUDGET: int
+    SPRITE_ROTATION_STEP: int
+    SPRITE_CACHE_MAX_MB: int
+    SPRITE_DISK_CACHE_DIR: str
+    LOADING_SLICE_MS: int
+    ASSET_DECODE_PROCESSES: int
+    ASSET_SOURCE_CACHE_MB: int
+    TEXT_CACHE_SIZE: int
+    DIRTY_RECT_RENDERING: bool
+    DIRTY_RECT_MAX_FRACTION: float
+    WORLD_WIDTH: int
+    WORLD_HEIGHT: int
+    CAMERA_CULL_MARGIN: int
+    HEALTH_BAR_BUCKETS: int
+    HEALTH_BAR_HIDE_FULL: bool
+    CORPSE_BAKE_DELAY: float
+    CORPSE_MAX_LIVE: int
 
 
 # Path to the settings file
@@ -20,3 +20,7 @@ class BaseState:
 
     def render(self, surface):
         pass
+
+    def present(self):
+        """Вывести нарисованный кадр на экран."""
+        pygame.display.flip()
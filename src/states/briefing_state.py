@@ -1,26 +1,38 @@
 import pygame
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+from src.game.asset_manager import assets
+from src.game.text_renderer import text_renderer
 from src.states.base_state import BaseState
 from src.settings import BRIEFING_BG_IMAGE, SCREEN_WIDTH, SCREEN_HEIGHT
 
 if TYPE_CHECKING:
     from src.game.state_manager import StateManager
     from src.game.game_session import GameSession
+    from src.game.level_loader import LevelLoader
 
 class BriefingState(BaseState):
-    def __init__(self, manager: 'StateManager', message: str) -> None:
+    # цвет недоступной опции и размеры полосы загрузки
+    _DISABLED_COLOR: tuple[int, int, int] = (120, 120, 120)
+    _BAR_WIDTH: int = 400
+    _BAR_HEIGHT: int = 16
+
+    def __init__(self, manager: 'StateManager', message: str,
+                 loader: Optional['LevelLoader'] = None) -> None:
         super().__init__(manager)
         # Текст брифинга перед уровнем
         self._message: str = message
+        # Фоновая загрузка уровня; без неё уровень уже загружен
+        self._loader: Optional['LevelLoader'] = loader
         # Загрузка и масштабирование фона
-        bg: pygame.Surface = pygame.image.load(BRIEFING_BG_IMAGE).convert()
-        self._background: pygame.Surface = pygame.transform.scale(bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._background: pygame.Surface = assets.image(
+            BRIEFING_BG_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False
+        )
         # Опции меню
         self._options: list[str] = ["Продолжить", "Назад"]
         self._selected_index: int = 0
         # Шрифт для текста
-        self._font: pygame.font.Font = pygame.font.Font(None, 36)
+        self._font_size: int = 36
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -31,13 +43,19 @@ class BriefingState(BaseState):
             elif event.key == pygame.K_RETURN:
                 choice: str = self._options[self._selected_index]
                 if choice == "Продолжить":
+                    if not self._is_loaded():
+                        return  # уровень ещё загружается
                     self.manager.change_state("play", game_session=self.manager.game_session)
                 else:
                     self.manager.change_state("menu")
 
     def update(self, dt: float) -> None:
-        # Логика не требуется для статичного экрана брифинга
-        pass
+        # Досборка уровня небольшими порциями на главном потоке
+        if self._loader is not None:
+            self._loader.update()
+
+    def _is_loaded(self) -> bool:
+        return self._loader is None or self._loader.is_done
 
     def render(self, surface: pygame.Surface) -> None:
         # Отрисовка фона
@@ -46,13 +64,24 @@ class BriefingState(BaseState):
         # Отрисовка текста брифинга по центру сверху
         lines: list[str] = self._message.split("\n")
         for i, line in enumerate(lines):
-            text_surf: pygame.Surface = self._font.render(line, True, (255, 255, 255))
+            text_surf: pygame.Surface = text_renderer.render(line, (255, 255, 255), self._font_size)
             rect: pygame.Rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, 100 + i * 40))
             surface.blit(text_surf, rect)
 
         # Отрисовка опций меню по центру экрана
         for i, option in enumerate(self._options):
             color: tuple[int, int, int] = (255, 255, 0) if i == self._selected_index else (255, 255, 255)
-            text_surf: pygame.Surface = self._font.render(option, True, color)
+            if option == "Продолжить" and not self._is_loaded():
+                color = self._DISABLED_COLOR
+            text_surf: pygame.Surface = text_renderer.render(option, color, self._font_size)
             rect: pygame.Rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + i * 50))
             surface.blit(text_surf, rect)
+
+        # Полоса прогресса загрузки уровня
+        if self._loader is not None and not self._loader.is_done:
+            bar: pygame.Rect = pygame.Rect(0, 0, self._BAR_WIDTH, self._BAR_HEIGHT)
+            bar.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + len(self._options) * 50 + 20)
+            pygame.draw.rect(surface, (255, 255, 255), bar, width=1)
+            filled: pygame.Rect = bar.inflate(-4, -4)
+            filled.width = int(filled.width * self._loader.progress)
+            pygame.draw.rect(surface, (255, 255, 0), filled)
@@ -2,6 +2,8 @@ import pygame
 
 from src.game.state_manager import StateManager
 from src.settings import MENU_BG_IMAGE, SCREEN_WIDTH, SCREEN_HEIGHT
+from src.game.asset_manager import assets
+from src.game.text_renderer import text_renderer
 from src.states.base_state import BaseState
 
 
@@ -15,12 +17,9 @@ class LoseState(BaseState):
         super().__init__(manager)
         self.__message: str = message
         self.__selected: int = 0
-        self.__font: pygame.font.Font = pygame.font.SysFont(None, 58)
-        bg = pygame.image.load(MENU_BG_IMAGE)
-        # Подгоняем размер под экран
-        self.__background: pygame.Surface = pygame.transform.scale(
-            bg.convert_alpha(), (SCREEN_WIDTH, SCREEN_HEIGHT)
-        )
+        self.__font_size: int = 58
+        # Подгоняем размер под экран (общая копия из кэша ресурсов)
+        self.__background: pygame.Surface = assets.image(MENU_BG_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT))
 
     def change_selected(self, delta: int) -> None:
         self.__selected = (self.__selected + delta) % len(self.OPTIONS)
@@ -49,7 +48,7 @@ class LoseState(BaseState):
         """Отрисовать фон, сообщение и пункты меню по центру экрана."""
         surface.blit(self.__background, (0, 0))
         # Сообщение о поражении
-        msg_label = self.__font.render(self.__message, True, (255, 0, 0))
+        msg_label = text_renderer.render(self.__message, (255, 0, 0), self.__font_size, system=True)
         x_msg = surface.get_width() // 2 - msg_label.get_width() // 2
         y_msg = surface.get_height() // 3 - msg_label.get_height() // 2
         surface.blit(msg_label, (x_msg, y_msg))
@@ -57,7 +56,7 @@ class LoseState(BaseState):
         # Пункты меню
         for i, text in enumerate(self.OPTIONS):
             color = (255, 255, 0) if i == self.__selected else (200, 200, 200)
-            label = self.__font.render(text, True, color)
+            label = text_renderer.render(text, color, self.__font_size, system=True)
             x = surface.get_width() // 2 - label.get_width() // 2
             y = surface.get_height() // 2 + i * 60
             surface.blit(label, (x, y))
\ No newline at end of file
@@ -1,6 +1,7 @@
-import pygame
-
 from src.game.input_handler import MainMenuStateInputHandler
+from src.game.level import Level
+from src.game.asset_manager import assets
+from src.game.text_renderer import text_renderer
 from src.states.base_state import BaseState
 from src.game.state_manager import StateManager
 
@@ -13,10 +14,9 @@ class MainMenuState(BaseState):
     def __init__(self, manager: StateManager):
         super().__init__(manager)
         self.__selected = 0
-        self.__font = pygame.font.SysFont(None, 58)
-        bg = pygame.image.load(MENU_BG_IMAGE)
-        # Подгоняем размер под экран
-        self.__background = pygame.transform.scale(bg.convert_alpha(), (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.__font_size: int = 58
+        # Подгоняем размер под экран (общая копия из кэша ресурсов)
+        self.__background = assets.image(MENU_BG_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT))
 
     def change_selected(self, delta):
         self.__selected = (self.__selected + delta) % len(self.OPTIONS)
@@ -24,9 +24,10 @@ class MainMenuState(BaseState):
     def get_selected(self):
         choice = self.OPTIONS[self.__selected]
         if choice == "Новая игра":
-            self.manager.game_session.start_level(1)
-            message = self.manager.game_session.current_level.briefing_message
-            self.manager.change_state("briefing", message=message)  # или конкретный PlayState
+            # уровень грузится в фоне, пока показывается брифинг
+            loader = self.manager.game_session.begin_level(1)
+            _, message, _ = Level.describe(1)
+            self.manager.change_state("briefing", message=message, loader=loader)  # или конкретный PlayState
         elif choice == "Загрузить игру":
             self.manager.change_state("load")  # State для загрузки
         else:
@@ -42,7 +43,7 @@ class MainMenuState(BaseState):
         surface.blit(self.__background, (0, 0))
         for i, text in enumerate(self.OPTIONS):
             color = (255,255,0) if i == self.__selected else (200, 200, 200)
-            label = self.__font.render(text, True, color)
+            label = text_renderer.render(text, color, self.__font_size, system=True)
             x = surface.get_width() // 2 - label.get_width() // 2
             y = surface.get_height() // 2 + i * 60
             surface.blit(label, (x, y))
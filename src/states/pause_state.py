@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
 import pygame
 
+from src.game.asset_manager import assets
+from src.game.text_renderer import text_renderer
 from src.states.base_state import BaseState
 from src.settings import MENU_BG_IMAGE, SCREEN_WIDTH, SCREEN_HEIGHT
 from src.game.input_handler import PauseStateInputHandler
@@ -15,13 +17,9 @@ class PauseState(BaseState):
     def __init__(self, manager: 'StateManager') -> None:
         super().__init__(manager)
         self.__selected: int = 0
-        self.__font: pygame.font.Font = pygame.font.SysFont(None, 58)
-        bg = pygame.image.load(MENU_BG_IMAGE)
-        # Подгоняем размер под экран
-        self.__background: pygame.Surface = pygame.transform.scale(
-            bg.convert_alpha(),
-            (SCREEN_WIDTH, SCREEN_HEIGHT)
-        )
+        self.__font_size: int = 58
+        # Подгоняем размер под экран (общая копия из кэша ресурсов)
+        self.__background: pygame.Surface = assets.image(MENU_BG_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT))
 
     def change_selected(self, delta: int) -> None:
         self.__selected = (self.__selected + delta) % len(self.OPTIONS)
@@ -48,7 +46,7 @@ class PauseState(BaseState):
         surface.blit(self.__background, (0, 0))
         for i, text in enumerate(self.OPTIONS):
             color = (255, 255, 0) if i == self.__selected else (200, 200, 200)
-            label = self.__font.render(text, True, color)
+            label = text_renderer.render(text, color, self.__font_size, system=True)
             x = surface.get_width() // 2 - label.get_width() // 2
             y = surface.get_height() // 2 + i * 60
             surface.blit(label, (x, y))
@@ -1,9 +1,13 @@
 from itertools import count
 
 import pygame
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
-from src.settings import CROSSHAIR_IMAGE, CROSSHAIR_SIZE
+from src.settings import (CROSSHAIR_IMAGE, CROSSHAIR_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT,
+                          DIRTY_RECT_RENDERING, DIRTY_RECT_MAX_FRACTION)
+from src.game.asset_manager import assets
+from src.game.dirty_renderer import DirtyRectRenderer
+from src.game.text_renderer import text_renderer
 from src.states.base_state import BaseState
 from src.game.input_handler import PlayStateInputHandler
 
@@ -17,8 +21,12 @@ class PlayState(BaseState):
         pygame.mouse.set_visible(False)
         self._game_session = game_session
         self._state_manager = state_manager
-        self.__crosshair: pygame.Surface = pygame.image.load(CROSSHAIR_IMAGE).convert_alpha()
-        self.__crosshair = pygame.transform.scale(self.__crosshair, (CROSSHAIR_SIZE, CROSSHAIR_SIZE))
+        self.__crosshair: pygame.Surface = assets.image(CROSSHAIR_IMAGE, (CROSSHAIR_SIZE, CROSSHAIR_SIZE))
+        # вывод только изменившихся областей экрана (необязательный режим)
+        self.__dirty: Optional[DirtyRectRenderer] = (
+            DirtyRectRenderer((SCREEN_WIDTH, SCREEN_HEIGHT), DIRTY_RECT_MAX_FRACTION)
+            if DIRTY_RECT_RENDERING else None
+        )
 
     @property
     def game_session(self) -> 'GameSession':
@@ -26,6 +34,8 @@ class PlayState(BaseState):
 
     def handle_event(self, event: Any) -> None:
         super().handle_event(event)
+        if self.__dirty is not None and event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.__dirty.invalidate()  # содержимое окна потеряно — нужен полный кадр
         PlayStateInputHandler.handle(event, self)
 
     def update(self, dt: float) -> None:
@@ -33,28 +43,37 @@ class PlayState(BaseState):
         if self._game_session.current_level.player_controller.player.health <= 0:
             self.manager.change_state("lose")
             return
-        self._game_session.current_level.player_controller.update(dt)
-        self._game_session.current_level.update(dt)
+        level = self._game_session.current_level
+        offset = level.camera.offset
+        level.player_controller.update(dt)
+        level.update(dt)
+        if level.camera.offset != offset:
+            # камера сдвинулась: кадр меняется целиком, а под неподвижным
+            # курсором теперь другая точка мира
+            if self.__dirty is not None:
+                self.__dirty.invalidate()
+            level.player_controller.update_aim(level.camera.screen_to_world(pygame.mouse.get_pos()))
         if self._game_session.current_level.is_completed:
             self.manager.change_state("win", message=self._game_session.current_level.level_complete_message)
             return
 
 
     def show_text(self, surface: 'pygame.Surface', text: str, font_size: int, x: int, y: int, color: tuple) -> None:
-        font = pygame.font.Font(None, font_size)
-        text_surf = font.render(text, True, color)
+        # строка рендерится заново, только если изменился её текст
+        text_surf = text_renderer.render(text, color, font_size)
         text_rect = text_surf.get_rect(topright=(x, y))
         surface.blit(text_surf, text_rect)
+        if self.__dirty is not None:
+            self.__dirty.mark(text_rect)
 
     def show_info(self, surface: 'pygame.Surface') -> None:
-        from src.settings import SCREEN_WIDTH
         player = self._game_session.current_level.player_controller.player
         weapon = player.equipped_weapon
         current_ammo = weapon.current_ammo if weapon else 0
         weapon_name = weapon.name if weapon else "Отсутствует"
         fire_mode = weapon.current_fire_mode if weapon else ""
         entity_manager = self._game_session.current_level.entity_manager
-        objects = len(entity_manager.all_entities)
+        objects = len(entity_manager.all_entities) + len(entity_manager.projectiles)
 
         # Отображение названия оружия и оставшихся патронов в верхнем правом углу
         weapon_text = f"Оружие: {weapon_name} "
@@ -72,9 +91,17 @@ class PlayState(BaseState):
 
     def render(self, surface: 'pygame.Surface') -> None:
         super().render(surface)
-        self._game_session.current_level.render(surface)
+        self._game_session.current_level.render(surface, self.__dirty)
         self.show_info(surface)
         mx, my = pygame.mouse.get_pos()
         rect = self.__crosshair.get_rect(center=(mx, my))
         surface.blit(self.__crosshair, rect.topleft)
+        if self.__dirty is not None:
+            self.__dirty.mark(rect)
+
+    def present(self) -> None:
+        if self.__dirty is not None:
+            self.__dirty.present()
+        else:
+            super().present()
 
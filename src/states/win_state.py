@@ -3,6 +3,8 @@ from typing import Any
 
 from src.game.state_manager import StateManager
 from src.settings import MENU_BG_IMAGE, SCREEN_WIDTH, SCREEN_HEIGHT
+from src.game.asset_manager import assets
+from src.game.text_renderer import text_renderer
 from src.states.base_state import BaseState
 
 class WinState(BaseState):
@@ -12,12 +14,9 @@ class WinState(BaseState):
     def __init__(self, manager: StateManager, message: str = "Уровень пройден!") -> None:
         super().__init__(manager)
         self.__message: str = message
-        self.__font: pygame.font.Font = pygame.font.SysFont(None, 72)
-        bg = pygame.image.load(MENU_BG_IMAGE)
-        # Подгоняем размер под экран
-        self.__background: pygame.Surface = pygame.transform.scale(
-            bg.convert_alpha(), (SCREEN_WIDTH, SCREEN_HEIGHT)
-        )
+        self.__font_size: int = 72
+        # Подгоняем размер под экран (общая копия из кэша ресурсов)
+        self.__background: pygame.Surface = assets.image(MENU_BG_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT))
 
     @property
     def message(self) -> str:
@@ -37,7 +36,7 @@ class WinState(BaseState):
     def render(self, surface: Any) -> None:
         """Отрисовать фон и сообщение о победе по центру экрана."""
         surface.blit(self.__background, (0, 0))
-        label = self.__font.render(self.__message, True, (0, 255, 0))
+        label = text_renderer.render(self.__message, (0, 255, 0), self.__font_size, system=True)
         x = surface.get_width() // 2 - label.get_width() // 2
         y = surface.get_height() // 2 - label.get_height() // 2
         surface.blit(label, (x, y))
@@ -0,0 +1,192 @@
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.entities.entity import Shape, RectangleShape, CircleShape
+
+
+def segment_shape_entry(
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        shape: Shape,
+) -> Optional[float]:
+    """
+    Возвращает параметр ``t`` ∈ [0, 1] точки, где отрезок start-end впервые
+    входит в ``shape``, либо ``None``, если пересечения нет.
+
+    Если start уже лежит внутри формы, возвращается 0.
+    Поддерживаются ``RectangleShape`` (Liang–Barsky) и ``CircleShape``
+    (квадратное уравнение луча и окружности).
+    """
+    sx, sy = start
+    ex, ey = end
+
+    if isinstance(shape, RectangleShape):
+        min_x, min_y, w, h = shape.get_bounding_box()
+        max_x: float = min_x + w
+        max_y: float = min_y + h
+
+        dx: float = ex - sx
+        dy: float = ey - sy
+        t_enter: float = 0.0
+        t_exit: float = 1.0
+
+        for p, q1, q2 in (
+                (-dx, sx - min_x, sx - max_x),
+                (dx, max_x - sx, min_x - sx),
+                (-dy, sy - min_y, sy - max_y),
+                (dy, max_y - sy, min_y - sy),
+        ):
+            if p == 0.0:
+                if q1 < 0.0:
+                    return None  # параллельно и вне прямоугольника
+                continue
+            t0: float = q1 / p
+            t1: float = q2 / p
+            t_enter = max(t_enter, min(t0, t1))
+            t_exit = min(t_exit, max(t0, t1))
+            if t_enter > t_exit:
+                return None
+        return t_enter
+
+    if isinstance(shape, CircleShape):
+        dx: float = ex - sx
+        dy: float = ey - sy
+        fx: float = sx - shape.center_x
+        fy: float = sy - shape.center_y
+
+        c: float = fx * fx + fy * fy - (shape.radius * shape.radius)
+        if c <= 0.0:
+            return 0.0  # начало отрезка внутри круга
+        a: float = dx * dx + dy * dy
+        if a == 0.0:
+            return None
+        b: float = 2 * (fx * dx + fy * dy)
+        discriminant: float = b * b - 4 * a * c
+        if discriminant < 0.0:
+            return None
+        t1: float = (-b - math.sqrt(discriminant)) / (2 * a)
+        # start снаружи, поэтому ближний корень и есть точка входа
+        return t1 if 0.0 <= t1 <= 1.0 else None
+
+    return None
+
+
+def segments_shapes_entry(start: np.ndarray, delta: np.ndarray, shapes: List[Shape]) -> np.ndarray:
+    """
+    Векторная версия ``segment_shape_entry`` для многих отрезков и форм сразу.
+
+    :param start: массив (n, 2) начал отрезков
+    :param delta: массив (n, 2) векторов отрезков (end - start)
+    :param shapes: список из m форм
+    :return: матрица (n, m) параметров входа; ``inf`` — пересечения нет
+    """
+    n: int = len(start)
+    result: np.ndarray = np.full((n, len(shapes)), np.inf)
+    circle_cols: List[int] = [i for i, sh in enumerate(shapes) if isinstance(sh, CircleShape)]
+    rect_cols: List[int] = [i for i, sh in enumerate(shapes) if isinstance(sh, RectangleShape)]
+    if circle_cols:
+        centers, radii = _circles_of([shapes[i] for i in circle_cols])
+        result[:, circle_cols] = _segments_circles_entry(
+            start[:, None, :], delta[:, None, :], centers[None, :, :], radii[None, :]
+        )
+    if rect_cols:
+        lo, hi = _boxes_of([shapes[i] for i in rect_cols])
+        result[:, rect_cols] = _segments_rects_entry(
+            start[:, None, :], delta[:, None, :], lo[None, :, :], hi[None, :, :]
+        )
+    return result
+
+
+def segment_pairs_entry(start: np.ndarray, delta: np.ndarray,
+                        shapes: List[Shape], index: np.ndarray) -> np.ndarray:
+    """
+    Попарная версия: отрезок ``i`` проверяется только с формой
+    ``shapes[index[i]]``. Нужна, когда у каждого отрезка свои кандидаты
+    из широкой фазы; параметры каждой формы собираются один раз.
+
+    :param start: массив (k, 2) начал отрезков
+    :param delta: массив (k, 2) векторов отрезков
+    :param shapes: список из m различных форм
+    :param index: массив (k,) номеров форм для отрезков
+    :return: массив (k,) параметров входа; ``inf`` — пересечения нет
+    """
+    result: np.ndarray = np.full(len(index), np.inf)
+    # номер формы -> её строка в массивах кругов / прямоугольников (-1 — другой тип)
+    circle_row: np.ndarray = np.full(len(shapes), -1)
+    rect_row: np.ndarray = np.full(len(shapes), -1)
+    circles: List[CircleShape] = []
+    rects: List[RectangleShape] = []
+    for i, sh in enumerate(shapes):
+        if isinstance(sh, CircleShape):
+            circle_row[i] = len(circles)
+            circles.append(sh)
+        elif isinstance(sh, RectangleShape):
+            rect_row[i] = len(rects)
+            rects.append(sh)
+    if circles:
+        centers, radii = _circles_of(circles)
+        rows: np.ndarray = circle_row[index]
+        mask: np.ndarray = rows >= 0
+        result[mask] = _segments_circles_entry(start[mask], delta[mask], centers[rows[mask]], radii[rows[mask]])
+    if rects:
+        lo, hi = _boxes_of(rects)
+        rows = rect_row[index]
+        mask = rows >= 0
+        result[mask] = _segments_rects_entry(start[mask], delta[mask], lo[rows[mask]], hi[rows[mask]])
+    return result
+
+
+def _circles_of(shapes: List[CircleShape]) -> Tuple[np.ndarray, np.ndarray]:
+    centers: np.ndarray = np.array([(sh.center_x, sh.center_y) for sh in shapes], dtype=np.float64)
+    radii: np.ndarray = np.array([sh.radius for sh in shapes], dtype=np.float64)
+    return centers, radii
+
+
+def _boxes_of(shapes: List[RectangleShape]) -> Tuple[np.ndarray, np.ndarray]:
+    boxes: np.ndarray = np.array([sh.get_bounding_box() for sh in shapes], dtype=np.float64)
+    return boxes[:, :2], boxes[:, :2] + boxes[:, 2:]
+
+
+def _segments_circles_entry(start: np.ndarray, delta: np.ndarray,
+                            centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """
+    Параметры входа отрезков в круги. Массивы транслируются друг с другом
+    (последняя ось — координаты), поэтому одна функция считает и матрицу
+    «отрезки × круги», и попарные проверки.
+    """
+    f: np.ndarray = start - centers
+    a: np.ndarray = np.sum(delta * delta, axis=-1)
+    b: np.ndarray = 2.0 * np.sum(f * delta, axis=-1)
+    c: np.ndarray = np.sum(f * f, axis=-1) - radii ** 2
+    discriminant: np.ndarray = b * b - 4.0 * a * c
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t1: np.ndarray = (-b - np.sqrt(np.maximum(discriminant, 0.0))) / (2.0 * a)
+    entering: np.ndarray = (a > 0.0) & (discriminant >= 0.0) & (t1 >= 0.0) & (t1 <= 1.0)
+    t: np.ndarray = np.where(entering, t1, np.inf)
+    # начало отрезка внутри круга — пересечение сразу
+    return np.where(c <= 0.0, 0.0, t)
+
+
+def _segments_rects_entry(start: np.ndarray, delta: np.ndarray,
+                          lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """Параметры входа отрезков в прямоугольники (метод плит); массивы транслируются."""
+    t_enter: np.ndarray = np.zeros(())
+    t_exit: np.ndarray = np.ones(())
+    for axis in (0, 1):
+        s: np.ndarray = start[..., axis]
+        d: np.ndarray = delta[..., axis]
+        low: np.ndarray = lo[..., axis]
+        high: np.ndarray = hi[..., axis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t0: np.ndarray = (low - s) / d
+            t1: np.ndarray = (high - s) / d
+        parallel: np.ndarray = np.broadcast_to(d == 0.0, t0.shape)
+        inside: np.ndarray = (s >= low) & (s <= high)
+        near: np.ndarray = np.where(parallel, np.where(inside, -np.inf, np.inf), np.minimum(t0, t1))
+        far: np.ndarray = np.where(parallel, np.where(inside, np.inf, -np.inf), np.maximum(t0, t1))
+        t_enter = np.maximum(t_enter, near)
+        t_exit = np.minimum(t_exit, far)
+    return np.where(t_enter <= t_exit, t_enter, np.inf)
@@ -0,0 +1,66 @@
+import gc
+import sys
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from src.entities.drone import Drone
+from src.entities.entity import CircleShape, RectangleShape
+from src.entities.map_entity import MapEntity
+from src.entities.modifier import Modifier
+from src.entities.npc import NPC, Attitude, DecisionModule, ZombieDecisionModule
+from src.entities.player import Player
+from src.entities.weapon import Weapon, FireMode
+from src.game.entity_factory import EntityFactory
+from src.game.entity_manager import EntityManager
+
+
+def _factories(manager: EntityManager) -> Dict[str, Callable[[int], object]]:
+    """Конструкторы сущностей с параметрами как на тестовом уровне (без картинок)."""
+    return {
+        'NPC': lambda i: NPC(manager, i, 100.0 + i, 600.0, 1000, 1000, 20, 20, 50, 3000,
+                             "zombie", Attitude.HOSTILE, ZombieDecisionModule(),
+                             shape=CircleShape(0.0, 0.0, 25)),
+        'Drone': lambda i: Drone(manager, i, 100.0 + i, 600.0, 300, 300, 80, 5, 5, 1000,
+                                 "drone", Attitude.FRIENDLY, DecisionModule(),
+                                 shape=CircleShape(0.0, 0.0, 15)),
+        'Player': lambda i: Player(manager, i, 1000.0, 300.0, 300, 300, 150, 10, 10, 300,
+                                   shape=CircleShape(0.0, 0.0, 25)),
+        'Weapon': lambda i: Weapon(manager, i, 1200.0, 300.0, "ak-47", "ak-47 rifle",
+                                   2000, 800, 150, 3, 500, 300, 30, None,
+                                   [FireMode.SINGLE, FireMode.AUTO], 10,
+                                   RectangleShape(0.0, 0.0, 40, 20)),
+        'MapEntity': lambda i: MapEntity(manager, i, 800.0, 700.0, 0.0, None,
+                                         RectangleShape(0.0, 0.0, 100, 60)),
+        'RectangleShape': lambda i: RectangleShape(0.0, 0.0, 10.0, 10.0),
+        'CircleShape': lambda i: CircleShape(0.0, 0.0, 10.0),
+        'Modifier': lambda i: Modifier(1.0, None),
+    }
+
+
+def measure(create: Callable[[int], object], count: int) -> float:
+    """Средний объём памяти (байт), выделенной на один объект из ``create``."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects: List[object] = [create(i) for i in range(count)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # сам список объектов к сущностям не относится
+    list_bytes: int = sys.getsizeof(objects)
+    del objects
+    return (after - before - list_bytes) / count
+
+
+def report(count: int = 10_000) -> List[Tuple[str, float]]:
+    """Байт на объект для каждого типа сущности при создании ``count`` штук."""
+    manager: EntityManager = EntityManager(EntityFactory())
+    return [(name, measure(create, count)) for name, create in _factories(manager).items()]
+
+
+if __name__ == "__main__":
+    # замер: python -m src.utils.memory_benchmark [число объектов]
+    total: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    for name, per_object in report(total):
+        print(f"{name:<16}{per_object:>10.0f} Б/объект{per_object * total / (1024 * 1024):>10.2f} МБ на {total}")